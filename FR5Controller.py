@@ -1,6 +1,7 @@
 import time
 import logging
 import math
+import contextlib
 from fairino import Robot
 from ctypes import sizeof
 
@@ -12,6 +13,7 @@ class FR5Controller():
         Input: str
         '''
         self.robot = Robot.RPC(ip_address)
+        self.tracer = None
         self.setup_debugger("info")
         self.setup_gripper()
 
@@ -38,6 +40,38 @@ class FR5Controller():
         stream_handler.setFormatter(formatter)
         self.logger.addHandler(stream_handler)
 
+    def setup_tracer(self, capacity = 100000):
+        '''
+        This function enable span tracing. Every operation, SDK call and wire round trip is recorded as a nested span.
+        
+        Input: int
+        '''
+        error = self.robot.StartSpanTrace(capacity)
+        self.run_error_analyze(error)
+        self.tracer = self.robot.span_tracer
+
+    def span(self, name : str, **args):
+        '''
+        This function return a span for the given operation. It does nothing when tracing is off.
+        
+        Input: str
+        Output: context manager
+        '''
+        if self.tracer is None:
+            return contextlib.nullcontext()
+
+        return self.tracer.span(name, **args)
+
+    def export_trace(self, file_path = "fr5_trace.json"):
+        '''
+        This function write recorded spans as Chrome trace JSON. Open it in chrome://tracing or ui.perfetto.dev.
+        
+        Input: str
+        '''
+        error = self.robot.ExportSpanTrace(file_path)
+        self.run_error_analyze(error)
+        self.logger.info("TraceExported " + file_path)
+
     def setup_gripper(self):
         '''
         This function initialize gripper setup
@@ -86,16 +120,19 @@ class FR5Controller():
         
         Input: int, int, int
         '''
-        current_position = self.get_gripper_position()
-
-        while target_gripper_position is not current_position:
-            error = self.robot.MoveGripper(index = 1, pos = target_gripper_position, vel = target_gripper_speed, force = target_gripper_power, maxtime = 30000,
-                              block = 0, type = 0, rotNum = 0, rotVel = 0, rotTorque = 0)
-            self.run_error_analyze(error)
-            time.sleep(1)
+        with self.span("run_gripper_movement", position = target_gripper_position):
             current_position = self.get_gripper_position()
+            position_reached = Robot.RobotStateEvent.equals("gripper_position", target_gripper_position)
+
+            while target_gripper_position != current_position:
+                error = self.robot.MoveGripper(index = 1, pos = target_gripper_position, vel = target_gripper_speed, force = target_gripper_power, maxtime = 30000,
+                                  block = 0, type = 0, rotNum = 0, rotVel = 0, rotTorque = 0)
+                self.run_error_analyze(error)
+                # Wake on the first state packet at the target, resend the command after 1 s otherwise
+                self.robot.WaitRobotState(position_reached, timeout = 1)
+                current_position = self.get_gripper_position()
 
-        self.logger.info("GripperPositionReached")
+            self.logger.info("GripperPositionReached")
         
     def get_gripper_position(self):
         '''
@@ -115,16 +152,17 @@ class FR5Controller():
         
         Input: list, int, int, int, int
         '''
-        # 0-joint, 1-eef
-        self.robot.SingularAvoidStart(0)
+        with self.span("run_joint_movement"):
+            # 0-joint, 1-eef
+            self.robot.SingularAvoidStart(0)
 
-        error = self.robot.MoveJ(joint_pos=target_joint_list, tool = 1, user = 0, vel = target_joint_speed)
-        self.run_error_analyze(error)
-        self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
+            error = self.robot.MoveJ(joint_pos=target_joint_list, tool = 1, user = 0, vel = target_joint_speed)
+            self.run_error_analyze(error)
+            self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
 
-        self.robot.SingularAvoidEnd()
+            self.robot.SingularAvoidEnd()
         
-        self.logger.info("JointPositionReached")
+            self.logger.info("JointPositionReached")
 
     def get_joint_position(self):
         '''
@@ -144,16 +182,17 @@ class FR5Controller():
         
         Input: list, int, int, int, int
         '''
-        # 0-joint, 1-eef
-        self.robot.SingularAvoidStart(1)
+        with self.span("run_eef_movement_ptp"):
+            # 0-joint, 1-eef
+            self.robot.SingularAvoidStart(1)
         
-        error = self.robot.MoveCart(desc_pos=target_eef_list, tool = 1, user = 0, vel = target_eef_speed)
-        self.run_error_analyze(error)
-        self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
+            error = self.robot.MoveCart(desc_pos=target_eef_list, tool = 1, user = 0, vel = target_eef_speed)
+            self.run_error_analyze(error)
+            self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
 
-        self.robot.SingularAvoidEnd()
+            self.robot.SingularAvoidEnd()
         
-        self.logger.info("EEF_PTP_PositionReached")
+            self.logger.info("EEF_PTP_PositionReached")
     
     def get_eef_position(self):
         '''
@@ -173,17 +212,18 @@ class FR5Controller():
         
         Input: list, int, int, int, int
         '''
-        # 0-joint, 1-eef
-        self.robot.SingularAvoidStart(1)
+        with self.span("run_eef_movement_linear"):
+            # 0-joint, 1-eef
+            self.robot.SingularAvoidStart(1)
         
-        error = self.robot.MoveL(desc_pos=target_eef_list, tool = 0, user = 0, vel = target_eef_speed, joint_pos = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], acc = 0.0, ovl = 100.0, blendR = -1.0, \
-                                exaxis_pos = [0.0, 0.0, 0.0, 0.0], search = 0, offset_flag = 0, offset_pos = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], overSpeedStrategy = 0, speedPercent = 10 )
-        self.run_error_analyze(error)
-        self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
+            error = self.robot.MoveL(desc_pos=target_eef_list, tool = 0, user = 0, vel = target_eef_speed, joint_pos = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], acc = 0.0, ovl = 100.0, blendR = -1.0, \
+                                    exaxis_pos = [0.0, 0.0, 0.0, 0.0], search = 0, offset_flag = 0, offset_pos = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], overSpeedStrategy = 0, speedPercent = 10 )
+            self.run_error_analyze(error)
+            self.run_gripper_movement(target_gripper_position, target_gripper_speed, target_gripper_power)
 
-        self.robot.SingularAvoidEnd()
+            self.robot.SingularAvoidEnd()
         
-        self.logger.info("EEF_Linear_PositionReached")
+            self.logger.info("EEF_Linear_PositionReached")
 
 def main():
     fc = FR5Controller("192.168.58.2")
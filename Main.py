@@ -30,12 +30,16 @@ def main():
     # fc.run_eef_movement_ptp(example_eef_6, 100, target_eef_speed = movement_speed)
     # time.sleep(3)
     
+    # Record operation -> SDK call -> wire round trip spans, open fr5_trace.json in chrome://tracing or ui.perfetto.dev
+    fc.setup_tracer()
+
     for i in range(100):
-        fc.run_eef_movement_ptp(example_eef_1, 100, target_eef_speed = movement_speed)
-        fc.run_eef_movement_ptp(example_eef_2, 0, target_eef_speed = movement_speed)
-        fc.run_eef_movement_ptp(example_eef_3, 100, target_eef_speed = movement_speed)
-        fc.run_eef_movement_ptp(example_eef_4, 0, target_eef_speed = movement_speed)
-        fc.run_eef_movement_ptp(example_eef_1, 100, target_eef_speed = movement_speed)
+        with fc.span("cycle", iteration = i):
+            fc.run_eef_movement_ptp(example_eef_1, 100, target_eef_speed = movement_speed)
+            fc.run_eef_movement_ptp(example_eef_2, 0, target_eef_speed = movement_speed)
+            fc.run_eef_movement_ptp(example_eef_3, 100, target_eef_speed = movement_speed)
+            fc.run_eef_movement_ptp(example_eef_4, 0, target_eef_speed = movement_speed)
+            fc.run_eef_movement_ptp(example_eef_1, 100, target_eef_speed = movement_speed)
 
         # fc.run_joint_movement(example_joint_1, 100, target_joint_speed = movement_speed)
         # print(fc.get_joint_position())
@@ -45,6 +49,7 @@ def main():
         # fc.run_gripper_movement(100)
         # fc.run_gripper_movement(0)
     
+    fc.export_trace("fr5_trace.json")
     fc.robot.CloseRPC()
 
 if __name__ == "__main__":
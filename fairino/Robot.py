@@ -1,19 +1,38 @@
 import xmlrpc.client
+import http.client
+import urllib.parse
+import re
+import errno
 import os
 import socket
 import hashlib
 import time
+import math
+import random
+import itertools
+import json
 from datetime import datetime
 import logging
+import inspect
 from functools import wraps
+from collections import namedtuple, deque
 from logging.handlers import RotatingFileHandler
 from queue import Queue
 import threading
+import asyncio
+from multiprocessing import shared_memory
 import struct
+import zlib
+import bisect
 import sys
 import ctypes
 from ctypes import *
 
+try:
+    import numpy as np  # 可选依赖，用于加速校验和计算等
+except ImportError:
+    np = None
+
 # from Cython.Compiler.Options import error_on_unknown_names
 
 is_init =False
@@ -144,6 +163,1166 @@ class RobotStatePkg(Structure):
         ("check_sum", ctypes.c_uint16)]  # 校验和
 
 
+"""   
+@brief  对数分桶直方图(HDR风格)，每个2的幂区间再均分为16个子桶，相对误差约3%
+@note   记录值为非负整数(通常为微秒)，record 只做一次下标计算与计数累加
+"""
+class RobotHistogram():
+    SUB_BITS = 5
+    SUB_HALF = 1 << (SUB_BITS - 1)
+    MAX_BITS = 40
+
+    def __init__(self):
+        self.counts = [0] * ((self.MAX_BITS + 1) * self.SUB_HALF)
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @classmethod
+    def bucket_index(cls, value):
+        if value < (1 << cls.SUB_BITS):
+            return value
+        exponent = value.bit_length() - cls.SUB_BITS
+        return exponent * cls.SUB_HALF + (value >> exponent)
+
+    @classmethod
+    def bucket_value(cls, index):
+        """桶的下界"""
+        if index < (1 << cls.SUB_BITS):
+            return index
+        exponent = index // cls.SUB_HALF - 1
+        return (index - exponent * cls.SUB_HALF) << exponent
+
+    def record(self, value):
+        if value < 0:
+            value = 0
+        index = self.bucket_index(value)
+        if index >= len(self.counts):
+            index = len(self.counts) - 1
+        self.counts[index] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other):
+        """累加另一个直方图"""
+        for i, num in enumerate(other.counts):
+            if num:
+                self.counts[i] += num
+        if other.count:
+            if self.count == 0 or other.min < self.min:
+                self.min = other.min
+            if other.max > self.max:
+                self.max = other.max
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percent):
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(self.count * percent / 100.0)))
+        num = 0
+        for i, bucket_num in enumerate(self.counts):
+            num += bucket_num
+            if num >= target:
+                return min(max(self.bucket_value(i), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """返回 count/min/mean/p50/p90/p99/p999/max"""
+        return {"count": self.count,
+                "min": self.min,
+                "mean": self.total / self.count if self.count else 0,
+                "p50": self.percentile(50),
+                "p90": self.percentile(90),
+                "p99": self.percentile(99),
+                "p999": self.percentile(99.9),
+                "max": self.max}
+
+
+"""   
+@brief  20004 状态通道统计：丢帧、校验失败、重新同步、到达间隔抖动及控制器到主机的延迟
+@note   丢帧由帧计数 frame_cnt(0~255循环)的不连续推算；延迟为主机接收时间减去数据包内
+        year…millisecond 时间戳(按主机本地时区解释)，依赖控制器与主机的时钟同步，时钟超前的帧计入 clock_ahead_num
+"""
+class RobotStateStats():
+    TIME_STRUCT = struct.Struct("<H5BH")
+    TIME_OFFSET = RobotStatePkg.year.offset
+    TIME_END = RobotStatePkg.millisecond.offset + RobotStatePkg.millisecond.size
+
+    def __init__(self):
+        self.interval_hist = RobotHistogram()  # 到达间隔(us)
+        self.latency_hist = RobotHistogram()  # 控制器到主机延迟(us)
+        self.hour_key = None
+        self.hour_base = 0.0
+        self.reset()
+
+    def reset(self):
+        self.frame_num = 0
+        self.lost_frame_num = 0
+        self.gap_num = 0
+        self.checksum_error_num = 0
+        self.resync_num = 0
+        self.skipped_bytes = 0
+        self.reconnect_num = 0
+        self.clock_ahead_num = 0
+        self.last_frame_cnt = None
+        self.last_recv_time = None
+        self.interval_hist.reset()
+        self.latency_hist.reset()
+
+    def restart(self):
+        """重连后调用，不把断线期间的帧计数跳变计为丢帧"""
+        self.reconnect_num += 1
+        self.last_frame_cnt = None
+        self.last_recv_time = None
+
+    def record_frame(self, buf, head, frame_len, recv_time):
+        """解析器每校验通过一帧调用一次"""
+        self.frame_num += 1
+        frame_cnt = buf[head + 2]
+        if self.last_frame_cnt is not None:
+            lost = (frame_cnt - self.last_frame_cnt - 1) & 0xFF
+            if lost:
+                self.lost_frame_num += lost
+                self.gap_num += 1
+        self.last_frame_cnt = frame_cnt
+        if self.last_recv_time is not None:
+            self.interval_hist.record(int((recv_time - self.last_recv_time) * 1e6))
+        self.last_recv_time = recv_time
+
+        if frame_len < self.TIME_END:
+            return
+        year, month, day, hour, minute, second, millisecond = self.TIME_STRUCT.unpack_from(buf, head + self.TIME_OFFSET)
+        key = (year, month, day, hour)
+        if key != self.hour_key:
+            try:
+                self.hour_base = time.mktime((year, month, day, hour, 0, 0, 0, 0, -1))
+            except (OverflowError, ValueError):
+                return
+            self.hour_key = key
+        latency = recv_time - (self.hour_base + minute * 60 + second + millisecond / 1000.0)
+        if latency < 0:
+            self.clock_ahead_num += 1
+        self.latency_hist.record(int(latency * 1e6))
+
+    def summary(self):
+        return {"frame_num": self.frame_num,
+                "lost_frame_num": self.lost_frame_num,
+                "gap_num": self.gap_num,
+                "checksum_error_num": self.checksum_error_num,
+                "resync_num": self.resync_num,
+                "skipped_bytes": self.skipped_bytes,
+                "reconnect_num": self.reconnect_num,
+                "clock_ahead_num": self.clock_ahead_num,
+                "interval_us": self.interval_hist.summary(),
+                "latency_us": self.latency_hist.summary()}
+
+
+"""   
+@brief  机器人状态字段投影，只解码调用方声明的字段
+@note   由 ctypes 布局预先计算各字段偏移，拼成一个跳过无关字节的 struct 格式，一次 unpack_from 直接从接收缓冲区取值，
+        结果为只含所需字段的 __slots__ 对象；数组字段为 tuple，嵌套结构体字段为对应的 ctypes 结构体；
+        frame_cnt 总是被解码，快照与帧连续性统计依赖它
+"""
+class RobotStateProjection():
+    def __init__(self, fields):
+        fields = tuple(fields)
+        self.fields = fields if "frame_cnt" in fields else ("frame_cnt",) + fields
+        field_types = dict(RobotStatePkg._fields_)
+        items = []
+        for name in self.fields:
+            if name not in field_types:
+                raise ValueError("RobotStatePkg 没有字段 %s" % name)
+            field = getattr(RobotStatePkg, name)
+            items.append((field.offset, field.size, name, field_types[name]))
+        items.sort(key=lambda item: item[0])
+
+        fmt = "<"
+        pos = 0
+        index = 0
+        self.layout = []  # (字段名, 值起始下标, 值个数, 转换类型)
+        for offset, size, name, field_type in items:
+            if offset > pos:
+                fmt += "%dx" % (offset - pos)
+            if issubclass(field_type, Array) and isinstance(field_type._type_._type_, str):
+                fmt += "%d%s" % (field_type._length_, field_type._type_._type_)
+                self.layout.append((name, index, field_type._length_, None))
+                index += field_type._length_
+            elif issubclass(field_type, (Structure, Array)):
+                fmt += "%ds" % size
+                self.layout.append((name, index, 1, field_type))
+                index += 1
+            else:
+                fmt += field_type._type_
+                self.layout.append((name, index, 0, None))
+                index += 1
+            pos = offset + size
+        self.struct = struct.Struct(fmt)
+        self.size = pos  # 解码所需的最短帧长
+        self.cls = type("RobotStateProjected", (), {"__slots__": self.fields, "__repr__": RobotStateProjection.projected_repr})
+
+    @staticmethod
+    def projected_repr(obj):
+        return "RobotStateProjected(%s)" % ", ".join("%s=%r" % (name, getattr(obj, name)) for name in obj.__slots__)
+
+    def decode(self, buf, offset=0):
+        """从 buf 的 offset 处(帧头位置)解码所需字段"""
+        values = self.struct.unpack_from(buf, offset)
+        obj = self.cls.__new__(self.cls)
+        for name, index, count, field_type in self.layout:
+            if count == 0:
+                setattr(obj, name, values[index])
+            elif field_type is None:
+                setattr(obj, name, values[index:index + count])
+            else:
+                setattr(obj, name, field_type.from_buffer_copy(values[index]))
+        return obj
+
+
+"""   
+@brief  机器人实时状态帧解析器(20004端口)
+@note   帧格式：帧头0x5A5A(2) + 帧计数(1) + 数据长度data_len(2) + 数据(data_len) + 校验和(2)
+        通过 bytes.find 在 memoryview 上查找帧头，按 data_len 整帧切分，一次性计算校验和，
+        每个状态包只做一次整块拷贝后以 from_buffer 构造 RobotStatePkg，不再逐字节处理
+"""
+class RobotStateParser():
+    FRAME_HEAD = b'\x5a\x5a'
+    HEAD_LEN = 5  # 帧头 + 帧计数 + 数据长度
+    CHECKSUM_LEN = 2
+    PKG_SIZE = sizeof(RobotStatePkg)
+    MAX_DATA_LEN = PKG_SIZE * 4  # 超过该长度视为伪帧头，直接重新同步
+
+    def __init__(self, projection=None, stats=None):
+        self.buffer = bytearray()  # 未解析完的剩余数据
+        self.projection = projection  # RobotStateProjection，设置后只解码投影字段
+        self.stats = stats  # RobotStateStats，设置后统计丢帧、校验失败、延迟等
+        self.raw_frames = None  # 设置为列表时，feed 同时追加每个校验通过的原始数据帧(bytes)，供录制使用
+        self.frame_num = 0  # 校验通过的帧数
+        self.checksum_error_num = 0  # 校验失败的帧数
+
+    def reset(self):
+        """清空未解析数据，重连后调用"""
+        del self.buffer[:]
+        if self.stats is not None:
+            self.stats.restart()
+
+    @staticmethod
+    def checksum(view):
+        """计算数据的16位累加和"""
+        if np is not None:
+            return int(np.frombuffer(view, dtype=np.uint8).sum()) & 0xFFFF
+        return sum(view) & 0xFFFF
+
+    def feed(self, data, recv_time=0.0):
+        """追加接收到的数据，返回其中所有校验通过的 RobotStatePkg 列表(设置投影时为投影对象列表)"""
+        buf = self.buffer
+        buf += data
+        end = len(buf)
+        pos = 0
+        pkgs = []
+        stats = self.stats
+        view = memoryview(buf)
+        try:
+            while True:
+                head = buf.find(self.FRAME_HEAD, pos)
+                if head < 0:
+                    # 末尾单个0x5A可能是下一帧帧头的前半部分
+                    new_pos = end - 1 if end > 0 and buf[end - 1] == 0x5A else end
+                    if stats is not None and new_pos > pos:
+                        stats.skipped_bytes += new_pos - pos
+                    pos = new_pos
+                    break
+                if stats is not None and head > pos:
+                    stats.resync_num += 1
+                    stats.skipped_bytes += head - pos
+                if head + self.HEAD_LEN > end:
+                    pos = head
+                    break
+                data_len = buf[head + 3] | (buf[head + 4] << 8)
+                if data_len > self.MAX_DATA_LEN:
+                    pos = head + 1
+                    continue
+                body_end = head + self.HEAD_LEN + data_len
+                frame_end = body_end + self.CHECKSUM_LEN
+                if frame_end > end:
+                    pos = head
+                    break
+                checkdata = buf[body_end] | (buf[body_end + 1] << 8)
+                if self.checksum(view[head:body_end]) != checkdata:
+                    # 校验失败，从下一个字节重新查找帧头
+                    self.checksum_error_num += 1
+                    if stats is not None:
+                        stats.checksum_error_num += 1
+                    pos = head + 1
+                    continue
+                if stats is not None:
+                    stats.record_frame(buf, head, frame_end - head, recv_time)
+                if self.raw_frames is not None:
+                    self.raw_frames.append(bytes(view[head:frame_end]))
+                projection = self.projection
+                if projection is not None and frame_end - head >= projection.size:
+                    pkgs.append(projection.decode(buf, head))
+                else:
+                    frame = bytearray(self.PKG_SIZE)
+                    copy_len = min(frame_end - head, self.PKG_SIZE)
+                    frame[:copy_len] = view[head:head + copy_len]
+                    if projection is not None:
+                        pkgs.append(projection.decode(frame))
+                    else:
+                        pkgs.append(RobotStatePkg.from_buffer(frame))
+                self.frame_num += 1
+                pos = frame_end
+        finally:
+            view.release()
+        if pos:
+            del buf[:pos]
+        return pkgs
+
+
+"""   
+@brief  机器人状态快照
+@note   pkg 为一帧完整的 RobotStatePkg，发布后解析线程不再修改它；frame_cnt 为控制器帧计数(0~255循环)，
+        recv_time 为主机接收时间戳 time.time()，seq 为主机侧单调递增的发布序号
+"""
+RobotStateSnapshot = namedtuple("RobotStateSnapshot", ["pkg", "frame_cnt", "recv_time", "seq"])
+
+
+def ctypes_to_dtype(ctype):
+    """由 ctypes 类型(结构体、数组、基本类型)的 _fields_ 推导对应的 numpy dtype，保留 _pack_ 后的偏移"""
+    if issubclass(ctype, Structure):
+        names = []
+        formats = []
+        offsets = []
+        for name, field_type in ctype._fields_:
+            names.append(name)
+            formats.append(ctypes_to_dtype(field_type))
+            offsets.append(getattr(ctype, name).offset)
+        return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": sizeof(ctype)})
+    if issubclass(ctype, Array):
+        return np.dtype((ctypes_to_dtype(ctype._type_), (ctype._length_,)))
+    return np.dtype(ctype._type_)
+
+
+"""   
+@brief  机器人状态历史环形缓存(需要 numpy)
+@note   每条记录为 RobotStatePkg 的全部字段加上主机接收时间 recv_time 与发布序号 seq，
+        采用镜像双倍存储，任意不超过 capacity-1 条的最近记录都是一段连续内存，查询结果默认为零拷贝切片；
+        切片是环形缓存的视图，会在解析线程写入新帧时原地改变：m 条记录的切片在其后再写入 capacity-m 帧之内保持不变，
+        此后从最旧的记录起被新数据覆盖，再写入 capacity 帧后全部被覆盖；需要在此之后继续使用时传入 copy=True 得到独立副本
+"""
+class RobotStateHistory():
+    def __init__(self, capacity=1000):
+        if np is None:
+            raise ImportError("RobotStateHistory 需要安装 numpy")
+        self.capacity = int(capacity)
+        if self.capacity < 2:
+            raise ValueError("capacity 至少为 2")
+        pkg_dtype = ctypes_to_dtype(RobotStatePkg)
+        pkg_size = pkg_dtype.itemsize
+        self.dtype = np.dtype({
+            "names": list(pkg_dtype.names) + ["recv_time", "seq"],
+            "formats": [pkg_dtype.fields[name][0] for name in pkg_dtype.names] + [np.float64, np.int64],
+            "offsets": [pkg_dtype.fields[name][1] for name in pkg_dtype.names] + [pkg_size, pkg_size + 8],
+            "itemsize": pkg_size + 16})
+        self.pkg_size = pkg_size
+        self.data = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self.raw = self.data.view(np.uint8).reshape(2 * self.capacity, self.dtype.itemsize)
+        self.count = 0  # 累计写入条数
+
+    def append(self, pkg, recv_time, seq):
+        """写入一帧状态包，由解析线程调用"""
+        row = np.frombuffer(pkg, dtype=np.uint8)
+        tail = np.frombuffer(struct.pack("<dq", recv_time, seq), dtype=np.uint8)
+        index = self.count % self.capacity
+        self.raw[index, :self.pkg_size] = row
+        self.raw[index, self.pkg_size:] = tail
+        self.raw[index + self.capacity] = self.raw[index]
+        self.count += 1
+
+    def __len__(self):
+        # 正在被覆盖的最旧一条不计入可读范围
+        return min(self.count, self.capacity - 1)
+
+    def latest(self, num=None, copy=False):
+        """返回最近 num 条记录(默认全部可读记录)，按时间升序；copy 为 True 时返回不随新帧改变的副本"""
+        count = self.count
+        size = min(count, self.capacity - 1)
+        if num is not None:
+            size = min(size, max(int(num), 0))
+        start = (count - size) % self.capacity
+        records = self.data[start:start + size]
+        return records.copy() if copy else records
+
+    def since(self, seq, copy=False):
+        """返回发布序号 >= seq 的记录，例如"第 N 帧以来的力矩"：since(N)["jt_cur_tor"]"""
+        records = self.latest()
+        records = records[np.searchsorted(records["seq"], seq, side="left"):]
+        return records.copy() if copy else records
+
+    def window(self, seconds, now=None, copy=False):
+        """返回最近 seconds 秒内接收的记录，例如"最近 2 秒的关节位置"：window(2.0)["jt_cur_pos"]"""
+        if now is None:
+            now = time.time()
+        records = self.latest()
+        records = records[np.searchsorted(records["recv_time"], now - seconds, side="left"):]
+        return records.copy() if copy else records
+
+
+"""   
+@brief  机器人状态事件条件
+@note   条件为 condition(prev_pkg, pkg) -> bool，在解析线程中对相邻两帧逐帧计算；
+        也可以直接传入任意满足该签名的函数
+"""
+class RobotStateEvent():
+    @staticmethod
+    def rising_edge(field):
+        """字段由0变为非0，例如 motion_done、gripper_motiondone"""
+        return lambda prev, pkg: not getattr(prev, field) and bool(getattr(pkg, field))
+
+    @staticmethod
+    def falling_edge(field):
+        """字段由非0变为0"""
+        return lambda prev, pkg: bool(getattr(prev, field)) and not getattr(pkg, field)
+
+    @staticmethod
+    def bit_changed(field, bit=None):
+        """字段某一位(bit=None 时为任意位)发生变化，例如 cl_dgt_input_l"""
+        mask = 0xFFFFFFFF if bit is None else (0x01 << bit)
+        return lambda prev, pkg: bool((getattr(prev, field) ^ getattr(pkg, field)) & mask)
+
+    @staticmethod
+    def changed(*fields):
+        """任一字段的值发生变化"""
+        return lambda prev, pkg: any(getattr(prev, f) != getattr(pkg, f) for f in fields)
+
+    @staticmethod
+    def nonzero(*fields):
+        """字段组合变为新的非0值，例如 nonzero("main_code", "sub_code")，故障持续期间不重复触发"""
+        def condition(prev, pkg):
+            values = [getattr(pkg, f) for f in fields]
+            return any(values) and values != [getattr(prev, f) for f in fields]
+        return condition
+
+    @staticmethod
+    def equals(field, value):
+        """字段等于给定值(电平条件，满足期间每帧都成立)"""
+        return lambda prev, pkg: getattr(pkg, field) == value
+
+
+class RobotStateSubscription():
+    __slots__ = ("condition", "callback", "once", "inline", "active")
+
+    def __init__(self, condition, callback, once=False, inline=False):
+        self.condition = condition
+        self.callback = callback
+        self.once = once
+        self.inline = inline  # 为 True 时直接在解析线程中调用，仅用于内部的轻量唤醒
+        self.active = True
+
+
+"""   
+@brief  机器人状态事件分发器
+@note   解析线程每发布一帧调用 evaluate 逐个计算已注册条件，命中后把回调投递到独立的分发线程执行，
+        回调耗时不会拖慢状态解析；订阅列表采用写时复制，解析线程遍历时无需加锁
+"""
+class RobotStateEventDispatcher():
+    def __init__(self):
+        self.subscriptions = ()
+        self.lock = threading.Lock()
+        self.queue = Queue()
+        self.thread = None
+        self.prev_snapshot = None
+
+    def subscribe(self, condition, callback, once=False, inline=False):
+        """注册条件与回调 callback(snapshot)，返回订阅句柄"""
+        subscription = RobotStateSubscription(condition, callback, once, inline)
+        with self.lock:
+            if not inline and self.thread is None:
+                self.thread = threading.Thread(target=self.dispatch_routine_thread)
+                self.thread.daemon = True
+                self.thread.start()
+            self.subscriptions = self.subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """注销订阅"""
+        with self.lock:
+            subscription.active = False
+            self.subscriptions = tuple(sub for sub in self.subscriptions if sub is not subscription)
+
+    def evaluate(self, snapshot):
+        """解析线程中逐帧计算条件"""
+        prev = self.prev_snapshot
+        self.prev_snapshot = snapshot
+        subscriptions = self.subscriptions
+        if not subscriptions or prev is None:
+            return
+        for sub in subscriptions:
+            try:
+                hit = sub.condition(prev.pkg, snapshot.pkg)
+            except Exception as ex:
+                print("状态事件条件计算失败", ex)
+                hit = False
+            if not hit or not sub.active:
+                continue
+            if sub.once:
+                self.unsubscribe(sub)
+            if sub.inline:
+                sub.callback(snapshot)
+            else:
+                self.queue.put((sub.callback, snapshot))
+
+    def dispatch_routine_thread(self):
+        """分发线程，依次执行命中的回调"""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            callback, snapshot = item
+            try:
+                callback(snapshot)
+            except Exception as ex:
+                print("状态事件回调执行失败", ex)
+
+    def stop(self):
+        """停止分发线程"""
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join()
+
+    def wait(self, condition, timeout=None, snapshot=None):
+        """阻塞等待条件成立，返回触发的快照，超时返回 None；snapshot 为当前快照，电平条件满足时立即返回"""
+        event = threading.Event()
+        result = []
+
+        def on_hit(hit_snapshot):
+            result.append(hit_snapshot)
+            event.set()
+
+        subscription = self.subscribe(condition, on_hit, once=True, inline=True)
+        try:
+            if snapshot is not None and condition(snapshot.pkg, snapshot.pkg):
+                return snapshot
+            if not event.wait(timeout):
+                return None
+            return result[0]
+        finally:
+            self.unsubscribe(subscription)
+
+    async def wait_async(self, condition, timeout=None, snapshot=None):
+        """asyncio 版本的 wait，条件命中时通过 call_soon_threadsafe 唤醒事件循环"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def set_result(hit_snapshot):
+            if not future.done():
+                future.set_result(hit_snapshot)
+
+        subscription = self.subscribe(condition, lambda hit_snapshot: loop.call_soon_threadsafe(set_result, hit_snapshot),
+                                      once=True, inline=True)
+        try:
+            if snapshot is not None and condition(snapshot.pkg, snapshot.pkg):
+                return snapshot
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                return None
+        finally:
+            self.unsubscribe(subscription)
+
+
+"""   
+@brief  机器人状态共享内存环形区布局
+@note   头部 64 字节：magic(4) + 版本(4) + 槽大小(4) + 槽数量(4) + 最新发布序号(8)；
+        每个槽：序号(8) + 主机接收时间(8) + RobotStatePkg 原始数据，写入期间槽序号置0(顺序锁)
+"""
+class RobotStateShmLayout():
+    MAGIC = b"FRSS"
+    VERSION = 1
+    HEADER_FORMAT = "<4sIII"
+    HEADER_SIZE = 64
+    WRITE_SEQ_OFFSET = 16
+    SLOT_HEAD_SIZE = 16
+    PKG_SIZE = sizeof(RobotStatePkg)
+    SLOT_SIZE = (SLOT_HEAD_SIZE + PKG_SIZE + 7) // 8 * 8
+
+    @classmethod
+    def size(cls, slot_num):
+        return cls.HEADER_SIZE + slot_num * cls.SLOT_SIZE
+
+    @classmethod
+    def slot_offset(cls, seq, slot_num):
+        return cls.HEADER_SIZE + (seq % slot_num) * cls.SLOT_SIZE
+
+
+"""   
+@brief  机器人状态共享内存发布端，由持有 20004 连接的 RPC 写入，供同机其他进程读取
+"""
+class RobotStateShmPublisher():
+    def __init__(self, name, slot_num=64):
+        self.slot_num = int(slot_num)
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=RobotStateShmLayout.size(self.slot_num))
+        self.name = self.shm.name
+        struct.pack_into(RobotStateShmLayout.HEADER_FORMAT, self.shm.buf, 0, RobotStateShmLayout.MAGIC,
+                         RobotStateShmLayout.VERSION, RobotStateShmLayout.SLOT_SIZE, self.slot_num)
+        struct.pack_into("<Q", self.shm.buf, RobotStateShmLayout.WRITE_SEQ_OFFSET, 0)
+
+    def publish(self, pkg, recv_time, seq):
+        """写入一帧状态包，seq 必须大于0且单调递增"""
+        buf = self.shm.buf
+        offset = RobotStateShmLayout.slot_offset(seq, self.slot_num)
+        pkg_offset = offset + RobotStateShmLayout.SLOT_HEAD_SIZE
+        try:
+            struct.pack_into("<Q", buf, offset, 0)
+            buf[pkg_offset:pkg_offset + RobotStateShmLayout.PKG_SIZE] = memoryview(pkg).cast("B")
+            struct.pack_into("<Qd", buf, offset, seq, recv_time)
+            struct.pack_into("<Q", buf, RobotStateShmLayout.WRITE_SEQ_OFFSET, seq)
+        except (TypeError, ValueError):
+            # 其他线程已调用 close，忽略本帧
+            pass
+
+    def close(self):
+        """关闭并删除共享内存"""
+        self.shm.close()
+        self.shm.unlink()
+
+
+"""   
+@brief  机器人状态共享内存订阅端，不建立 socket、不解析数据帧，直接读取发布端写入的状态
+@note   用法 sub = RobotStateSubscriber("fairino_state"); snapshot = sub.latest()
+"""
+class RobotStateSubscriber():
+    def __init__(self, name="fairino_state"):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=False, track=False)
+        except TypeError:
+            # python3.13 之前附加共享内存也会被 resource_tracker 登记，进程退出时会误删发布端的共享内存
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+            except Exception:
+                pass
+        magic, version, slot_size, slot_num = struct.unpack_from(RobotStateShmLayout.HEADER_FORMAT, self.shm.buf, 0)
+        if magic != RobotStateShmLayout.MAGIC or version != RobotStateShmLayout.VERSION or slot_size != RobotStateShmLayout.SLOT_SIZE:
+            self.shm.close()
+            raise ValueError("共享内存 %s 不是兼容的机器人状态发布区" % name)
+        self.slot_num = slot_num
+        self.last_seq = 0
+
+    def write_seq(self):
+        """发布端最新发布序号，0-尚未发布"""
+        return struct.unpack_from("<Q", self.shm.buf, RobotStateShmLayout.WRITE_SEQ_OFFSET)[0]
+
+    def read(self, seq):
+        """读取指定序号的状态，已被覆盖或尚未写入返回 None"""
+        buf = self.shm.buf
+        offset = RobotStateShmLayout.slot_offset(seq, self.slot_num)
+        pkg_offset = offset + RobotStateShmLayout.SLOT_HEAD_SIZE
+        for _ in range(3):
+            begin_seq, recv_time = struct.unpack_from("<Qd", buf, offset)
+            if begin_seq != seq:
+                return None
+            pkg = RobotStatePkg.from_buffer_copy(buf[pkg_offset:pkg_offset + RobotStateShmLayout.PKG_SIZE])
+            if struct.unpack_from("<Q", buf, offset)[0] == seq:
+                return RobotStateSnapshot(pkg, pkg.frame_cnt, recv_time, seq)
+        return None
+
+    def latest(self):
+        """读取最新一帧状态，尚未发布返回 None"""
+        seq = self.write_seq()
+        while seq:
+            snapshot = self.read(seq)
+            if snapshot is not None:
+                self.last_seq = seq
+                return snapshot
+            seq = self.write_seq()
+        return None
+
+    def read_new(self):
+        """读取上次读取之后新发布的全部状态(最多槽数量-1帧)，按序号升序"""
+        seq = self.write_seq()
+        start = max(self.last_seq + 1, seq - self.slot_num + 2, 1)
+        snapshots = []
+        for i in range(start, seq + 1):
+            snapshot = self.read(i)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+        if snapshots:
+            self.last_seq = snapshots[-1].seq
+        return snapshots
+
+    def close(self):
+        self.shm.close()
+
+
+"""   
+@brief  机器人状态录制文件格式
+@note   文件头：magic(8) + RobotStatePkg 大小(4)
+        数据块：块头 "CHNK" + 压缩长度(4) + 帧数(4) + 首帧时间(8) + 末帧时间(8)，之后为 zlib 压缩的记录，
+                每条记录为 主机接收时间(8) + 帧长度(2) + 20004 原始数据帧
+        索引：  "INDX" + 块数(4) + 每块 文件偏移(8) + 首帧序号(8) + 帧数(4) + 首帧时间(8) + 末帧时间(8)
+        文件尾：索引偏移(8) + "FEND"，文件尾缺失(例如录制进程崩溃)时按块头顺序扫描重建索引
+"""
+class RobotStateRecordFormat():
+    MAGIC = b"FRSTREC1"
+    FILE_HEADER_FORMAT = "<8sI"
+    CHUNK_HEADER_FORMAT = "<4sIIdd"
+    CHUNK_MAGIC = b"CHNK"
+    RECORD_HEADER_FORMAT = "<dH"
+    INDEX_MAGIC = b"INDX"
+    INDEX_ENTRY_FORMAT = "<QQIdd"
+    FOOTER_FORMAT = "<Q4s"
+    FOOTER_MAGIC = b"FEND"
+
+    @staticmethod
+    def frame_bytes(pkg):
+        """由状态包得到对应的 20004 数据帧，帧长超过 RobotStatePkg 时按截断后的内容重新组帧"""
+        view = memoryview(pkg).cast("B")
+        frame_len = pkg.data_len + RobotStateParser.HEAD_LEN + RobotStateParser.CHECKSUM_LEN
+        if frame_len <= len(view):
+            return bytes(view[:frame_len])
+        frame = bytearray(view)
+        frame[3:5] = struct.pack("<H", len(frame) - RobotStateParser.HEAD_LEN - RobotStateParser.CHECKSUM_LEN)
+        frame[-2:] = struct.pack("<H", RobotStateParser.checksum(memoryview(frame)[:-2]))
+        return bytes(frame)
+
+
+"""   
+@brief  机器人状态录制器，把校验通过的原始数据帧及主机接收时间按块压缩追加写入文件
+@note   write 只在内存中累积，压缩与写文件在后台线程完成，不阻塞状态解析线程
+"""
+class RobotStateRecorder():
+    def __init__(self, path, chunk_frames=500, level=1):
+        self.path = path
+        self.chunk_frames = int(chunk_frames)
+        self.level = level
+        self.file = open(path, "wb")
+        self.file.write(struct.pack(RobotStateRecordFormat.FILE_HEADER_FORMAT, RobotStateRecordFormat.MAGIC, sizeof(RobotStatePkg)))
+        self.index = []
+        self.frame_num = 0  # 已写入文件的帧数
+        self.pending = []
+        self.pending_start_time = 0.0
+        self.pending_last_time = 0.0
+        self.lock = threading.Lock()  # 保护 pending，write 在解析线程、close 在调用方线程
+        self.closed = False
+        self.queue = Queue()
+        self.thread = threading.Thread(target=self.write_routine_thread)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def write(self, frame, recv_time):
+        """追加一帧原始数据，关闭后写入的数据被丢弃"""
+        record = struct.pack(RobotStateRecordFormat.RECORD_HEADER_FORMAT, recv_time, len(frame)) + frame
+        with self.lock:
+            if self.closed:
+                return
+            if not self.pending:
+                self.pending_start_time = recv_time
+            self.pending.append(record)
+            self.pending_last_time = recv_time
+            if len(self.pending) >= self.chunk_frames:
+                self.flush_locked()
+
+    def write_pkg(self, pkg, recv_time):
+        """追加一帧状态包(按状态包内容重新组帧，能拿到原始数据帧时请使用 write)"""
+        self.write(RobotStateRecordFormat.frame_bytes(pkg), recv_time)
+
+    def flush(self):
+        """把已累积的帧交给后台线程写成一个数据块"""
+        with self.lock:
+            self.flush_locked()
+
+    def flush_locked(self):
+        if self.pending:
+            self.queue.put((self.pending, self.pending_start_time, self.pending_last_time))
+            self.pending = []
+
+    def write_routine_thread(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            records, first_time, last_time = item
+            payload = zlib.compress(b"".join(records), self.level)
+            offset = self.file.tell()
+            self.file.write(struct.pack(RobotStateRecordFormat.CHUNK_HEADER_FORMAT, RobotStateRecordFormat.CHUNK_MAGIC,
+                                        len(payload), len(records), first_time, last_time))
+            self.file.write(payload)
+            self.file.flush()
+            self.index.append((offset, self.frame_num, len(records), first_time, last_time))
+            self.frame_num += len(records)
+
+    def close(self):
+        """写入剩余数据与索引并关闭文件，可与解析线程中的 write 并发调用"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.flush_locked()
+        self.queue.put(None)
+        self.thread.join()
+        index_offset = self.file.tell()
+        self.file.write(RobotStateRecordFormat.INDEX_MAGIC + struct.pack("<I", len(self.index)))
+        for entry in self.index:
+            self.file.write(struct.pack(RobotStateRecordFormat.INDEX_ENTRY_FORMAT, *entry))
+        self.file.write(struct.pack(RobotStateRecordFormat.FOOTER_FORMAT, index_offset, RobotStateRecordFormat.FOOTER_MAGIC))
+        self.file.close()
+
+
+"""   
+@brief  机器人状态录制文件读取，可按帧序号或主机接收时间定位
+"""
+class RobotStateRecording():
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        magic, self.pkg_size = struct.unpack(RobotStateRecordFormat.FILE_HEADER_FORMAT,
+                                             self.file.read(struct.calcsize(RobotStateRecordFormat.FILE_HEADER_FORMAT)))
+        if magic != RobotStateRecordFormat.MAGIC:
+            raise ValueError("%s 不是机器人状态录制文件" % path)
+        self.index = self.load_index()
+        self.chunk_starts = [entry[1] for entry in self.index]
+        self.chunk_times = [entry[3] for entry in self.index]
+        self.cache_chunk = -1
+        self.cache_records = []
+
+    def load_index(self):
+        footer_size = struct.calcsize(RobotStateRecordFormat.FOOTER_FORMAT)
+        self.file.seek(0, os.SEEK_END)
+        file_size = self.file.tell()
+        if file_size >= footer_size:
+            self.file.seek(file_size - footer_size)
+            index_offset, magic = struct.unpack(RobotStateRecordFormat.FOOTER_FORMAT, self.file.read(footer_size))
+            if magic == RobotStateRecordFormat.FOOTER_MAGIC:
+                self.file.seek(index_offset)
+                if self.file.read(4) == RobotStateRecordFormat.INDEX_MAGIC:
+                    count = struct.unpack("<I", self.file.read(4))[0]
+                    entry_size = struct.calcsize(RobotStateRecordFormat.INDEX_ENTRY_FORMAT)
+                    return [struct.unpack(RobotStateRecordFormat.INDEX_ENTRY_FORMAT, self.file.read(entry_size)) for _ in range(count)]
+        # 文件尾缺失，顺序扫描块头重建索引
+        index = []
+        frame_num = 0
+        header_size = struct.calcsize(RobotStateRecordFormat.CHUNK_HEADER_FORMAT)
+        offset = struct.calcsize(RobotStateRecordFormat.FILE_HEADER_FORMAT)
+        while offset + header_size <= file_size:
+            self.file.seek(offset)
+            magic, payload_len, count, first_time, last_time = struct.unpack(RobotStateRecordFormat.CHUNK_HEADER_FORMAT, self.file.read(header_size))
+            if magic != RobotStateRecordFormat.CHUNK_MAGIC or offset + header_size + payload_len > file_size:
+                break
+            index.append((offset, frame_num, count, first_time, last_time))
+            frame_num += count
+            offset += header_size + payload_len
+        return index
+
+    def __len__(self):
+        if not self.index:
+            return 0
+        last = self.index[-1]
+        return last[1] + last[2]
+
+    @property
+    def start_time(self):
+        return self.index[0][3] if self.index else 0.0
+
+    @property
+    def end_time(self):
+        return self.index[-1][4] if self.index else 0.0
+
+    def read_chunk_data(self, chunk):
+        """读取并解压一个数据块，返回解压后的原始记录数据"""
+        offset = self.index[chunk][0]
+        header_size = struct.calcsize(RobotStateRecordFormat.CHUNK_HEADER_FORMAT)
+        self.file.seek(offset)
+        payload_len = struct.unpack(RobotStateRecordFormat.CHUNK_HEADER_FORMAT, self.file.read(header_size))[1]
+        return zlib.decompress(self.file.read(payload_len))
+
+    def read_chunk(self, chunk):
+        """读取并解压一个数据块，返回 [(recv_time, frame), ...]"""
+        if chunk == self.cache_chunk:
+            return self.cache_records
+        count = self.index[chunk][2]
+        data = self.read_chunk_data(chunk)
+        records = []
+        record_header_size = struct.calcsize(RobotStateRecordFormat.RECORD_HEADER_FORMAT)
+        pos = 0
+        for _ in range(count):
+            recv_time, frame_len = struct.unpack_from(RobotStateRecordFormat.RECORD_HEADER_FORMAT, data, pos)
+            pos += record_header_size
+            records.append((recv_time, data[pos:pos + frame_len]))
+            pos += frame_len
+        self.cache_chunk = chunk
+        self.cache_records = records
+        return records
+
+    def frame(self, index):
+        """按帧序号读取，返回 (recv_time, frame)"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk = bisect.bisect_right(self.chunk_starts, index) - 1
+        return self.read_chunk(chunk)[index - self.chunk_starts[chunk]]
+
+    def seek_time(self, recv_time):
+        """返回主机接收时间 >= recv_time 的第一帧序号"""
+        chunk = max(bisect.bisect_right(self.chunk_times, recv_time) - 1, 0)
+        while chunk < len(self.index):
+            for i, (frame_time, _) in enumerate(self.read_chunk(chunk)):
+                if frame_time >= recv_time:
+                    return self.chunk_starts[chunk] + i
+            chunk += 1
+        return len(self)
+
+    def frames(self, start=0, stop=None):
+        """按顺序遍历 [start, stop) 范围内的 (recv_time, frame)"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        index = start
+        while index < stop:
+            chunk = bisect.bisect_right(self.chunk_starts, index) - 1
+            records = self.read_chunk(chunk)
+            first = self.chunk_starts[chunk]
+            for recv_time, frame in records[index - first:stop - first]:
+                yield recv_time, frame
+            index = first + len(records)
+
+    def close(self):
+        self.file.close()
+
+
+"""   
+@brief  机器人状态回放，把录制的数据帧按原始节奏(或加速)送入 RPC 的状态解析与发布流程
+@note   speed 为回放倍速，0 表示不等待、尽快回放；发布的 recv_time 为录制时的主机接收时间
+"""
+class RobotStateReplay():
+    def __init__(self, recording, speed=1.0):
+        self.recording = RobotStateRecording(recording) if isinstance(recording, str) else recording
+        self.speed = speed
+        self.stop_event = threading.Event()
+
+    def run(self, rpc, start=0, stop=None):
+        """阻塞回放，返回回放的帧数"""
+        parser = RobotStateParser(stats=rpc.robot_state_stats)
+        host_start = time.perf_counter()
+        record_start = None
+        num = 0
+        for recv_time, frame in self.recording.frames(start, stop):
+            if self.stop_event.is_set():
+                break
+            if record_start is None:
+                record_start = recv_time
+            if self.speed > 0:
+                delay = (recv_time - record_start) / self.speed - (time.perf_counter() - host_start)
+                if delay > 0:
+                    time.sleep(delay)
+            rpc.handle_robot_state_data(parser, frame, recv_time)
+            num += 1
+        return num
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def decode_robot_state(source, fields=None, start=0, stop=None):
+    """
+    @brief  批量把状态数据帧解码为按字段分列的 numpy 数组(需要 numpy)
+    @param  [in] source 录制文件路径、RobotStateRecording，或若干 20004 数据帧直接拼接的 bytes
+    @param  [in] fields 需要的字段名列表，None-全部字段
+    @param  [in] start, stop 录制文件的帧序号范围
+    @return {字段名: 数组}，例如 jt_cur_pos 为 N×6；录制文件额外包含 recv_time；
+            帧长一致时整段数据只做一次 np.frombuffer，各列为该结构化数组的视图
+    """
+    if np is None:
+        raise ImportError("decode_robot_state 需要安装 numpy")
+    pkg_dtype = ctypes_to_dtype(RobotStatePkg)
+    pkg_size = pkg_dtype.itemsize
+    recv_time = None
+
+    if isinstance(source, (str, RobotStateRecording)):
+        recording = RobotStateRecording(source) if isinstance(source, str) else source
+        try:
+            record_header_size = struct.calcsize(RobotStateRecordFormat.RECORD_HEADER_FORMAT)
+            record_dtype = np.dtype({"names": ["recv_time", "frame_len", "pkg"],
+                                     "formats": [np.float64, np.uint16, pkg_dtype],
+                                     "offsets": [0, 8, record_header_size],
+                                     "itemsize": record_header_size + pkg_size})
+            stop = len(recording) if stop is None else min(stop, len(recording))
+            parts = []
+            for chunk, (_, first, count, _, _) in enumerate(recording.index):
+                if first + count <= start or first >= stop:
+                    continue
+                data = recording.read_chunk_data(chunk)
+                records = None
+                if len(data) == count * record_dtype.itemsize:
+                    records = np.frombuffer(data, dtype=record_dtype)
+                    if not (records["frame_len"] == pkg_size).all():
+                        records = None
+                if records is None:
+                    # 帧长与 RobotStatePkg 不一致，逐帧补齐后再整体解码
+                    records = np.zeros(count, dtype=record_dtype)
+                    raw = records.view(np.uint8).reshape(count, record_dtype.itemsize)
+                    for i, (frame_time, frame) in enumerate(recording.read_chunk(chunk)):
+                        length = min(len(frame), pkg_size)
+                        records["recv_time"][i] = frame_time
+                        records["frame_len"][i] = len(frame)
+                        raw[i, record_header_size:record_header_size + length] = np.frombuffer(frame, dtype=np.uint8)[:length]
+                parts.append(records[max(start - first, 0):min(stop - first, count)])
+            records = np.concatenate(parts) if len(parts) > 1 else (parts[0] if parts else np.zeros(0, dtype=record_dtype))
+        finally:
+            if isinstance(source, str):
+                recording.close()
+        frames = records["pkg"]
+        recv_time = records["recv_time"]
+    else:
+        data = memoryview(source).cast("B")
+        frames = None
+        if len(data) % pkg_size == 0:
+            frames = np.frombuffer(data, dtype=pkg_dtype)
+            # 每个帧头与帧长都一致才能按固定步长整体解码，否则后续帧错位
+            data_len = pkg_size - RobotStateParser.HEAD_LEN - RobotStateParser.CHECKSUM_LEN
+            if not ((frames["frame_head"] == 0x5A5A) & (frames["data_len"] == data_len)).all():
+                frames = None
+        if frames is not None:
+            raw = np.frombuffer(data, dtype=np.uint8).reshape(len(frames), pkg_size)
+            valid = (raw[:, :pkg_size - 2].sum(axis=1, dtype=np.uint32) & 0xFFFF) == frames["check_sum"]
+            if not valid.all():
+                frames = frames[valid]
+        else:
+            # 帧长不一致或夹杂无效数据，经解析器重新组帧
+            pkgs = RobotStateParser().feed(data)
+            frames = np.frombuffer(b"".join(bytes(pkg) for pkg in pkgs), dtype=pkg_dtype)
+
+    names = pkg_dtype.names if fields is None else fields
+    columns = {name: frames[name] for name in names}
+    if recv_time is not None:
+        columns["recv_time"] = recv_time
+    return columns
+
+
+class RobotStateProtocol(asyncio.Protocol):
+    """20004 端口的 asyncio 协议，收到的数据交给 AsyncRobotStateReader 解析"""
+    def __init__(self, reader):
+        self.reader = reader
+
+    def data_received(self, data):
+        self.reader.handle_data(data)
+
+    def connection_lost(self, exc):
+        self.reader.handle_connection_lost(exc)
+
+
+"""   
+@brief  asyncio 原生的机器人实时状态读取器，与 RPC 的解析线程使用相同的组帧与校验逻辑
+@note   用法：
+            reader = AsyncRobotStateReader("192.168.58.2")
+            await reader.connect()
+            async for snapshot in reader:       # 逐帧获取 RobotStateSnapshot
+                ...
+            await reader.wait(RobotStateEvent.rising_edge("motion_done"), timeout=5)
+        事件条件与回调在事件循环线程内直接计算与调用，无需跨线程唤醒；断线后按 reconnect_interval 自动重连
+"""
+class AsyncRobotStateReader():
+    def __init__(self, ip="192.168.58.2", port=20004, projection=None, queue_size=100, reconnect_interval=2.0):
+        self.ip = ip
+        self.port = port
+        self.queue_size = queue_size
+        self.reconnect_interval = reconnect_interval
+        self.stats = RobotStateStats()
+        self.parser = RobotStateParser(projection, self.stats)
+        self.events = RobotStateEventDispatcher()
+        self.snapshot = RobotStateSnapshot(RobotStatePkg(), 0, 0.0, 0)
+        self.queues = []
+        self.transport = None
+        self.closed = False
+        self.reconnect_task = None
+
+    async def connect(self):
+        """连接 20004 端口"""
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_connection(lambda: RobotStateProtocol(self), self.ip, self.port)
+
+    def handle_data(self, data):
+        recv_time = time.time()
+        for pkg in self.parser.feed(data, recv_time):
+            self.publish(pkg, recv_time)
+
+    def publish(self, pkg, recv_time):
+        self.snapshot = RobotStateSnapshot(pkg, pkg.frame_cnt, recv_time, self.snapshot.seq + 1)
+        for queue in self.queues:
+            if queue.full():
+                queue.get_nowait()  # 消费者落后时丢弃最旧的一帧
+            queue.put_nowait(self.snapshot)
+        self.events.evaluate(self.snapshot)
+
+    def handle_connection_lost(self, exc):
+        self.transport = None
+        self.parser.reset()
+        if not self.closed:
+            self.reconnect_task = asyncio.get_running_loop().create_task(self.reconnect())
+
+    async def reconnect(self):
+        while not self.closed:
+            await asyncio.sleep(self.reconnect_interval)
+            try:
+                await self.connect()
+                return
+            except OSError:
+                continue
+
+    def latest(self):
+        """最新一帧状态快照"""
+        return self.snapshot
+
+    def subscribe(self, condition, callback, once=False):
+        """注册状态事件，回调 callback(snapshot) 在事件循环线程中直接调用"""
+        return self.events.subscribe(condition, callback, once=once, inline=True)
+
+    def unsubscribe(self, subscription):
+        self.events.unsubscribe(subscription)
+
+    async def wait(self, condition, timeout=None):
+        """等待条件成立，返回触发的快照，超时返回 None"""
+        return await self.events.wait_async(condition, timeout, self.snapshot)
+
+    def __aiter__(self):
+        return self.snapshots()
+
+    async def snapshots(self):
+        """逐帧产出状态快照的异步迭代器，消费过慢时丢弃最旧的帧"""
+        queue = asyncio.Queue(self.queue_size)
+        self.queues.append(queue)
+        try:
+            while True:
+                snapshot = await queue.get()
+                if snapshot is None:
+                    return
+                yield snapshot
+        finally:
+            self.queues.remove(queue)
+
+    async def close(self):
+        self.closed = True
+        if self.reconnect_task is not None:
+            self.reconnect_task.cancel()
+        if self.transport is not None:
+            self.transport.close()
+        for queue in self.queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
 class BufferedFileHandler(RotatingFileHandler):
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False):
         super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
@@ -156,11 +1335,19 @@ class BufferedFileHandler(RotatingFileHandler):
             RPC.queue.put(record)
         else:
             self.buffer.append(record)
-            if len(self.buffer) >= 50:
+            # error 日志立即写出，避免进程异常退出时丢失出错前的日志
+            if len(self.buffer) >= 50 or record.levelno >= logging.ERROR:
                 for r in self.buffer:
                     super().emit(r)
                 self.buffer = []
 
+    def close(self):
+        # 关闭时写出缓冲中剩余的日志
+        buffer, self.buffer = self.buffer, []
+        for r in buffer:
+            super().emit(r)
+        super().close()
+
 
 class LogWriterThread(threading.Thread):
     def __init__(self, queue, log_handler):
@@ -179,6 +1366,463 @@ class LogWriterThread(threading.Thread):
             self.log_handler.flush()
 
 
+"""
+@brief  有界异步日志输出，替代 LogWriterThread 的无界队列
+@note   emit 只在锁内把记录放入有界队列，从不阻塞调用线程：队列满时按 drop_policy 丢弃最早(DROP_OLDEST)或最新(DROP_NEWEST)的记录；
+        写线程攒够 batch_size 条或距上次写入超过 flush_interval 秒时批量格式化、写入 target 并只 flush 一次；
+        error 及以上等级的记录立即唤醒写线程
+"""
+class RobotAsyncLogSink(logging.Handler):
+    DROP_OLDEST = 0
+    DROP_NEWEST = 1
+
+    def __init__(self, target, capacity=10000, drop_policy=DROP_OLDEST, batch_size=256, flush_interval=0.2):
+        super().__init__()
+        self.target = target
+        self.capacity = capacity
+        self.drop_policy = drop_policy
+        self.batch_size = min(batch_size, capacity)
+        self.flush_interval = flush_interval
+        self.records = deque()
+        self.cond = threading.Condition(threading.Lock())
+        self.closed = False
+        self.urgent = False
+        self.emitted_num = 0
+        self.written_num = 0
+        self.dropped_oldest_num = 0
+        self.dropped_newest_num = 0
+        self.batch_num = 0
+        self.max_queue_depth = 0
+        self.thread = threading.Thread(target=self.write_routine_thread)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def emit(self, record):
+        with self.cond:
+            if self.closed:
+                return
+            self.emitted_num += 1
+            if len(self.records) >= self.capacity:
+                if self.drop_policy == self.DROP_NEWEST:
+                    self.dropped_newest_num += 1
+                    return
+                self.records.popleft()
+                self.dropped_oldest_num += 1
+            self.records.append(record)
+            depth = len(self.records)
+            if depth > self.max_queue_depth:
+                self.max_queue_depth = depth
+            if record.levelno >= logging.ERROR:
+                self.urgent = True
+                self.cond.notify()
+            elif depth >= self.batch_size:
+                self.cond.notify()
+
+    def handle(self, record):
+        # 跳过 logging.Handler.handle 的 handler 锁，emit 内部已经加锁
+        if self.filter(record):
+            self.emit(record)
+        return record
+
+    def write_routine_thread(self):
+        """写线程，批量写入并 flush"""
+        while True:
+            with self.cond:
+                if not self.closed and len(self.records) < self.batch_size and not self.urgent:
+                    self.cond.wait(self.flush_interval)
+                batch = list(self.records)
+                self.records.clear()
+                self.urgent = False
+                closed = self.closed
+            if batch:
+                self.write_batch(batch)
+            if closed:
+                break
+
+    def write_batch(self, batch):
+        target = self.target
+        target.acquire()
+        try:
+            for record in batch:
+                try:
+                    if isinstance(target, RotatingFileHandler) and target.shouldRollover(record):
+                        target.doRollover()
+                    if getattr(target, "stream", None) is None:
+                        target.stream = target._open()
+                    target.stream.write(target.format(record) + target.terminator)
+                except Exception:
+                    target.handleError(record)
+            target.flush()
+        finally:
+            target.release()
+        with self.cond:
+            self.written_num += len(batch)
+            self.batch_num += 1
+
+    def stats(self):
+        with self.cond:
+            return {"emitted_num": self.emitted_num,
+                    "written_num": self.written_num,
+                    "dropped_oldest_num": self.dropped_oldest_num,
+                    "dropped_newest_num": self.dropped_newest_num,
+                    "queue_depth": len(self.records),
+                    "max_queue_depth": self.max_queue_depth,
+                    "batch_num": self.batch_num}
+
+    def flush(self):
+        with self.cond:
+            self.urgent = True
+            self.cond.notify()
+
+    def close(self):
+        """写完队列中剩余的记录后停止写线程"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        if self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.target.close()
+        super().close()
+
+
+"""
+@brief  二进制调用轨迹环形缓存
+@note   每次 SDK 调用在预分配的 bytearray 中写一条定长记录：接口编号、数值参数(列表与 NumPy 数组逐元素展开，
+        最多 ARG_SLOTS 个，非数值记为 NaN)、返回错误码、开始时间与耗时，写满后覆盖最早的记录；
+        dump() 按时间顺序转换为可读文本。auto_dump 开启时，返回非 0 错误码或抛出异常的调用会触发一次后台转储，
+        两次自动转储至少间隔 min_dump_interval 秒
+"""
+class RobotCallTrace():
+    ARG_SLOTS = 12
+    RECORD_FORMAT = "<HBBidd%dd" % ARG_SLOTS  # 接口编号, 参数个数, 标志, 错误码, 开始时间, 耗时(s), 参数
+    RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+    record_struct = struct.Struct(RECORD_FORMAT)
+    FLAG_EXCEPTION = 0x01  # 调用抛出异常
+    FLAG_NOT_INT = 0x02  # 返回值不是整数错误码
+    FLAG_TRUNCATED = 0x04  # 参数超过 ARG_SLOTS 个，只保存前 ARG_SLOTS 个
+    NAN_ARGS = (float("nan"),) * ARG_SLOTS
+
+    def __init__(self, capacity=4096, dump_dir="", auto_dump=True, min_dump_interval=1.0):
+        self.capacity = capacity
+        self.buf = bytearray(capacity * self.RECORD_SIZE)
+        self.counter = itertools.count()
+        self.record_num = 0
+        self.method_ids = {}
+        self.method_names = []
+        self.lock = threading.Lock()
+        self.dump_dir = dump_dir or os.getcwd()
+        self.auto_dump = auto_dump
+        self.min_dump_interval = min_dump_interval
+        self.last_dump_time = 0.0
+        self.dump_num = 0
+
+    def method_id(self, name):
+        method_id = self.method_ids.get(name)
+        if method_id is None:
+            with self.lock:
+                method_id = self.method_ids.get(name)
+                if method_id is None:
+                    method_id = len(self.method_names)
+                    self.method_names.append(name)
+                    self.method_ids[name] = method_id
+        return method_id
+
+    def pack_args(self, args, kwargs):
+        """参数展开为数值列表，元素不一定都是数值，写入失败时由 sanitize 处理"""
+        values = []
+        for arg in itertools.chain(args, kwargs.values()) if kwargs else args:
+            arg_type = type(arg)
+            if arg_type is float or arg_type is int:
+                values.append(arg)
+            elif arg_type is list or arg_type is tuple:
+                values.extend(arg)
+            elif hasattr(arg, "tolist"):
+                arg = arg.tolist()
+                if isinstance(arg, list):
+                    values.extend(arg)
+                else:
+                    values.append(arg)
+            else:
+                values.append(arg)
+        return values
+
+    @staticmethod
+    def sanitize(values):
+        result = []
+        for value in values:
+            try:
+                result.append(float(value) if isinstance(value, (int, float)) else float("nan"))
+            except OverflowError:
+                result.append(float("nan"))
+        return result
+
+    def record(self, name, args, kwargs, result, start, duration, exception=False):
+        """写入一条调用记录，调用返回非 0 错误码或抛出异常时按 auto_dump 触发转储"""
+        values = self.pack_args(args, kwargs)
+        flags = self.FLAG_EXCEPTION if exception else 0
+        arg_num = len(values)
+        if arg_num > self.ARG_SLOTS:
+            flags |= self.FLAG_TRUNCATED
+            values = values[:self.ARG_SLOTS]
+            arg_num = self.ARG_SLOTS
+        if type(result) is tuple or type(result) is list:
+            result = result[0] if result else None
+        if type(result) is int and -0x80000000 <= result <= 0x7FFFFFFF:
+            code = result
+        else:
+            code = 0
+            flags |= self.FLAG_NOT_INT
+        method_id = self.method_ids.get(name)
+        if method_id is None:
+            method_id = self.method_id(name)
+        index = next(self.counter)
+        offset = (index % self.capacity) * self.RECORD_SIZE
+        try:
+            self.record_struct.pack_into(self.buf, offset, method_id, arg_num, flags, code, start, duration,
+                                         *values, *self.NAN_ARGS[arg_num:])
+        except (struct.error, TypeError, OverflowError):
+            # 参数中含有字符串等非数值或超范围的整数
+            values = self.sanitize(values)
+            self.record_struct.pack_into(self.buf, offset, method_id, arg_num, flags, code, start, duration,
+                                         *values, *self.NAN_ARGS[arg_num:])
+        self.record_num = index + 1
+        if self.auto_dump and (exception or code != 0):
+            self.dump_async("%s %s" % (name, "raised an exception" if exception else "returned %r" % (result,)))
+
+    def snapshot(self):
+        """复制当前缓存，返回 (buf, record_num)"""
+        return bytes(self.buf), self.record_num
+
+    def records(self, snapshot=None):
+        """按时间顺序返回 [(name, args, flags, code, start, duration), ...]"""
+        buf, record_num = snapshot or self.snapshot()
+        first = max(record_num - self.capacity, 0)
+        result = []
+        for index in range(first, record_num):
+            fields = struct.unpack_from(self.RECORD_FORMAT, buf, (index % self.capacity) * self.RECORD_SIZE)
+            method_id, arg_num, flags, code, start, duration = fields[:6]
+            result.append((self.method_names[method_id], fields[6:6 + arg_num], flags, code, start, duration))
+        return result
+
+    @staticmethod
+    def format_value(value):
+        if value != value:
+            return "?"
+        if abs(value) < 1e15 and value == int(value):
+            return "%d" % value
+        return "%.6g" % value
+
+    def format_args(self, args, flags):
+        text = ", ".join(map(self.format_value, args))
+        if flags & self.FLAG_TRUNCATED:
+            text += ", ..."
+        return text
+
+    def dump(self, reason="", snapshot=None):
+        """转换为可读文本"""
+        records = self.records(snapshot)
+        lines = ["# call trace dump%s, %d records" % (": " + reason if reason else "", len(records))]
+        for name, args, flags, code, start, duration in records:
+            if flags & self.FLAG_EXCEPTION:
+                ret = "exception"
+            elif flags & self.FLAG_NOT_INT:
+                ret = "non-integer result"
+            else:
+                ret = str(code)
+            lines.append("%s.%06d %s(%s) -> %s %.3f ms" % (time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start)),
+                                                          int((start % 1) * 1e6), name, self.format_args(args, flags),
+                                                          ret, duration * 1e3))
+        return "\n".join(lines) + "\n"
+
+    def dump_to_file(self, file_path=None, reason="", snapshot=None):
+        if not file_path:
+            file_path = os.path.join(self.dump_dir, "fairino_trace_%s_%d.log" % (datetime.now().strftime("%Y%m%d_%H%M%S_%f"), self.dump_num))
+        self.dump_num += 1
+        with open(file_path, "w") as file:
+            file.write(self.dump(reason, snapshot))
+        return file_path
+
+    def dump_async(self, reason):
+        """复制缓存后在后台线程转换与写文件，不阻塞出错的调用"""
+        now = time.monotonic()
+        if now - self.last_dump_time < self.min_dump_interval:
+            return
+        self.last_dump_time = now
+        thread = threading.Thread(target=self.dump_routine_thread, args=(reason, self.snapshot()))
+        thread.daemon = True
+        thread.start()
+
+    def dump_routine_thread(self, reason, snapshot):
+        try:
+            self.dump_to_file(reason=reason, snapshot=snapshot)
+        except OSError as ex:
+            print("调用轨迹转储失败", ex)
+
+
+class RobotMethodStatsEntry():
+    __slots__ = ("call_num", "error_num", "latency_hist")
+
+    def __init__(self):
+        self.call_num = 0
+        self.error_num = 0
+        self.latency_hist = RobotHistogram()
+
+
+class RobotMethodStatsBucket():
+    """单个线程的统计桶，只由所属线程写入"""
+    __slots__ = ("generation", "methods")
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.methods = {}
+
+
+"""
+@brief  SDK 接口调用统计：每个接口的调用次数、错误次数(返回非 0 错误码或抛出异常)与耗时直方图(微秒)
+@note   每个线程只写自己的统计桶，记录时不加锁；summary() 汇总全部线程的桶。
+        桶按线程 ident 保存，新线程登记桶或汇总时把已结束线程的桶合并到 retired 后移除，桶数不随线程创建次数增长。
+        reset() 只递增代数，各线程下次记录时发现代数变化再清空自己的桶，汇总时跳过旧代数的桶
+"""
+class RobotMethodStats():
+    def __init__(self):
+        self.local = threading.local()
+        self.buckets = {}  # 线程 ident: (线程, 统计桶)
+        self.retired = RobotMethodStatsBucket(0)  # 已结束线程的统计
+        self.lock = threading.Lock()
+        self.generation = 0
+
+    def thread_bucket(self):
+        bucket = RobotMethodStatsBucket(self.generation)
+        self.local.bucket = bucket
+        with self.lock:
+            self.prune_locked()
+            self.buckets[threading.get_ident()] = (threading.current_thread(), bucket)
+        return bucket
+
+    def prune_locked(self):
+        """把已结束线程的桶合并到 retired 并移除，调用方持有 lock"""
+        for ident, (thread, bucket) in list(self.buckets.items()):
+            if not thread.is_alive():
+                del self.buckets[ident]
+                if self.retired.generation != self.generation:
+                    self.retired = RobotMethodStatsBucket(self.generation)
+                self.merge(self.retired.methods, bucket)
+
+    def merge(self, merged, bucket, names=None):
+        """把 bucket 中当前代数的统计累加到 merged"""
+        if bucket.generation != self.generation:
+            return
+        for name, entry in list(bucket.methods.items()):
+            if names is not None and name not in names:
+                continue
+            total = merged.get(name)
+            if total is None:
+                total = merged[name] = RobotMethodStatsEntry()
+            total.call_num += entry.call_num
+            total.error_num += entry.error_num
+            total.latency_hist.merge(entry.latency_hist)
+
+    def record(self, name, latency_us, error):
+        try:
+            bucket = self.local.bucket
+        except AttributeError:
+            bucket = self.thread_bucket()
+        if bucket.generation != self.generation:
+            bucket.methods = {}
+            bucket.generation = self.generation
+        entry = bucket.methods.get(name)
+        if entry is None:
+            entry = bucket.methods[name] = RobotMethodStatsEntry()
+        entry.call_num += 1
+        if error:
+            entry.error_num += 1
+        entry.latency_hist.record(latency_us)
+
+    def summary(self, names=None):
+        """返回 {接口名: {"call_num", "error_num", "latency_us": 直方图摘要}}，names 为 None 时返回全部接口"""
+        merged = {}
+        with self.lock:
+            self.prune_locked()
+            self.merge(merged, self.retired, names)
+            buckets = [bucket for thread, bucket in self.buckets.values()]
+        for bucket in buckets:
+            self.merge(merged, bucket, names)
+        return {name: {"call_num": entry.call_num,
+                       "error_num": entry.error_num,
+                       "latency_us": entry.latency_hist.summary()}
+                for name, entry in sorted(merged.items())}
+
+    def reset(self):
+        self.generation += 1
+
+
+class RobotSpan():
+    """RobotSpanTracer.span() 返回的区间，with 块结束时记录，块内抛出异常时在 args 中记录异常"""
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.args["exception"] = repr(exc_value)
+        self.tracer.add(self.name, self.cat, self.start, time.perf_counter(), self.args)
+        return False
+
+
+"""
+@brief  嵌套区间追踪，导出为 Chrome trace JSON，可在 chrome://tracing 或 ui.perfetto.dev 中打开
+@note   每个区间记录为一条 "X" 完整事件(名称、类别、线程、开始时间与耗时，单位微秒)，同一线程内的区间按时间自动嵌套：
+        上层应用的操作(operation) → SDK 接口(sdk，log_call 记录) → 20003 往返(rpc，连接池记录)；
+        事件保存在长度为 capacity 的有界队列中，超出时丢弃最早的事件
+"""
+class RobotSpanTracer():
+    def __init__(self, capacity=100000):
+        self.events = deque(maxlen=capacity)
+        self.thread_names = {}
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+
+    def add(self, name, cat, start, end, args=None):
+        """记录一个区间，start/end 为 time.perf_counter() 时间"""
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        event = {"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": tid,
+                 "ts": round((start - self.origin) * 1e6, 3), "dur": round((end - start) * 1e6, 3)}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def span(self, name, cat="operation", **args):
+        """with tracer.span("name", key=value): ... 记录 with 块的耗时"""
+        return RobotSpan(self, name, cat, args)
+
+    def clear(self):
+        self.events.clear()
+
+    def export(self, file_path):
+        """写出 Chrome trace JSON 文件"""
+        events = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in list(self.thread_names.items())]
+        events.extend(list(self.events))
+        with open(file_path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file, default=repr)
+        return file_path
+
+
 def calculate_file_md5(file_path):
     if not os.path.exists(file_path):
         raise ValueError(f"{file_path} 不存在")
@@ -189,103 +1833,1278 @@ def calculate_file_md5(file_path):
     return md5.hexdigest()
 
 
-def xmlrpc_timeout(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        if RPC.is_conect == False:
-            return -4
-        else:
-            result = func(self, *args, **kwargs)
-            return result
+INT_RESPONSE_PATTERN = re.compile(rb"\s*(?:<\?xml[^>]*>)?\s*<methodResponse>\s*<params>\s*<param>\s*<value>\s*"
+                                  rb"<(int|i4)>\s*([-+]?\d+)\s*</\1>\s*</value>\s*</param>\s*</params>\s*</methodResponse>\s*$")
 
-    return wrapper
 
+class RobotHTTPConnection(http.client.HTTPConnection):
+    """20003 指令通道的 HTTP 连接，建立连接后关闭 Nagle 算法"""
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-class RobotError:
-    ERR_SUCCESS = 0
-    ERR_POINTTABLE_NOTFOUND = -7  # 上传文件不存在
-    # ERR_SAVE_FILE_PATH_NOT_FOUND = -6  # 保存文件路径不存在
-    ERR_NOT_FOUND_LUA_FILE = -5  # lua文件不存在
-    ERR_RPC_ERROR = -4
-    ERR_SOCKET_COM_FAILED = -2
-    ERR_OTHER = -1
-    ERROR_RECONN = -8
-    ERR_SOCKET_RECV_FAILED=-16    #/* socket接收失败 */
-    ERR_SOCKET_SEND_FAILED=-15    #/* socket发送失败 */
-    ERR_FILE_OPEN_FAILED=-14    #/* 文件打开失败 */
-    ERR_FILE_TOO_LARGE=-13    #/* 文件大小超限 */
-    ERR_UPLOAD_FILE_ERROR=-12    #/* 上传文件异常 */
-    ERR_FILE_NAME=-11    #/* 文件名称异常 */
-    ERR_DOWN_LOAD_FILE_WRITE_FAILED=-10    #/* 下载文件写入失败 */
-    ERR_DOWN_LOAD_FILE_CHECK_FAILED=-9     #/* 文件下载校验失败 */
-    ERR_DOWN_LOAD_FILE_FAILED=-8     #/* 文件下载失败 */
-    ERR_UPLOAD_FILE_NOT_FOUND=-7     #/* 上传文件存在 */
-    ERR_SAVE_FILE_PATH_NOT_FOUND=-6     #/* 保存文件路径不存在 */
 
+"""   
+@brief  20003 指令通道 XML-RPC 传输层
+@note   始终复用同一条 HTTP/1.1 长连接并设置 TCP_NODELAY，连接被控制器复位、关闭或处于异常状态时自动重建连接并重发一次；
+        每次调用的往返时间记录在 last_rtt(秒) 与 rtt_hist(微秒直方图) 中；timeout 为连接与收发的超时时间(s)，None-不超时
+"""
+class RobotTransport(xmlrpc.client.Transport):
+    RESET_ERRNOS = (errno.ECONNRESET, errno.ECONNABORTED, errno.EPIPE)
 
-class RPC():
-    ip_address = "192.168.58.2"
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+        self.last_rtt = 0.0
+        self.rtt_hist = RobotHistogram()
+        self.reconnect_num = 0
+
+    def make_connection(self, host):
+        if self._connection and host == self._connection[0]:
+            conn = self._connection[1]
+        else:
+            chost, self._extra_headers, x509 = self.get_host_info(host)
+            conn = RobotHTTPConnection(chost)
+            self._connection = host, conn
+        conn.timeout = self.timeout
+        if conn.sock is not None and conn.sock.gettimeout() != self.timeout:
+            conn.sock.settimeout(self.timeout)
+        return conn
+
+    def request(self, host, handler, request_body, verbose=False):
+        for i in (0, 1):
+            try:
+                start = time.perf_counter()
+                result = self.single_request(host, handler, request_body, verbose)
+                self.last_rtt = time.perf_counter() - start
+                self.rtt_hist.record(int(self.last_rtt * 1e6))
+                return result
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, http.client.ResponseNotReady):
+                if i:
+                    raise
+            except OSError as e:
+                if i or e.errno not in self.RESET_ERRNOS:
+                    raise
+            # 长连接已失效，重建连接后重发
+            self.close()
+            self.reconnect_num += 1
+
+    def parse_response(self, response):
+        if response.getheader("Content-Encoding", "") == "gzip":
+            return super().parse_response(response)
+        data = response.read()
+        # 多数指令只返回一个整数错误码，直接匹配，其余响应走通用解析
+        match = INT_RESPONSE_PATTERN.match(data)
+        if match:
+            return (int(match.group(2)),)
+        parser, unmarshaller = self.getparser()
+        parser.feed(data)
+        parser.close()
+        return unmarshaller.close()
+
+    def request_pipelined(self, host, handler, request_bodies):
+        """在同一长连接上一次写出全部请求，再按顺序读取各请求的响应；
+        返回值按请求顺序为结果或 Fault，连接中途断开时列表只包含已收到的响应，其余请求可能已被控制器执行；
+        建立连接失败时抛出 OSError，此时没有任何请求发出"""
+        replies = []
+        will_close = False
+        conn = self.make_connection(host)
+        if conn.sock is None:
+            try:
+                conn.connect()
+            except OSError:
+                self.close()
+                raise
+        try:
+            data = bytearray()
+            for body in request_bodies:
+                data += ("POST %s HTTP/1.1\r\nHost: %s\r\nUser-Agent: %s\r\nContent-Type: text/xml\r\n"
+                         "Content-Length: %d\r\n\r\n" % (handler, host, self.user_agent, len(body))).encode("ascii")
+                data += body
+            start = time.perf_counter()
+            conn.sock.sendall(data)
+            reader = RobotPipelineReader(conn.sock.makefile("rb"))
+            try:
+                for body in request_bodies:
+                    resp = http.client.HTTPResponse(reader)
+                    resp.begin()
+                    if resp.status != 200:
+                        raise xmlrpc.client.ProtocolError(host + handler, resp.status, resp.reason, dict(resp.getheaders()))
+                    try:
+                        replies.append(self.parse_response(resp)[0])
+                    except xmlrpc.client.Fault as fault:
+                        replies.append(fault)
+                    will_close = resp.will_close
+                    if will_close:
+                        break
+            finally:
+                reader.rfile.close()
+            self.last_rtt = time.perf_counter() - start
+            self.rtt_hist.record(int(self.last_rtt * 1e6))
+        except (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError):
+            pass
+        if len(replies) < len(request_bodies) or will_close:
+            # 连接状态已不可知，下次调用重新建立连接
+            self.close()
+        return replies
 
-    logger = None
-    log_output_model = -1
-    queue = Queue(maxsize=10000 * 1024)
-    logging_thread = None
-    is_conect = True
-    ROBOT_REALTIME_PORT = 20004
-    # BUFFER_SIZE = 1024 * 2
-    BUFFER_SIZE = 1024 * 1024
-    thread=  threading.Thread()
-    SDK_state=True
 
-    sock_cli_state_state = False
-    closeRPC_state = False
-    reconnect_lock = False
-    reconnect_flag = False
-    g_sock_com_err = RobotError.ERROR_RECONN
+class RobotPipelineReader():
+    """流水线读取响应时共享的缓冲读取对象，同时充当 HTTPResponse 需要的 socket，关闭操作不影响后续响应"""
+    def __init__(self, rfile):
+        self.rfile = rfile
 
+    def makefile(self, mode):
+        return self
 
-    def __init__(self, ip="192.168.58.2"):
-        self.lock = threading.Lock()  # 增加锁
-        self.ip_address = ip
-        link = 'http://' + self.ip_address + ":20003"
-        self.robot = xmlrpc.client.ServerProxy(link)#xmlrpc连接机器人20003端口，用于发送机器人指令数据帧
+    def __getattr__(self, name):
+        return getattr(self.rfile, name)
 
-        self.sock_cli_state = None
-        self.robot_realstate_exit = False
-        self.robot_state_pkg = RobotStatePkg#机器人状态数据
+    def close(self):
+        pass
 
-        self.stop_event = threading.Event()  # 停止事件
-        self.connect_to_robot()
-        thread= threading.Thread(target=self.robot_state_routine_thread)#创建线程循环接收机器人状态数据
-        thread.daemon = True
-        thread.start()
-        time.sleep(1)
-        print(self.robot)
 
+"""
+@brief  定长数值指令的 XML-RPC 请求模板
+@note   shape 按参数顺序描述类型："d"-浮点数，"i"-整数，"[dd...]"-按元素类型描述的定长数组；
+        编码时各值先经 float()/int() 转换再填入预先生成的 XML 格式串，无法转换的参数(None、非数字字符串等)在发送前抛出异常；
+        数组参数可以是 list、tuple 或 NumPy 数组，无需先转换为 float 列表
+"""
+class RobotRequestTemplate():
+    SLOTS = {"d": "<value><double>%r</double></value>\n", "i": "<value><int>%d</int></value>\n"}
+    CONVERTERS = {"d": float, "i": int}
+
+    def __init__(self, name, shape):
+        self.name = name
+        self.shape = shape
+        self.lengths = []
+        self.converters = [self.CONVERTERS[t] for spec in shape for t in spec.strip("[]")]
+        parts = ["<?xml version='1.0'?>\n<methodCall>\n<methodName>%s</methodName>\n<params>\n" % name]
+        for spec in shape:
+            parts.append("<param>\n")
+            if spec.startswith("["):
+                types = spec[1:-1]
+                self.lengths.append(len(types))
+                parts.append("<value><array><data>\n")
+                parts.extend(self.SLOTS[t] for t in types)
+                parts.append("</data></array></value>\n")
+            else:
+                self.lengths.append(0)
+                parts.append(self.SLOTS[spec])
+            parts.append("</param>\n")
+        parts.append("</params>\n</methodCall>\n")
+        self.format = "".join(parts)
+
+    def encode(self, params):
+        """按模板编码请求体，参数个数或数组长度与模板不符时返回 None"""
+        if len(params) != len(self.lengths):
+            return None
+        values = []
+        for length, param in zip(self.lengths, params):
+            if length:
+                if hasattr(param, "tolist"):
+                    param = param.tolist()
+                if len(param) != length:
+                    return None
+                values.extend(param)
+            else:
+                values.append(param)
+        return (self.format % tuple([convert(v) for convert, v in zip(self.converters, values)])).encode("ascii")
+
+    def coerce(self, params):
+        """把参数转换为通用 XML-RPC 编码需要的 Python float/int/list，用于无法套用模板的路径"""
+        result = []
+        for i, param in enumerate(params):
+            spec = self.shape[i] if i < len(self.shape) else ""
+            if hasattr(param, "tolist"):
+                param = param.tolist()
+            if spec.startswith("[") and isinstance(param, (list, tuple)) and len(param) == len(spec) - 2:
+                param = [float(v) if t == "d" else int(v) for t, v in zip(spec[1:-1], param)]
+            elif spec == "d":
+                param = float(param)
+            elif spec == "i":
+                param = int(param)
+            result.append(param)
+        return tuple(result)
+
+
+ROBOT_REQUEST_TEMPLATES = {
+    "MoveJ": RobotRequestTemplate("MoveJ", ["[dddddd]", "[dddddd]", "i", "i", "d", "d", "d", "[dddd]", "d", "i", "[dddddd]"]),
+    "MoveL": RobotRequestTemplate("MoveL", ["[" + "d" * 12 + "ii" + "dddd" + "i" + "dddd" + "ii" + "d" * 6 + "di]"]),
+    "ServoJ": RobotRequestTemplate("ServoJ", ["[dddddd]", "[dddd]", "d", "d", "d", "d", "d", "i"]),
+    "ServoCart": RobotRequestTemplate("ServoCart", ["i", "[dddddd]", "[dddddd]", "d", "d", "d", "d", "d"]),
+    "GetForwardKin": RobotRequestTemplate("GetForwardKin", ["[dddddd]"]),
+    "GetInverseKin": RobotRequestTemplate("GetInverseKin", ["i", "[dddddd]", "i"]),
+}
+
+
+def coerce_robot_params(name, params):
+    """把有请求模板的指令参数转换为通用 XML-RPC 编码可接受的类型，其余指令原样返回"""
+    template = ROBOT_REQUEST_TEMPLATES.get(name)
+    if template is None:
+        return tuple(params)
+    return template.coerce(params)
+
+
+def encode_robot_request(name, params):
+    """编码一条 XML-RPC 请求体，有请求模板的指令走模板快速路径"""
+    template = ROBOT_REQUEST_TEMPLATES.get(name)
+    if template is not None:
+        body = template.encode(params)
+        if body is not None:
+            return body
+        params = template.coerce(params)
+    return xmlrpc.client.dumps(tuple(params), name, encoding="utf-8").encode("utf-8", "xmlcharrefreplace")
 
-        try:
-            # 调用 XML-RPC 方法
-            socket.setdefaulttimeout(1)
-            self.robot.GetControllerIP()
-        except socket.timeout:
-            print("XML-RPC connection timed out.")
-            RPC.is_conect = False
 
-        except socket.error as e:
-            print("可能是网络故障，请检查网络连接。")
-            RPC.is_conect = False
-        except Exception as e:
-            print("An error occurred during XML-RPC call:", e)
-            RPC.is_conect = False
+"""
+@brief  20003 指令连接池，替代单个 ServerProxy 作为 RPC.robot 使用
+@note   顺序保证：查询类指令(Get 开头)每次调用从池中借出一条空闲连接，最多 size 条并发，与其他指令之间没有顺序约束；
+        其余指令(运动、设置等)全部经同一条指令连接串行发送，各线程按获取锁的先后执行，同一线程内严格按调用顺序执行，
+        一条指令返回后再发出的查询能看到该指令的结果；
+        URGENT_CALLS 中的停止、暂停、恢复类指令经单独的紧急连接发送，不等待指令连接上正在执行的阻塞运动或长耗时指令，
+        可能先于其他线程已排队的指令到达控制器
+        超时：每次调用的超时时间默认为 timeout 秒，LONG_CALL_PREFIXES 开头的阻塞运动、力控搜索与插入、等待与文件类指令为 long_timeout 秒，
+        PARAM_TIMEOUT_CALLS 中自带控制器侧等待时间参数的指令为该等待时间加 timeout 秒，
+        local.timeout 不为 None 时(SDK 接口的 rpc_timeout 参数)以其为准，超时抛出 socket.timeout
+"""
+class RobotConnectionPool():
+    LONG_CALL_PREFIXES = ("Move", "Circle", "NewSpiral", "SplinePTP", "NewSplinePoint", "SplineEnd", "NewSplineEnd",
+                          "ExtAxisMove", "ExtAxisSync", "TractorMove", "TractorHoming", "ConveyorTrackMoveL", "Wait",
+                          "FT_SpiralSearch", "FT_RotInsertion", "FT_LinInsertion", "FT_FindSurface", "ARCStart", "ARCEnd", "WireSearch", "LaserTrackingSearch", "LoadIdentify",
+                          "ForceSensorComputeLoad", "JointSensitivity", "SoftwareUpgrade", "KernelUpgrade",
+                          "JointAllParamUpgrade", "FileUpload", "FileDownload", "PointTable", "LuaUpLoad", "ProgramLoad")
+    PARAM_TIMEOUT_CALLS = {"ConveyorComDetect": 0}  # 指令名: 控制器侧等待时间(ms)参数的下标，超时时间为该等待时间加 timeout
+    URGENT_CALLS = frozenset(["StopMotion", "PauseMotion", "ResumeMotion", "ProgramStop", "ProgramPause", "ProgramResume",
+                              "StopJOG", "ImmStopJOG", "FT_ComplianceStop", "LaserTrackingSearchStop", "MoveAOStop",
+                              "MoveToolAOStop", "WeldingAbortWeldAfterBreakOff"])
+
+    def __init__(self, link, size=4, timeout=5.0, long_timeout=300.0):
+        self.link = link
+        self.host, self.handler = urllib.parse.urlsplit(link)[1:3]
+        self.span_tracer = None
+        self.handler = self.handler or "/RPC2"
+        self.size = size
+        self.timeout = timeout
+        self.long_timeout = long_timeout
+        self.local = threading.local()
+        self.command_transport = RobotTransport()
+        self.command_robot = xmlrpc.client.ServerProxy(link, transport=self.command_transport)
+        self.command_lock = threading.Lock()
+        self.urgent_transport = RobotTransport()
+        self.urgent_robot = xmlrpc.client.ServerProxy(link, transport=self.urgent_transport)
+        self.urgent_lock = threading.Lock()
+        self.transports = [self.command_transport, self.urgent_transport]
+        self.idle = []
+        self.created = 0
+        self.cond = threading.Condition()
+
+    def __repr__(self):
+        return "<RobotConnectionPool for %s, size %d>" % (self.link, self.size)
+
+    def __getattr__(self, name):
+        return RobotPoolMethod(self, name)
+
+    @staticmethod
+    def is_query(name):
+        return name.startswith("Get")
+
+    def call_timeout(self, name, params=()):
+        """本线程当前调用 name 指令使用的超时时间"""
+        timeout = getattr(self.local, "timeout", None)
+        if timeout is not None:
+            return timeout
+        index = self.PARAM_TIMEOUT_CALLS.get(name)
+        if index is not None and index < len(params):
+            return params[index] / 1000.0 + self.timeout
+        return self.long_timeout if name.startswith(self.LONG_CALL_PREFIXES) else self.timeout
+
+    def checkout(self):
+        """借出一条查询连接，连接数已达上限时等待归还"""
+        with self.cond:
+            while not self.idle and self.created >= self.size:
+                self.cond.wait()
+            if self.idle:
+                return self.idle.pop()
+            self.created += 1
+            transport = RobotTransport()
+            self.transports.append(transport)
+        return xmlrpc.client.ServerProxy(self.link, transport=transport)
+
+    def checkin(self, robot):
+        with self.cond:
+            self.idle.append(robot)
+            self.cond.notify()
+
+    def send(self, robot, transport, name, params):
+        span_tracer = self.span_tracer
+        if span_tracer is None:
+            return self.send_request(robot, transport, name, params)
+        start = time.perf_counter()
+        try:
+            return self.send_request(robot, transport, name, params)
         finally:
-            # 恢复默认超时时间
-            self.robot = None
-            socket.setdefaulttimeout(None)
-            self.robot = xmlrpc.client.ServerProxy(link)
+            span_tracer.add(name, "rpc", start, time.perf_counter())
+
+    def send_request(self, robot, transport, name, params):
+        template = ROBOT_REQUEST_TEMPLATES.get(name)
+        if template is None:
+            return getattr(robot, name)(*params)
+        body = template.encode(params)
+        if body is None:
+            return getattr(robot, name)(*template.coerce(params))
+        # 模板快速路径，跳过通用 XML 编码
+        response = transport.request(self.host, self.handler, body)
+        if len(response) == 1:
+            response = response[0]
+        return response
+
+    def call(self, name, params):
+        timeout = self.call_timeout(name, params)
+        if self.is_query(name):
+            robot = self.checkout()
+            try:
+                transport = robot("transport")
+                transport.timeout = timeout
+                return self.send(robot, transport, name, params)
+            except Exception:
+                # 响应可能未读完，关闭连接后再归还，下次使用时重建
+                robot("close")()
+                raise
+            finally:
+                self.checkin(robot)
+        if name in self.URGENT_CALLS:
+            with self.urgent_lock:
+                self.urgent_transport.timeout = timeout
+                return self.send(self.urgent_robot, self.urgent_transport, name, params)
+        with self.command_lock:
+            self.command_transport.timeout = timeout
+            return self.send(self.command_robot, self.command_transport, name, params)
+
+    def close(self):
+        with self.command_lock, self.urgent_lock, self.cond:
+            for transport in self.transports:
+                transport.close()
+
+
+class RobotPoolMethod():
+    """连接池上的 XML-RPC 方法，支持 system.multicall 这类带点的方法名"""
+    def __init__(self, pool, name):
+        self.pool = pool
+        self.name = name
+
+    def __getattr__(self, name):
+        return RobotPoolMethod(self.pool, self.name + "." + name)
+
+    def __call__(self, *params):
+        return self.pool.call(self.name, params)
 
-    def connect_to_robot(self):
-        """连接到机器人的实时端口"""
-        # print("SDK连接机器人")
+
+"""
+@brief  20003 指令网络异常重试策略，RPC.call_robot 使用
+@note   网络异常(OSError)后按指数退避加随机抖动重试，单次调用从首次失败起不超过 deadline 秒，指定了 rpc_timeout 时
+        从发出首次请求起不超过 rpc_timeout 秒，超时后不再发起重试，抛出最后一次异常；
+        只有查询类指令(Get 开头)与 IDEMPOTENT_CALLS 中核实过可重复执行的指令自动重试，其余指令(运动、执行机构、
+        程序控制、升级等)一律不重试，直接抛出异常，由调用方确认机器人状态后决定是否重发；
+        RPC.call_robot 把抛出的异常记录日志后转换为 RobotCallFailed，SDK 接口最终返回错误码 ERR_SOCKET_COM_FAILED
+"""
+class RobotRetryPolicy():
+    IDEMPOTENT_CALLS = frozenset([
+        # 名称不以 Get 开头的查询
+        "IsInDragTeach", "AuxServoGetAcc", "AuxServoGetEmergencyStopAcc", "AuxServoGetParam", "AuxServoGetStatus",
+        "AxleSensorConfigGet", "ExtAxisGetCoord", "ExtDevGetUDPComParam", "FT_GetConfig", "CustomWeaveGetPara",
+        "ConveyorGetTrackData", "LoadIdentifyGetResult", "WeldingGetCheckArcInterruptionParam", "WeldingGetCurrentRelation",
+        "WeldingGetProcessParam", "WeldingGetReWeldAfterBreakOffParam", "WeldingGetVoltageRelation",
+        "FieldBusSlaveReadAI", "FieldBusSlaveReadDI",
+        # 以绝对值写入配置或输出电平的设置，重复执行结果不变
+        "SetDO", "SetAO", "SetToolDO", "SetToolAO", "SetAuxDO", "SetAuxAO", "SetSpeed", "SetOaccScale",
+        "SetToolCoord", "SetToolList", "SetExToolCoord", "SetExToolList", "SetWObjCoord", "SetWObjList",
+        "SetLoadWeight", "SetLoadCoord", "SetRobotInstallPos", "SetRobotInstallAngle", "SetAnticollision",
+        "SetCollisionStrategy", "SetLimitPositive", "SetLimitNegative", "SetSysVarValue", "SetGripperConfig",
+        "SetForceSensorPayload", "SetForceSensorPayloadCog", "SetRobotRealtimeStateSamplePeriod", "SetPowerLimit",
+        "SetStaticCollisionOnOff", "SetTorqueDetectionSwitch", "SetCollisionDetectionMethod", "SetVelFeedForwardRatio",
+        "SetAuxDIFilterTime", "SetAuxAIFilterTime", "SetOutputResetCtlBoxDO", "SetOutputResetCtlBoxAO",
+        "SetOutputResetAxleDO", "SetOutputResetAxleAO", "SetOutputResetExtDO", "SetOutputResetExtAO",
+        "SetOutputResetSmartToolDO", "SetAxleCommunicationParam", "SetAxleFileType", "SetAxleLuaEnable",
+        "SetAxleLuaEnableDeviceType", "SetAxleLuaGripperFunc", "FT_SetConfig", "FT_SetRCS", "WeaveSetPara",
+        "WeldingSetCurrentRelation", "WeldingSetVoltageRelation", "WeldingSetProcessParam",
+        "WeldingSetCheckArcInterruptionParam", "WeldingSetReWeldAfterBreakOffParam", "CustomWeaveSetPara",
+        "ConveyorSetParam", "Mode"])
+
+    def __init__(self, base_delay=0.05, max_delay=2.0, deadline=30.0, jitter=0.5):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.jitter = jitter
+        self.lock = threading.Lock()
+        self.failed_call_num = 0
+        self.retry_num = 0
+        self.recovered_num = 0
+        self.exhausted_num = 0
+        self.not_retried_num = 0
+        self.method_retry_num = {}
+
+    def is_retryable(self, name):
+        """白名单判定，未列出的指令视为不可重试"""
+        return name.startswith("Get") or name in self.IDEMPOTENT_CALLS
+
+    def delay(self, attempt):
+        """第 attempt 次重试前的等待时间(s)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1.0 - self.jitter * random.random())
+
+    def count(self, name, field, retry=0):
+        with self.lock:
+            setattr(self, field, getattr(self, field) + 1)
+            if retry:
+                self.retry_num += retry
+                self.method_retry_num[name] = self.method_retry_num.get(name, 0) + retry
+
+    def begin(self, name, error, timeout=None, start=None):
+        """记录一次失败的调用，不可重试时抛出 error，否则返回重试截止时间；
+        timeout 不为 None 时截止时间不晚于首次请求时间 start 加 timeout"""
+        self.count(name, "failed_call_num")
+        if not self.is_retryable(name):
+            self.count(name, "not_retried_num")
+            raise error
+        deadline = time.monotonic() + self.deadline
+        if timeout is not None:
+            deadline = min(deadline, start + timeout)
+        return deadline
+
+    def next_delay(self, name, attempt, deadline, error):
+        """第 attempt 次重试前的等待时间，等待后会超过截止时间时记录并抛出 error"""
+        delay = self.delay(attempt)
+        if time.monotonic() + delay > deadline:
+            self.count(name, "exhausted_num", attempt)
+            raise error
+        return delay
+
+    def run(self, name, func, error, timeout=None, start=None):
+        """首次调用 func 抛出 error 后执行重试，返回成功的结果"""
+        deadline = self.begin(name, error, timeout, start)
+        attempt = 0
+        while True:
+            time.sleep(self.next_delay(name, attempt, deadline, error))
+            attempt += 1
+            try:
+                result = func()
+            except OSError as ex:
+                error = ex
+                continue
+            self.count(name, "recovered_num", attempt)
+            return result
+
+    async def run_async(self, name, func, error, timeout=None, start=None):
+        """run 的协程版本，func 返回协程，退避等待不阻塞事件循环"""
+        deadline = self.begin(name, error, timeout, start)
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.next_delay(name, attempt, deadline, error))
+            attempt += 1
+            try:
+                result = await func()
+            except OSError as ex:
+                error = ex
+                continue
+            self.count(name, "recovered_num", attempt)
+            return result
+
+    def summary(self):
+        with self.lock:
+            return {"failed_call_num": self.failed_call_num,
+                    "retry_num": self.retry_num,
+                    "recovered_num": self.recovered_num,
+                    "exhausted_num": self.exhausted_num,
+                    "not_retried_num": self.not_retried_num,
+                    "method_retry_num": dict(self.method_retry_num)}
+
+    def reset(self):
+        with self.lock:
+            self.failed_call_num = 0
+            self.retry_num = 0
+            self.recovered_num = 0
+            self.exhausted_num = 0
+            self.not_retried_num = 0
+            self.method_retry_num = {}
+
+
+class RobotCallFailed(Exception):
+    """20003 指令网络异常且不可重试或重试用尽，由 xmlrpc_timeout 转换为错误码 ERR_SOCKET_COM_FAILED 返回"""
+    def __init__(self, name, error):
+        super().__init__("%s failed: %s" % (name, error))
+        self.name = name
+        self.error = error
+
+
+"""
+@brief  状态包读缓存，可由 20004 状态包推出的查询接口在最新状态帧足够新时直接从状态包返回，否则回退到 20003 查询
+@note   max_age 为允许的最大帧龄(s)，按主机接收时间 recv_time 计算；校验失败的数据不更新 recv_time。
+        READERS 中原本走 20003 的接口经 read 读取，max_age 为 None 时不使用状态包，始终走 20003 查询；
+        原本直接读取状态包的接口(GetDI、GetActualJointPosDegree 等)经 packet 读取，max_age 为 None 时保持原行为，总是从状态包返回。
+        hit 为从状态包返回的次数，miss 为回退到 20003 查询的次数
+"""
+class RobotStateReadCache():
+    READERS = {
+        "GetActualJointPosRadian": lambda pkg: [math.radians(pos) for pos in pkg.jt_cur_pos],
+        "GetTargetPayload": lambda pkg: pkg.load,
+        "GetTargetPayloadCog": lambda pkg: list(pkg.loadCog),
+        "GetTCPOffset": lambda pkg: list(pkg.toolCoord),
+        "GetWObjOffset": lambda pkg: list(pkg.wobjCoord),
+    }
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.method_hit_num = {}
+        self.method_miss_num = {}
+
+    def read(self, snapshot, name, max_age=None):
+        """返回 (0, 值)，未指定 max_age、尚未收到状态帧或状态帧过旧时返回 None"""
+        if max_age is None:
+            max_age = self.max_age
+        if max_age is not None and snapshot.recv_time > 0 and time.time() - snapshot.recv_time <= max_age:
+            result = (0, self.READERS[name](snapshot.pkg))
+            counter = self.method_hit_num
+        else:
+            result = None
+            counter = self.method_miss_num
+        with self.lock:
+            counter[name] = counter.get(name, 0) + 1
+        return result
+
+    def packet(self, snapshot, name, max_age=None):
+        """直接读取状态包的接口使用：返回可读取的状态包，状态帧比 max_age 旧或尚未收到时返回 None，由调用方走 20003 查询；
+        max_age 与默认值都为 None 时总是返回最新状态包"""
+        if max_age is None:
+            max_age = self.max_age
+        if max_age is None or (snapshot.recv_time > 0 and time.time() - snapshot.recv_time <= max_age):
+            result = snapshot.pkg
+            counter = self.method_hit_num
+        else:
+            result = None
+            counter = self.method_miss_num
+        with self.lock:
+            counter[name] = counter.get(name, 0) + 1
+        return result
+
+    def summary(self):
+        with self.lock:
+            return {"hit_num": sum(self.method_hit_num.values()),
+                    "miss_num": sum(self.method_miss_num.values()),
+                    "method_hit_num": dict(self.method_hit_num),
+                    "method_miss_num": dict(self.method_miss_num)}
+
+    def reset(self):
+        with self.lock:
+            self.method_hit_num = {}
+            self.method_miss_num = {}
+
+
+class RobotConnectionError(ConnectionError):
+    """断线重连期间等待连接恢复超时"""
+    pass
+
+
+"""
+@brief  连接状态门，断线重连期间 SDK 调用在此等待，重连成功时立即唤醒全部等待的线程与协程
+@note   wait()/wait_async() 在连接正常时直接返回 True，等待超过 timeout 秒仍未恢复时返回 False
+"""
+class RobotConnectionGate():
+    def __init__(self, timeout=10.0):
+        self.timeout = timeout
+        self.is_open = True
+        self.cond = threading.Condition()
+        self.async_waiters = []
+
+    def close(self):
+        with self.cond:
+            self.is_open = False
+
+    def open(self):
+        with self.cond:
+            self.is_open = True
+            self.cond.notify_all()
+            waiters, self.async_waiters = self.async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self.wake_future, future)
+            except RuntimeError:
+                pass  # 事件循环已关闭
+
+    @staticmethod
+    def wake_future(future):
+        if not future.done():
+            future.set_result(True)
+
+    def wait(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        with self.cond:
+            return self.cond.wait_for(lambda: self.is_open, timeout)
+
+    async def wait_async(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.cond:
+            if self.is_open:
+                return True
+            self.async_waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self.cond:
+                if (loop, future) in self.async_waiters:
+                    self.async_waiters.remove((loop, future))
+
+
+RobotConnectionTransition = namedtuple("RobotConnectionTransition", ["time", "state", "prev_state", "reason"])
+
+
+"""
+@brief  连接存活监测与断线重连
+@note   监测线程每个状态周期 period 检查一次最新状态帧，连续 stale_periods 个周期未收到新帧即进入 STALE，
+        同时在独立线程中用 GetControllerIP 探测 20003；探测失败或状态流停顿超过 reconnect_timeout 时关闭 20004 套接字，
+        由状态接收线程调用 reconnect()，20004 与 20003 两条通道并行重建，都恢复后回到 CONNECTED。
+        每次状态切换记录为 RobotConnectionTransition(time, state, prev_state, reason)，time 为主机时间 time.time()
+"""
+class RobotLivenessMonitor():
+    CONNECTED = "CONNECTED"
+    STALE = "STALE"
+    RECONNECTING = "RECONNECTING"
+    DISCONNECTED = "DISCONNECTED"
+
+    def __init__(self, rpc, period=0.008, stale_periods=5, reconnect_timeout=0.3, probe_interval=1.0, probe_timeout=0.5,
+                 reconnect_deadline=2000.0, history_size=256):
+        self.rpc = rpc
+        self.period = period
+        self.stale_periods = stale_periods
+        self.reconnect_timeout = reconnect_timeout
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.reconnect_deadline = reconnect_deadline
+        self.state = self.CONNECTED
+        self.state_time = time.time()
+        self.connected_time = self.state_time
+        self.transitions = deque(maxlen=history_size)
+        self.callbacks = ()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.probe_thread = None
+        self.last_probe_time = 0.0
+        self.reconnect_reason = None
+
+    def transition(self, state, reason=""):
+        """切换连接状态，记录并通知订阅者"""
+        with self.lock:
+            if state == self.state:
+                return
+            item = RobotConnectionTransition(time.time(), state, self.state, reason)
+            self.state = state
+            self.state_time = item.time
+            self.transitions.append(item)
+            callbacks = self.callbacks
+        for callback in callbacks:
+            try:
+                callback(item)
+            except Exception as ex:
+                print("连接状态回调执行失败", ex)
+
+    def subscribe(self, callback):
+        """注册连接状态切换回调 callback(transition)，在发生切换的线程中调用"""
+        with self.lock:
+            self.callbacks = self.callbacks + (callback,)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self.callbacks = tuple(cb for cb in self.callbacks if cb is not callback)
+
+    def history(self):
+        with self.lock:
+            return list(self.transitions)
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.monitor_routine_thread)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        thread = self.thread
+        self.thread = None
+        if thread is not None:
+            self.stop_event.set()
+            thread.join()
+
+    def monitor_routine_thread(self):
+        """监测线程，检查状态流是否停顿并定时探测 20003"""
+        while not self.stop_event.wait(self.period):
+            rpc = self.rpc
+            if rpc.closeRPC_state:
+                break
+            if rpc.reconnect_flag:
+                continue
+            snapshot = rpc.robot_state_snapshot
+            now = time.time()
+            if self.state == self.STALE and snapshot.recv_time > self.state_time:
+                self.transition(self.CONNECTED, "state stream resumed")
+                continue
+            # 重连成功后以恢复时刻起算，尚未收到新帧时不误判为停顿
+            age = now - max(snapshot.recv_time, self.connected_time)
+            if snapshot.seq > 0 and age > self.period * self.stale_periods:
+                if self.state == self.CONNECTED:
+                    self.transition(self.STALE, "no state frame for %.0f ms" % (age * 1000))
+                    self.start_probe()
+                elif age > self.reconnect_timeout:
+                    self.request_reconnect("no state frame for %.0f ms" % (age * 1000))
+            if now - self.last_probe_time >= self.probe_interval:
+                self.start_probe()
+
+    def start_probe(self):
+        """在独立线程中探测 20003，不阻塞状态流检查"""
+        if self.probe_thread is not None and self.probe_thread.is_alive():
+            return
+        self.last_probe_time = time.time()
+        self.probe_thread = threading.Thread(target=self.probe_routine_thread)
+        self.probe_thread.daemon = True
+        self.probe_thread.start()
+
+    def probe_routine_thread(self):
+        if not self.probe() and not self.rpc.reconnect_flag and not self.rpc.closeRPC_state:
+            self.transition(self.STALE, "20003 probe failed")
+            self.request_reconnect("20003 probe failed")
+
+    def probe(self):
+        """用 GetControllerIP 探测 20003 是否可用，不经过重试与连接门"""
+        robot = self.rpc.robot
+        if robot is None:
+            return False
+        robot.local.timeout = self.probe_timeout
+        try:
+            robot.GetControllerIP()
+            return True
+        except Exception:
+            return False
+        finally:
+            robot.local.timeout = None
+
+    def request_reconnect(self, reason):
+        """关闭 20004 套接字的读写，状态接收线程的 recv_into 随即返回并执行 reconnect()"""
+        self.reconnect_reason = reason
+        sock = self.rpc.sock_cli_state
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def retry_delay(self, attempt):
+        """第 attempt 次重连失败后的等待时间(s)，上限 0.5 s，控制器重启完成后尽快恢复"""
+        return min(0.5, 0.05 * (2 ** attempt))
+
+    def restore_state_channel(self, deadline):
+        """重建 20004 状态通道，失败时按退避间隔重试直到 deadline"""
+        rpc = self.rpc
+        attempt = 0
+        while not rpc.closeRPC_state:
+            if rpc.sock_cli_state:
+                rpc.sock_cli_state.close()
+                rpc.sock_cli_state = None
+            if rpc.connect_to_robot():
+                return True
+            delay = self.retry_delay(attempt)
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            attempt += 1
+        return False
+
+    def restore_command_channel(self, deadline):
+        """探测 20003 直到恢复，连接池中断开的连接在探测失败时关闭，下次使用时重建"""
+        attempt = 0
+        while not self.rpc.closeRPC_state:
+            if self.probe():
+                return True
+            delay = self.retry_delay(attempt)
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            attempt += 1
+        return False
+
+    def reestablish(self, reason=""):
+        """并行重建 20004 与 20003 两条通道，两者都恢复时返回 True"""
+        start = time.time()
+        reason, self.reconnect_reason = self.reconnect_reason or reason, None
+        self.transition(self.RECONNECTING, reason)
+        deadline = time.monotonic() + self.reconnect_deadline
+        result = []
+        command_thread = threading.Thread(target=lambda: result.append(self.restore_command_channel(deadline)))
+        command_thread.daemon = True
+        command_thread.start()
+        state_ok = self.restore_state_channel(deadline)
+        command_thread.join()
+        if state_ok and result and result[0]:
+            self.connected_time = time.time()
+            self.transition(self.CONNECTED, "recovered in %.3f s" % (time.time() - start))
+            return True
+        self.transition(self.DISCONNECTED, "state channel %s, command channel %s" %
+                        ("ok" if state_ok else "failed", "ok" if result and result[0] else "failed"))
+        return False
+
+
+class RobotCallCaptured(Exception):
+    """批处理录制阶段截获的 20003 指令，shadow 为截获时执行方法体的 RobotCallShadow"""
+    def __init__(self, name, params):
+        super().__init__(name)
+        self.name = name
+        self.params = params
+        self.shadow = None
+
+
+class RobotCallProxy():
+    """代替 ServerProxy 的指令代理：方法体依次发出的指令中，已有结果的直接返回该结果(Fault 则抛出)，
+    第一条没有结果的指令被截获并抛出 RobotCallCaptured；forward 为 True 时改为经 rpc.call_robot 发送(按重试策略重试)"""
+    def __init__(self, rpc, replies=(), forward=False):
+        self.rpc = rpc
+        self.replies = replies
+        self.forward = forward
+        self.index = 0
+
+    def __getattr__(self, name):
+        def call(*params):
+            index = self.index
+            self.index += 1
+            if index < len(self.replies):
+                reply = self.replies[index]
+                if isinstance(reply, xmlrpc.client.Fault):
+                    raise reply
+                return reply
+            if self.forward:
+                return self.rpc.call_robot(name, *params)
+            raise RobotCallCaptured(name, params)
+        return call
+
+
+class RobotCallRecord():
+    """RobotCallShadow 记录的 RPC 方法，首次执行时调用原方法并按顺序记录结果或异常，rewind 后按顺序返回记录"""
+    def __init__(self, func):
+        self.func = func
+        self.results = []
+        self.index = 0
+
+    def __call__(self, *args, **kwargs):
+        index = self.index
+        self.index += 1
+        if index < len(self.results):
+            ok, value = self.results[index]
+            if ok:
+                return value
+            raise value
+        try:
+            value = self.func(*args, **kwargs)
+        except Exception as ex:
+            self.results.append((False, ex))
+            raise
+        self.results.append((True, value))
+        return value
+
+
+class RobotCallShadow():
+    """代替 RPC 实例执行 SDK 方法体，只替换 robot 指令代理，其余属性与方法均取自原实例；
+    每收到一条指令的结果，rewind 后重新执行同一方法体：首次执行读取的属性值与调用的 RPC 方法的结果按读取顺序记录，
+    重新执行时原样返回，不再读取新的状态帧或重复调用 GetSafetyCode、状态读缓存等，保证各次执行走同一分支"""
+    def __init__(self, rpc, robot):
+        self.rpc = rpc
+        self.robot = robot
+        self.values = []
+        self.index = 0
+
+    def __getattr__(self, name):
+        index = self.index
+        self.index += 1
+        if index < len(self.values):
+            return self.values[index]
+        value = getattr(self.rpc, name)
+        if inspect.ismethod(value):
+            value = RobotCallRecord(value)
+        self.values.append(value)
+        return value
+
+    def rewind(self, robot):
+        """换用新的指令代理，从头重放记录的属性值与调用结果"""
+        self.robot = robot
+        self.index = 0
+        for value in self.values:
+            if isinstance(value, RobotCallRecord):
+                value.index = 0
+
+    def call_robot(self, name, *params):
+        return getattr(self.robot, name)(*params)
+
+    def wait_connected(self):
+        pass
+
+
+"""
+@brief  20003 指令通道的 asyncio XML-RPC 传输层
+@note   使用一条 asyncio 流长连接并设置 TCP_NODELAY，请求按调用顺序串行收发；连接被复位或关闭时重建连接并重发一次
+"""
+class RobotAsyncTransport():
+    def __init__(self, ip="192.168.58.2", port=20003, handler="/RPC2"):
+        self.ip = ip
+        self.port = port
+        self.handler = handler
+        self.reader = None
+        self.writer = None
+        self.lock = None
+        self.last_rtt = 0.0
+        self.rtt_hist = RobotHistogram()
+        self.reconnect_num = 0
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.ip, self.port)
+        self.writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def request(self, name, params, timeout=None):
+        """发送一条指令并返回结果，控制器返回 Fault 时抛出 xmlrpc.client.Fault，超过 timeout 秒未完成时抛出 socket.timeout"""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        body = encode_robot_request(name, params)
+        header = ("POST %s HTTP/1.1\r\nHost: %s:%d\r\nUser-Agent: %s\r\nContent-Type: text/xml\r\n"
+                  "Content-Length: %d\r\n\r\n" % (self.handler, self.ip, self.port, xmlrpc.client.Transport.user_agent,
+                                                  len(body))).encode("ascii")
+        async with self.lock:
+            for i in (0, 1):
+                try:
+                    start = time.perf_counter()
+                    status, headers, data = await asyncio.wait_for(self.exchange(header + body), timeout)
+                    self.last_rtt = time.perf_counter() - start
+                    self.rtt_hist.record(int(self.last_rtt * 1e6))
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError) as ex:
+                    # 长连接已失效，重建连接后重发
+                    self.close()
+                    if i:
+                        raise ConnectionResetError("%s: connection lost, %s" % (name, ex)) from ex
+                    self.reconnect_num += 1
+                except asyncio.TimeoutError:
+                    # 响应未读完，连接不可复用
+                    self.close()
+                    raise socket.timeout("%s timed out after %.1f s" % (name, timeout))
+            if headers.get("connection", "").lower() == "close":
+                self.close()
+        if status != 200:
+            raise xmlrpc.client.ProtocolError("%s:%d%s" % (self.ip, self.port, self.handler), status, "", headers)
+        return xmlrpc.client.loads(data)[0][0]
+
+    async def exchange(self, request):
+        if self.writer is None:
+            await self.connect()
+        self.writer.write(request)
+        return await self.read_response()
+
+    async def read_response(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by controller")
+        status = int(line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        return status, headers, data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+
+"""
+@brief  20003 指令批处理，由 RPC.batch() 创建
+@note   调用 SDK 接口时只执行方法体的参数转换并截获其中的 XML-RPC 指令，execute() 或退出 with 块时
+        连续的指令合并为一次 system.multicall 发送，控制器不支持时在长连接上流水线发送，再用各指令的结果回放方法体得到返回值；
+        DIRECT_METHODS 中含多条指令或有其它副作用的接口在轮到时按原方式直接调用，不发指令的本地接口在调用时立即执行，整体顺序不变；
+        请求已经发出但未收到响应(超时、连接中断、HTTP 错误)的指令可能已被控制器部分或全部执行，返回值为 ERR_RPC_OUTCOME_UNKNOWN，
+        序号记录在 unknown 中；只有确定没有发出(连接未建立)的指令返回 ERR_SOCKET_COM_FAILED
+"""
+class RobotBatch():
+    DIRECT_METHODS = frozenset([
+        "MoveJ", "MoveL", "MoveC", "Circle", "NewSpiral", "SplinePTP", "NewSplinePoint", "SegmentWeldStart",
+        "ExtAxisSyncMoveJ", "ExtAxisSyncMoveL", "ExtAxisSyncMoveC", "ForceSensorAutoComputeLoad",
+        "PauseMotion", "ResumeMotion", "StopMove", "ExtAxisStopJog", "ConveyorComDetectTrigger",
+        "PointTableDownLoad", "PointTableUpLoad", "PointTableUpdateLua", "LuaUpload", "AxleLuaUpload", "SoftwareUpgrade",
+        "SetJointFirmwareUpgrade", "SetCtrlFirmwareUpgrade", "SetEndFirmwareUpgrade", "RbLogDownload",
+        "AllDataSourceDownload", "DataPackageDownload", "CloseRPC", "WaitRobotState", "ReplayRobotState"])
+
+    CALL_LOCAL = 0
+    CALL_CAPTURED = 1
+    CALL_DIRECT = 2
+
+    def __init__(self, rpc, multicall=None):
+        self.rpc = rpc
+        self.multicall = multicall
+        self.calls = []
+        self.results = []
+        self.faults = {}
+        self.unknown = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+        else:
+            self.calls = []
+        return False
+
+    def __getattr__(self, name):
+        func = getattr(RPC, name, None)
+        if not name[:1].isupper() or not callable(func):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            return self.add(name, func, args, kwargs)
+        return call
+
+    def add(self, name, func, args, kwargs):
+        """加入一次调用，返回该调用在结果中的序号"""
+        index = len(self.calls)
+        if name in self.DIRECT_METHODS:
+            self.calls.append((self.CALL_DIRECT, func, args, kwargs, None))
+            return index
+        raw = inspect.unwrap(func)
+        shadow = RobotCallShadow(self.rpc, RobotCallProxy(self.rpc))
+        try:
+            result = raw(shadow, *args, **kwargs)
+        except RobotCallCaptured as captured:
+            captured.shadow = shadow
+            self.calls.append((self.CALL_CAPTURED, raw, args, kwargs, captured))
+        else:
+            self.calls.append((self.CALL_LOCAL, func, args, kwargs, result))
+        return index
+
+    def execute(self):
+        """发送已加入的调用，返回按调用顺序排列的返回值"""
+        calls, self.calls = self.calls, []
+        self.results = [None] * len(calls)
+        self.faults = {}
+        self.unknown = []
+        if RPC.is_conect == False:
+            self.results = [RobotError.ERR_RPC_ERROR] * len(calls)
+            return self.results
+        self.rpc.wait_connected()
+        pending = []
+        for i, (kind, func, args, kwargs, value) in enumerate(calls):
+            if kind == self.CALL_CAPTURED:
+                pending.append(i)
+            elif kind == self.CALL_LOCAL:
+                self.results[i] = value
+            else:
+                self.flush(calls, pending)
+                pending = []
+                self.results[i] = func(self.rpc, *args, **kwargs)
+        self.flush(calls, pending)
+        return self.results
+
+    def flush(self, calls, pending):
+        if not pending:
+            return
+        replies, sent = self.send([calls[i][4] for i in pending])
+        for n, i in enumerate(pending):
+            kind, raw, args, kwargs, captured = calls[i]
+            if n >= len(replies):
+                if sent:
+                    self.unknown.append(i)
+                    self.results[i] = RobotError.ERR_RPC_OUTCOME_UNKNOWN
+                else:
+                    self.results[i] = RobotError.ERR_SOCKET_COM_FAILED
+                continue
+            captured.shadow.rewind(RobotCallProxy(self.rpc, replies[n:n + 1], True))
+            try:
+                self.results[i] = raw(captured.shadow, *args, **kwargs)
+            except xmlrpc.client.Fault as fault:
+                self.faults[i] = fault
+                self.results[i] = RobotError.ERR_RPC_ERROR
+            except RobotCallFailed:
+                # 方法体在回放后直接发出的后续指令网络异常
+                self.results[i] = RobotError.ERR_SOCKET_COM_FAILED
+
+    def send(self, captured):
+        """发送截获的指令，返回 (按顺序排列的结果或 Fault, 是否可能已发出)，未收到响应的指令不在列表中"""
+        if self.multicall is None:
+            self.multicall = self.rpc.multicall_supported
+        if self.multicall is not False:
+            try:
+                replies = self.rpc.robot.system.multicall([{"methodName": c.name, "params": list(coerce_robot_params(c.name, c.params))}
+                                                       for c in captured])
+                self.rpc.multicall_supported = self.multicall = True
+                return [reply[0] if isinstance(reply, list) else xmlrpc.client.Fault(reply["faultCode"], reply["faultString"])
+                        for reply in replies], True
+            except (xmlrpc.client.Fault, xmlrpc.client.ProtocolError) as ex:
+                if self.multicall:
+                    return [ex] * len(captured) if isinstance(ex, xmlrpc.client.Fault) else [], True
+                self.rpc.multicall_supported = self.multicall = False
+            except OSError:
+                # 超时或连接中断时无法确定控制器是否已收到请求
+                return [], True
+        bodies = [encode_robot_request(c.name, c.params) for c in captured]
+        pool = self.rpc.robot
+        with pool.command_lock:
+            self.rpc.transport.timeout = pool.call_timeout(captured[0].name, captured[0].params)
+            try:
+                return self.rpc.transport.request_pipelined(pool.host, pool.handler, bodies), True
+            except OSError:
+                return [], False
+
+
+def xmlrpc_timeout(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if RPC.is_conect == False:
+            return -4
+        timeout = kwargs.pop("rpc_timeout", None)
+        if timeout is None:
+            try:
+                return func(self, *args, **kwargs)
+            except RobotCallFailed:
+                return RobotError.ERR_SOCKET_COM_FAILED
+        # 本次调用内发出的全部 20003 指令使用 rpc_timeout 秒超时
+        local = self.robot.local
+        prev_timeout = getattr(local, "timeout", None)
+        local.timeout = timeout
+        try:
+            return func(self, *args, **kwargs)
+        except RobotCallFailed:
+            return RobotError.ERR_SOCKET_COM_FAILED
+        finally:
+            local.timeout = prev_timeout
+
+    return wrapper
+
+
+class RobotError:
+    ERR_SUCCESS = 0
+    ERR_POINTTABLE_NOTFOUND = -7  # 上传文件不存在
+    # ERR_SAVE_FILE_PATH_NOT_FOUND = -6  # 保存文件路径不存在
+    ERR_NOT_FOUND_LUA_FILE = -5  # lua文件不存在
+    ERR_RPC_ERROR = -4
+    ERR_SOCKET_COM_FAILED = -2
+    ERR_OTHER = -1
+    ERROR_RECONN = -8
+    ERR_SOCKET_RECV_FAILED=-16    #/* socket接收失败 */
+    ERR_SOCKET_SEND_FAILED=-15    #/* socket发送失败 */
+    ERR_FILE_OPEN_FAILED=-14    #/* 文件打开失败 */
+    ERR_FILE_TOO_LARGE=-13    #/* 文件大小超限 */
+    ERR_UPLOAD_FILE_ERROR=-12    #/* 上传文件异常 */
+    ERR_FILE_NAME=-11    #/* 文件名称异常 */
+    ERR_DOWN_LOAD_FILE_WRITE_FAILED=-10    #/* 下载文件写入失败 */
+    ERR_DOWN_LOAD_FILE_CHECK_FAILED=-9     #/* 文件下载校验失败 */
+    ERR_DOWN_LOAD_FILE_FAILED=-8     #/* 文件下载失败 */
+    ERR_UPLOAD_FILE_NOT_FOUND=-7     #/* 上传文件存在 */
+    ERR_SAVE_FILE_PATH_NOT_FOUND=-6     #/* 保存文件路径不存在 */
+    ERR_WAIT_TIMEOUT=-17    #/* 等待超时 */
+    ERR_RPC_OUTCOME_UNKNOWN=-18    #/* 指令已发出但未收到响应，控制器是否执行未知 */
+
+
+class RPC():
+    ip_address = "192.168.58.2"
+
+    logger = None
+    log_call_level = None
+    log_call_logger_level = None
+    log_call_disable = 0
+    log_call_recording = False
+    LOG_CALL_TRACE_ONLY = logging.CRITICAL + 10#不输出日志(只记录调用轨迹、接口统计或区间)时的 log_call_level
+    call_trace = None
+    method_stats = None
+    span_tracer = None
+    stopped_span_tracer = None
+    log_output_model = -1
+    queue = Queue(maxsize=10000 * 1024)
+    logging_thread = None
+    is_conect = True
+    ROBOT_REALTIME_PORT = 20004
+    # BUFFER_SIZE = 1024 * 2
+    BUFFER_SIZE = 1024 * 1024
+    thread=  threading.Thread()
+    SDK_state=True
+
+    sock_cli_state_state = False
+    closeRPC_state = False
+    reconnect_lock = False
+    reconnect_flag = False
+    g_sock_com_err = RobotError.ERROR_RECONN
+
+
+    def __init__(self, ip="192.168.58.2", pool_size=4):
+        self.lock = threading.Lock()  # 增加锁
+        self.ip_address = ip
+        link = 'http://' + self.ip_address + ":20003"
+        self.robot = RobotConnectionPool(link, pool_size)#xmlrpc连接池连接机器人20003端口，用于发送机器人指令数据帧
+        self.transport = self.robot.command_transport#20003指令连接传输层
+        self.multicall_supported = None#控制器是否支持 system.multicall，None-未检测
+        self.retry_policy = RobotRetryPolicy()#20003指令网络异常重试策略
+        self.connection_gate = RobotConnectionGate()#断线重连期间 SDK 调用的等待门
+        self.state_read_cache = RobotStateReadCache()#可由状态包推出的查询接口的读缓存
+        self.liveness_monitor = RobotLivenessMonitor(self)#连接存活监测与断线重连，StartLivenessMonitor 开启监测线程
+
+        self.sock_cli_state = None
+        self.robot_realstate_exit = False
+        self.robot_state_pkg = RobotStatePkg#机器人状态数据
+        self.robot_state_snapshot = RobotStateSnapshot(RobotStatePkg(), 0, 0.0, 0)#机器人状态快照，整体替换发布，读取无需加锁
+        self.robot_state_history = None#机器人状态历史环形缓存，SetRobotStateHistory 开启
+        self.robot_state_events = RobotStateEventDispatcher()#机器人状态事件订阅
+        self.robot_state_publisher = None#机器人状态共享内存发布端，StartRobotStatePublisher 开启
+        self.robot_state_recorder = None#机器人状态录制器，StartRobotStateRecord 开启
+        self.robot_state_projection = None#状态字段投影，SetRobotStateProjection 开启
+        self.robot_state_projected = None#按投影解码的最新状态，GetRobotStateProjected 读取
+        self.robot_state_stats = RobotStateStats()#状态通道丢帧、延迟统计
+
+        self.stop_event = threading.Event()  # 停止事件
+        self.connect_to_robot()
+        thread= threading.Thread(target=self.robot_state_routine_thread)#创建线程循环接收机器人状态数据
+        thread.daemon = True
+        thread.start()
+        time.sleep(1)
+        print(self.robot)
+
+
+        try:
+            # 调用 XML-RPC 方法，1 秒内无响应视为未连接
+            self.robot.local.timeout = 1
+            self.robot.GetControllerIP()
+        except socket.timeout:
+            print("XML-RPC connection timed out.")
+            RPC.is_conect = False
+
+        except socket.error as e:
+            print("可能是网络故障，请检查网络连接。")
+            RPC.is_conect = False
+        except Exception as e:
+            print("An error occurred during XML-RPC call:", e)
+            RPC.is_conect = False
+        finally:
+            # 恢复默认超时时间
+            self.robot.local.timeout = None
+
+    def connect_to_robot(self):
+        """连接到机器人的实时端口"""
+        # print("SDK连接机器人")
         self.sock_cli_state = socket.socket(socket.AF_INET, socket.SOCK_STREAM)#套接字连接机器人20004端口，用于实时更新机器人状态数据
         self.sock_cli_state.settimeout(0.3)  # 设置超时时间为 0.05 秒
         try:
@@ -301,54 +3120,15 @@ class RPC():
             return False
         return True
 
-    def reconnect(self):
-        """自动重连"""
-        max_retries = 1000
-        retry_interval = 2  # 2秒
-        # with self.lock:  # 加锁
-        # RPC.is_conect = False
-        # print("断联")
+    def reconnect(self, reason="state channel lost"):
+        """自动重连，20004 状态通道与 20003 指令通道并行重建，都恢复后唤醒等待中的 SDK 调用"""
         self.reconnect_flag = True
-        for attempt in range(max_retries):
-            # print(f"尝试重新连接，第 {attempt + 1} 次")
-            # print(f"尝试重新连接")
-            # 确保 self.sock_cli_state 是新的 socket 对象
-            if self.sock_cli_state:
-                self.sock_cli_state.close()  # 关闭旧的 socket
-                self.sock_cli_state = None  # 重置为 None
-            # 重新初始化 XML-RPC 连接
-            # self.robot = None
-            # link = 'http://' + self.ip_address + ":20003"
-            # self.robot = xmlrpc.client.ServerProxy(link)
-            # 尝试连接
-
-            if self.connect_to_robot():
-                # print("重新连接成功")
-                self.SDK_state = True
-                self.reconnect_flag = False
-                return True
-                # 验证 XML-RPC 连接
-                # try:
-                #     time.sleep(1)
-                #     self.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     time.sleep(1)
-                #     self.Mode(1)  # 调用一个简单的 XML-RPC 方法
-                #     time.sleep(1)
-                #     # self.robot.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     # time.sleep(1)
-                #     # self.robot.Mode(1)  # 调用一个简单的 XML-RPC 方法
-                #     # time.sleep(1)
-                #     # self.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     print("XML-RPC 连接验证成功")
-                #     self.reconnect_flag = False
-                #     # RPC.is_conect = True
-                #     return True
-                # except Exception as ex:
-                #     print("XML-RPC 连接验证失败:", ex)
-                #     self.SDK_state = False
-            else:
-                # print(f"重新连接失败，等待 {retry_interval} 秒后重试...")
-                time.sleep(retry_interval)
+        self.connection_gate.close()
+        if self.liveness_monitor.reestablish(reason):
+            self.SDK_state = True
+            self.reconnect_flag = False
+            self.connection_gate.open()
+            return True
 
         print("已达到最大重连次数，连接失败")
         self.SDK_state = False
@@ -467,6 +3247,71 @@ class RPC():
     def robot_state_routine_thread(self):
         """处理机器人状态数据包的线程例程"""
 
+        recvbuf = bytearray(self.BUFFER_SIZE)
+        recvview = memoryview(recvbuf)
+        parser = RobotStateParser(stats=self.robot_state_stats)
+        while not self.closeRPC_state:
+            try:
+                while not self.robot_realstate_exit and not self.stop_event.is_set():
+                    recvbyte = self.sock_cli_state.recv_into(recvbuf)
+                    if recvbyte <= 0:
+                        self.sock_cli_state.close()
+                        print("接收机器人状态字节 -1")
+                        if not self.reconnect():
+                            return
+                        parser.reset()
+                        continue
+
+                    self.handle_robot_state_data(parser, recvview[:recvbyte], time.time())
+
+            except Exception as ex:
+                if not self.closeRPC_state:
+                    self.sock_cli_state.close()
+                    self.sock_cli_state_state = False
+                    self.SDK_state = False
+                    # print("SDK读取机器人实时数据失败", ex)
+                    self.reconnect()
+                    parser.reset()
+
+    def handle_robot_state_data(self, parser, data, recv_time):
+        """解析一段接收到的数据并发布其中的状态包，实时线程与录制回放共用"""
+        checksum_error_num = parser.checksum_error_num
+        recorder = self.robot_state_recorder
+        parser.raw_frames = [] if recorder is not None else None
+        pkgs = parser.feed(data, recv_time)
+        if recorder is not None:
+            for frame in parser.raw_frames:
+                recorder.write(frame, recv_time)
+        for pkg in pkgs:
+            self.publish_robot_state(pkg, recv_time)
+        if not pkgs and parser.checksum_error_num != checksum_error_num:
+            # 校验失败处理，保留旧版行为只作用于直接读取 robot_state_pkg 的代码：已发布的状态包不可修改，换成关节位置清零的副本；
+            # 快照、历史、共享内存与事件不发布该副本，快照的 recv_time 与 seq 不前进，读缓存与存活监测按最后一帧有效数据判断
+            pkg = RobotStatePkg.from_buffer_copy(self.robot_state_snapshot.pkg)
+            pkg.jt_cur_pos[0] = 0
+            pkg.jt_cur_pos[1] = 0
+            pkg.jt_cur_pos[2] = 0
+            self.robot_state_pkg = pkg
+
+    def publish_robot_state(self, pkg, recv_time):
+        """发布一帧新的机器人状态，快照以单次引用赋值整体替换，读者不会读到混合两帧的数据"""
+        seq = self.robot_state_snapshot.seq + 1
+        self.robot_state_snapshot = RobotStateSnapshot(pkg, pkg.frame_cnt, recv_time, seq)
+        self.robot_state_pkg = pkg
+        history = self.robot_state_history
+        if history is not None:
+            history.append(pkg, recv_time, seq)
+        publisher = self.robot_state_publisher
+        if publisher is not None:
+            publisher.publish(pkg, recv_time, seq)
+        self.robot_state_events.evaluate(self.robot_state_snapshot)
+        projection = self.robot_state_projection
+        if projection is not None:
+            self.robot_state_projected = projection.decode(pkg)
+
+    def robot_state_routine_thread_legacy(self):
+        """处理机器人状态数据包的线程例程(逐字节解析，保留用于性能对比)"""
+
         while not self.closeRPC_state:
             recvbuf = bytearray(self.BUFFER_SIZE)
             tmp_recvbuf = bytearray(self.BUFFER_SIZE)
@@ -715,9 +3560,10 @@ class RPC():
                     # print("SDK读取机器人实时数据失败", ex)
                     self.reconnect()
 
-    def setup_logging(self, output_model=1, file_path="", file_num=5):
+    def setup_logging(self, output_model=1, file_path="", file_num=5, queue_size=10000, drop_policy=0, flush_interval=0.2):
         """用于处理日志"""
         self.logger = logging.getLogger("RPCLogger")
+        self.refresh_log_call_level()
         log_level = logging.DEBUG
         log_handler = None
 
@@ -743,8 +3589,8 @@ class RPC():
             log_handler = BufferedFileHandler(file_path, mode='a', maxBytes=50 * 1024, backupCount=file_num)
         elif output_model == 2:
             RPC.log_output_model = 2
-            log_handler = BufferedFileHandler(file_path, mode='a', maxBytes=50 * 1024, backupCount=file_num)
-            self.start_logging_thread(log_handler)
+            log_handler = self.start_logging_thread(RotatingFileHandler(file_path, maxBytes=50 * 1024, backupCount=file_num),
+                                                    queue_size, drop_policy, flush_interval)
 
         formatter = logging.Formatter('[%(levelname)s] [%(asctime)s pid:%(process)d]  %(message)s')
         if log_handler:
@@ -755,17 +3601,21 @@ class RPC():
 
         return 0  # 如果日志记录设置成功，则返回成功码
 
-    def start_logging_thread(self, log_handler):
-        """创建线程进行日志存储"""
-        logging_thread = LogWriterThread(RPC.queue, log_handler)
+    def start_logging_thread(self, log_handler, queue_size=10000, drop_policy=0, flush_interval=0.2):
+        """创建有界异步日志输出，由其写线程进行日志存储"""
+        self.join_logging_thread()
+        logging_thread = RobotAsyncLogSink(log_handler, queue_size, drop_policy, flush_interval=flush_interval)
         RPC.logging_thread = logging_thread  # 存储日志线程的引用
-        logging_thread.start()
+        return logging_thread
 
     def join_logging_thread(self):
-        """通知日志线程停止"""
-        if RPC.logging_thread is not None:
-            RPC.queue.put(None)  # 通知日志线程停止
-            RPC.logging_thread.join()  # 等待日志线程完成
+        """通知日志线程写完剩余日志后停止"""
+        logging_thread = RPC.logging_thread
+        if logging_thread is not None:
+            RPC.logging_thread = None
+            if self.logger is not None:
+                self.logger.removeHandler(logging_thread)
+            logging_thread.close()  # 等待日志线程完成
 
     def __del__(self):
         """垃圾回收器，类似于析构"""
@@ -776,36 +3626,123 @@ class RPC():
         levels = {1: logging.ERROR, 2: logging.WARNING, 3: logging.INFO, 4: logging.DEBUG}
         log_level = levels.get(lvl, logging.DEBUG)
         self.logger.setLevel(log_level)
+        self.refresh_log_call_level()
         return log_level
 
     def log_call(func):
-        """记录函数调用的日志操作"""
+        """记录函数调用的日志操作，日志关闭(logger 为 None)且未开启调用记录时只检查一次 log_call_level，
+        等级过滤时不格式化任何参数；logger.level 被直接修改时在下一次调用时刷新缓存的等级"""
+        name = func.__name__
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            args_str = ', '.join(map(repr, args))
-            kwargs_str = ', '.join([f"{key}={value}" for key, value in kwargs.items()])
-            if (kwargs_str) == "":
-                call_message = f"Calling {func.__name__}" + f"({args_str}" + ")."
-            else:
-                call_message = f"Calling {func.__name__}" + f"({args_str}" + "," + f"{kwargs_str})."
-
-            self.log_info(call_message)
+            level = self.log_call_level
+            if level is None:
+                return func(self, *args, **kwargs)
+            logger = self.logger
+            if logger is not None and (logger.level != self.log_call_logger_level or
+                                       logger.manager.disable != self.log_call_disable):
+                level = self.refresh_log_call_level()
+                if level is None:
+                    return func(self, *args, **kwargs)
+            if level <= logging.INFO:
+                self.log_call_message(name, args, kwargs)
+            if self.log_call_recording:
+                return self.call_recorded(func, name, level, args, kwargs)
             result = func(self, *args, **kwargs)
-            if isinstance(result, (list, tuple)) and len(result) > 0:
-                if result[0] == 0:
-                    self.log_debug(f"{func.__name__} returned: {result}.")
-                else:
-                    self.log_error(f"{func.__name__} Error occurred. returned: {result}")
-            else:
-                if result == 0:
-                    self.log_debug(f"{func.__name__} returned: {result}.")
-                else:
-                    self.log_error(f"{func.__name__} Error occurred. returned: {result}")
-
+            if level <= logging.ERROR:
+                self.log_call_result(name, level, result)
             return result
 
         return wrapper
 
+    def log_call_message(self, name, args, kwargs):
+        """输出 log_call 的调用日志"""
+        if kwargs:
+            self.logger.info(f"Calling {name}({', '.join(map(repr, args))}," +
+                             ', '.join([f"{key}={value}" for key, value in kwargs.items()]) + ").")
+        else:
+            self.logger.info(f"Calling {name}({', '.join(map(repr, args))}).")
+
+    def log_call_result(self, name, level, result):
+        """按返回的错误码输出 log_call 的返回值日志，返回错误码"""
+        if isinstance(result, (list, tuple)) and len(result) > 0:
+            error = result[0]
+        else:
+            error = result
+        if error != 0:
+            if level <= logging.ERROR:
+                self.logger.error(f"{name} Error occurred. returned: {result}")
+        elif level <= logging.DEBUG:
+            self.logger.debug(f"{name} returned: {result}.")
+        return error
+
+    def call_recorded(self, func, name, level, args, kwargs):
+        """开启调用轨迹、接口统计或区间追踪时由 log_call 调用，计时执行 func 并记录"""
+        start = time.time()
+        perf_start = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except Exception:
+            self.record_call(name, args, kwargs, None, start, perf_start, exception=True)
+            raise
+        self.record_call(name, args, kwargs, result, start, perf_start, level)
+        return result
+
+    def record_call(self, name, args, kwargs, result, start, perf_start, level=None, exception=False):
+        """把一次调用写入调用轨迹、接口统计与区间追踪，level 不为 None 时同时输出返回值日志"""
+        duration = time.perf_counter() - perf_start
+        trace = self.call_trace
+        method_stats = self.method_stats
+        span_tracer = self.span_tracer
+        if exception:
+            if trace is not None:
+                trace.record(name, args, kwargs, None, start, duration, exception=True)
+            if method_stats is not None:
+                method_stats.record(name, int(duration * 1e6), True)
+            if span_tracer is not None:
+                span_tracer.add(name, "sdk", perf_start, perf_start + duration, {"exception": True})
+            return
+        if trace is not None:
+            trace.record(name, args, kwargs, result, start, duration)
+        if level is not None and level <= logging.ERROR:
+            error = self.log_call_result(name, level, result)
+        elif isinstance(result, (list, tuple)) and len(result) > 0:
+            error = result[0]
+        else:
+            error = result
+        if method_stats is not None:
+            method_stats.record(name, int(duration * 1e6), error != 0)
+        if span_tracer is not None:
+            span_tracer.add(name, "sdk", perf_start, perf_start + duration,
+                            {"error": error} if error != 0 and isinstance(error, int) else None)
+
+    def check_log_call_level(self):
+        """返回 log_call 当前使用的日志等级，logger.level 或 logging.disable 被直接修改过时先刷新"""
+        logger = self.logger
+        if logger is not None and (logger.level != self.log_call_logger_level or
+                                   logger.manager.disable != self.log_call_disable):
+            return self.refresh_log_call_level()
+        return self.log_call_level
+
+    def refresh_log_call_level(self):
+        """缓存 log_call 使用的日志等级与 logger.level、logging.disable 的取值，以及是否开启调用轨迹、接口统计或区间追踪，返回新的等级；
+        logger 为 None 且未开启调用记录时为 None，logger 存在但 error 也被过滤时为 LOG_CALL_TRACE_ONLY"""
+        logger = self.logger
+        self.log_call_recording = self.call_trace is not None or self.method_stats is not None or self.span_tracer is not None
+        if logger is not None:
+            self.log_call_logger_level = logger.level
+            self.log_call_disable = logger.manager.disable
+            if logger.isEnabledFor(logging.ERROR):
+                self.log_call_level = logger.getEffectiveLevel()
+            else:
+                self.log_call_level = self.LOG_CALL_TRACE_ONLY
+        elif self.log_call_recording:
+            self.log_call_level = self.LOG_CALL_TRACE_ONLY
+        else:
+            self.log_call_level = None
+        return self.log_call_level
+
     def log_debug(self, message):
         """用于记录debug等级日志"""
         if self.logger:
@@ -854,6 +3791,34 @@ class RPC():
         finally:
             sock1.close()
 
+    def wait_connected(self):
+        """断线重连期间等待连接恢复，超过 connection_gate.timeout 仍未恢复时抛出 RobotConnectionError"""
+        if self.reconnect_flag and not self.connection_gate.wait():
+            raise RobotConnectionError("robot %s reconnect not finished within %.1f s" % (self.ip_address, self.connection_gate.timeout))
+
+    def read_state_packet(self, name, max_age):
+        """状态包接口读取最新状态包，帧龄超过 max_age 时返回 None，由调用方回退到 20003 查询"""
+        return self.state_read_cache.packet(self.robot_state_snapshot, name, max_age)
+
+    def read_state(self, name, max_age):
+        """可由状态包推出的查询接口读取状态包中的结果，不使用状态包或帧龄超过 max_age 时返回 None"""
+        return self.state_read_cache.read(self.robot_state_snapshot, name, max_age)
+
+    def call_robot(self, name, *params):
+        """发送一条 20003 指令，网络异常时按 retry_policy 退避重试；不可重试或重试用尽时记录日志并抛出 RobotCallFailed，
+        由 xmlrpc_timeout 转换为错误码 ERR_SOCKET_COM_FAILED 返回；指定了 rpc_timeout 时重试总时长同样不超过 rpc_timeout"""
+        start = time.monotonic()
+        try:
+            return getattr(self.robot, name)(*params)
+        except OSError as ex:
+            error = ex
+        try:
+            return self.retry_policy.run(name, lambda: getattr(self.robot, name)(*params), error,
+                                         getattr(self.robot.local, "timeout", None), start)
+        except OSError as ex:
+            self.log_error(f"{name} communication failed: {ex!r}")
+            raise RobotCallFailed(name, ex) from ex
+
     """2024.12.23"""
     """   
        @brief 安全代码获取
@@ -861,7 +3826,8 @@ class RPC():
     """
 
     def GetSafetyCode(self):
-        if (self.robot_state_pkg.safety_stop0_state == 1) or (self.robot_state_pkg.safety_stop1_state == 1):
+        pkg = self.robot_state_snapshot.pkg
+        if (pkg.safety_stop0_state == 1) or (pkg.safety_stop1_state == 1):
             return 99
         return 0
     """2024.12.23"""
@@ -893,15 +3859,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetControllerIP(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetControllerIP()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetControllerIP")
         error = _error[0]
         if _error[0] == 0:
             return error, _error[1]
@@ -918,17 +3877,10 @@ class RPC():
     @xmlrpc_timeout
     def Mode(self, state):
         flag = True
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
 
         state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.Mode(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("Mode", state)
 
         return error
 
@@ -941,16 +3893,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def DragTeachSwitch(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         state = int(state)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.DragTeachSwitch(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("DragTeachSwitch", state)
         return error
 
     """   
@@ -963,15 +3908,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def IsInDragTeach(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.IsInDragTeach()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("IsInDragTeach")
         error = _error[0]
         if _error[0] == 0:
             return error, _error[1]
@@ -987,16 +3925,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def RobotEnable(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         state = int(state)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.RobotEnable(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("RobotEnable", state)
         return error
 
     """   
@@ -1017,8 +3948,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StartJOG(self, ref, nb, dir, max_dis, vel=20.0, acc=100.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         ref = int(ref)  # 强制转换为int型
@@ -1027,13 +3957,7 @@ class RPC():
         max_dis = float(max_dis)  # 强制转换为float型
         vel = float(vel)  # 强制转换为float型
         acc = float(acc)  # 强制转换为float型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StartJOG(ref, nb, dir, vel, acc, max_dis)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("StartJOG", ref, nb, dir, vel, acc, max_dis)
         return error
 
     """   
@@ -1045,16 +3969,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StopJOG(self, ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ref = int(ref)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StopJOG(ref)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("StopJOG", ref)
         return error
 
     """   
@@ -1066,15 +3983,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ImmStopJOG(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ImmStopJOG()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ImmStopJOG")
         return error
 
     """   
@@ -1097,37 +4007,26 @@ class RPC():
     @xmlrpc_timeout
     def MoveJ(self, joint_pos, tool, user, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
               exaxis_pos=[0.0, 0.0, 0.0, 0.0], blendT=-1.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
         tool = int(tool)
         user = int(user)
-        desc_pos = list(map(float, desc_pos))
         vel = float(vel)
         acc = float(acc)
         ovl = float(ovl)
-        exaxis_pos = list(map(float, exaxis_pos))
         blendT = float(blendT)
         offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
         if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
                 desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
+            ret = self.call_robot("GetForwardKin", joint_pos)  # 正运动学求解
             if ret[0] == 0:
                 desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveJ(joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
-                                 offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveJ", joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
+                         offset_pos)
         return error
 
     """   
@@ -1158,51 +4057,40 @@ class RPC():
     def MoveL(self, desc_pos, tool, user, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
               blendR=-1.0, blendMode = 0,exaxis_pos=[0.0, 0.0, 0.0, 0.0], search=0, offset_flag=0,
               offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],oacc = 100.0,config=-1,velAccParamMode=0,overSpeedStrategy=0,speedPercent=10):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
         tool = int(tool)
         user = int(user)
-        joint_pos = list(map(float, joint_pos))
         vel = float(vel)
         acc = float(acc)
         ovl = float(ovl)
         blendR = float(blendR)
         blendMode = int(blendMode)
-        exaxis_pos = list(map(float, exaxis_pos))
         search = int(search)
         offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
         oacc = float(oacc)
         config = int(config)
         velAccParamMode = int(velAccParamMode)
         overSpeedStrategy = int(overSpeedStrategy)
         speedPercent = int(speedPercent)
         if (overSpeedStrategy > 0):
-            error = self.robot.JointOverSpeedProtectStart(overSpeedStrategy, speedPercent)
+            error = self.call_robot("JointOverSpeedProtectStart", overSpeedStrategy, speedPercent)
             if error!=0:
                 return error
         if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
                 and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
+            ret = self.call_robot("GetInverseKin", 0, desc_pos, config)  # 逆运动学求解
             if ret[0] == 0:
                 joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error1 = ret[0]
                 return error1
 
-        flag = True
-        while flag:
-            try:
-                error1 = self.robot.MoveL([joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5], desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5], tool, user, vel, acc, ovl, blendR, blendMode, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3], search,offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],oacc,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error1 = self.call_robot("MoveL", [joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5], desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5], tool, user, vel, acc, ovl, blendR, blendMode, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3], search,offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],oacc,velAccParamMode])
 
         if (overSpeedStrategy > 0):
-            error = self.robot.JointOverSpeedProtectEnd()
+            error = self.call_robot("JointOverSpeedProtectEnd")
             if error!=0:
                 return error
 
@@ -1245,8 +4133,7 @@ class RPC():
               vel_t=20.0, acc_t=100.0, exaxis_pos_t=[0.0, 0.0, 0.0, 0.0], offset_flag_t=0,
               offset_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
               ovl=100.0, blendR=-1.0,oacc=100.0,config=-1,velAccParamMode=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos_p = list(map(float, desc_pos_p))
@@ -1277,7 +4164,7 @@ class RPC():
 
         if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
                 and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
+            retp = self.call_robot("GetInverseKin", 0, desc_pos_p, config)  # 逆运动学求解
             if retp[0] == 0:
                 joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
             else:
@@ -1286,21 +4173,15 @@ class RPC():
 
         if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
                 and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
+            rett = self.call_robot("GetInverseKin", 0, desc_pos_t, config)  # 逆运动学求解
             if rett[0] == 0:
                 joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
             else:
                 error = rett[0]
                 return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveC([joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3], offset_flag_p,
-                                         offset_pos_p[0],offset_pos_p[1],offset_pos_p[2],offset_pos_p[3],offset_pos_p[4],offset_pos_p[5], joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5], tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3],
-                                         offset_flag_t, offset_pos_t[0],offset_pos_t[1],offset_pos_t[2],offset_pos_t[3],offset_pos_t[4],offset_pos_t[5], ovl, blendR,oacc,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveC", [joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3], offset_flag_p,
+                                 offset_pos_p[0],offset_pos_p[1],offset_pos_p[2],offset_pos_p[3],offset_pos_p[4],offset_pos_p[5], joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5], tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3],
+                                 offset_flag_t, offset_pos_t[0],offset_pos_t[1],offset_pos_t[2],offset_pos_t[3],offset_pos_t[4],offset_pos_t[5], ovl, blendR,oacc,velAccParamMode])
         return error
 
     """   
@@ -1336,8 +4217,7 @@ class RPC():
                vel_p=20.0, acc_p=0.0, exaxis_pos_p=[0.0, 0.0, 0.0, 0.0], vel_t=20.0, acc_t=0.0,
                exaxis_pos_t=[0.0, 0.0, 0.0, 0.0],
                ovl=100.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], oacc=100.0, blendR=-1,config=-1,velAccParamMode=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos_p = list(map(float, desc_pos_p))
@@ -1367,7 +4247,7 @@ class RPC():
 
         if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
                 and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
+            retp = self.call_robot("GetInverseKin", 0, desc_pos_p, config)  # 逆运动学求解
             if retp[0] == 0:
                 joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
             else:
@@ -1376,22 +4256,16 @@ class RPC():
 
         if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
                 and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
+            rett = self.call_robot("GetInverseKin", 0, desc_pos_t, config)  # 逆运动学求解
             if rett[0] == 0:
                 joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
             else:
                 error = rett[0]
                 return error
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.Circle([joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3],
-                                           joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5],
-                                          tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3], ovl, offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5], oacc, blendR,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("Circle", [joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3],
+                                   joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5],
+                                  tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3], ovl, offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5], oacc, blendR,velAccParamMode])
         return error
 
     # @log_call
@@ -1478,8 +4352,7 @@ class RPC():
     def NewSpiral(self, desc_pos, tool, user, param, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0,
                   exaxis_pos=[0.0, 0.0, 0.0, 0.0],
                   ovl=100.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos = list(map(float, desc_pos))
@@ -1503,24 +4376,18 @@ class RPC():
 
         if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
                 and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
+            ret = self.call_robot("GetInverseKin", 0, desc_pos, config)  # 逆运动学求解
             if ret[0] == 0:
                 joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSpiral([joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5],
-                                              desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5],
-                                              tool, user, vel, acc, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3],
-                                              ovl, offset_flag,
-                                             offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],
-                                              float(param[0]),param[1],param[2],param[3],param[4],int(param[5]),param[6]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("NewSpiral", [joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5],
+                                      desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5],
+                                      tool, user, vel, acc, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3],
+                                      ovl, offset_flag,
+                                     offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],
+                                      float(param[0]),param[1],param[2],param[3],param[4],int(param[5]),param[6]])
         return error
 
     """   
@@ -1532,15 +4399,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoMoveStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoMoveStart()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ServoMoveStart")
         return error
 
     """   
@@ -1552,15 +4412,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoMoveEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoMoveEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ServoMoveEnd")
         return error
 
     """   
@@ -1579,25 +4432,16 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJ(self, joint_pos,axisPos, acc=0.0, vel=0.0, cmdT=0.008, filterT=0.0, gain=0.0, id=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
-        axisPos = list(map(float, axisPos))
         acc = float(acc)
         vel = float(vel)
         cmdT = float(cmdT)
         filterT = float(filterT)
         gain = float(gain)
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJ(joint_pos,axisPos,acc, vel, cmdT, filterT, gain, id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ServoJ", joint_pos,axisPos,acc, vel, cmdT, filterT, gain, id)
         return error
 
     """   
@@ -1617,25 +4461,16 @@ class RPC():
     @xmlrpc_timeout
     def ServoCart(self, mode, desc_pos, pos_gain=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0], acc=0.0, vel=0.0, cmdT=0.008,
                   filterT=0.0, gain=0.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         mode = int(mode)
-        desc_pos = list(map(float, desc_pos))
-        pos_gain = list(map(float, pos_gain))
         acc = float(acc)
         vel = float(vel)
         cmdT = float(cmdT)
         filterT = float(filterT)
         gain = float(gain)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoCart(mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ServoCart", mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain)
         return error
 
     """   
@@ -1647,15 +4482,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJTStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJTStart()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ServoJTStart")
 
         return error
 
@@ -1673,8 +4501,7 @@ class RPC():
     @xmlrpc_timeout
     def ServoJT(self, torque, interval, checkFlag=0, jPowerLimit=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
                 jVelLimit=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         torque = list(map(float, torque))
@@ -1682,13 +4509,7 @@ class RPC():
         checkFlag = int(checkFlag)
         jPowerLimit = list(map(float, jPowerLimit))
         jVelLimit = list(map(float, jVelLimit))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJT(torque, interval, checkFlag, jPowerLimit, jVelLimit)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ServoJT", torque, interval, checkFlag, jPowerLimit, jVelLimit)
 
         return error
 
@@ -1701,15 +4522,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJTEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJTEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ServoJTEnd")
 
         return error
 
@@ -1729,8 +4543,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveCart(self, desc_pos, tool, user, vel=20.0, acc=0.0, ovl=100.0, blendT=-1.0, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos = list(map(float, desc_pos))
@@ -1741,13 +4554,7 @@ class RPC():
         ovl = float(ovl)
         blendT = float(blendT)
         config = int(config)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveCart(desc_pos, tool, user, vel, acc, ovl, blendT, config)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveCart", desc_pos, tool, user, vel, acc, ovl, blendT, config)
 
         return error
 
@@ -1760,15 +4567,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SplineStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplineStart()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SplineStart")
 
         return error
 
@@ -1787,8 +4587,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SplinePTP(self, joint_pos, tool, user, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=100.0, ovl=100.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         joint_pos = list(map(float, joint_pos))
@@ -1800,19 +4599,13 @@ class RPC():
         ovl = float(ovl)
         if ((desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0)
                 and (desc_pos[4] == 0.0) and (desc_pos[5] == 0.0)):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
+            ret = self.call_robot("GetForwardKin", joint_pos)  # 正运动学求解
             if ret[0] == 0:
                 desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplinePTP(joint_pos, desc_pos, tool, user, vel, acc, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SplinePTP", joint_pos, desc_pos, tool, user, vel, acc, ovl)
 
         return error
 
@@ -1825,15 +4618,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SplineEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplineEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SplineEnd")
 
         return error
 
@@ -1847,17 +4633,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def NewSplineStart(self, type, averageTime=2000):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
         averageTime = int(averageTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplineStart(type, averageTime)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("NewSplineStart", type, averageTime)
 
         return error
 
@@ -1880,8 +4659,7 @@ class RPC():
     @xmlrpc_timeout
     def NewSplinePoint(self, desc_pos, tool, user, lastFlag, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=0.0,
                        acc=0.0, ovl=100.0, blendR=0.0, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos = list(map(float, desc_pos))
@@ -1896,19 +4674,13 @@ class RPC():
         config = int(config)
         if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
                 and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
+            ret = self.call_robot("GetInverseKin", 0, desc_pos, config)  # 逆运动学求解
             if ret[0] == 0:
                 joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplinePoint(joint_pos, desc_pos, tool, user, vel, acc, ovl, blendR, lastFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("NewSplinePoint", joint_pos, desc_pos, tool, user, vel, acc, ovl, blendR, lastFlag)
 
         return error
 
@@ -1921,15 +4693,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def NewSplineEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplineEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("NewSplineEnd")
 
         return error
 
@@ -1942,15 +4707,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StopMotion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StopMotion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("StopMotion")
 
         return error
 
@@ -1994,17 +4752,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PointsOffsetEnable(self, flag, offset_pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
         offset_pos = list(map(float, offset_pos))
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.PointsOffsetEnable(flag, offset_pos)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("PointsOffsetEnable", flag, offset_pos)
 
         return error
 
@@ -2017,15 +4768,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PointsOffsetDisable(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PointsOffsetDisable()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("PointsOffsetDisable")
 
         return error
 
@@ -2045,19 +4789,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetDO(self, id, status, smooth=0, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         status = int(status)
         smooth = int(smooth)
         block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetDO(id, status, smooth, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetDO", id, status, smooth, block)
 
         return error
 
@@ -2073,19 +4810,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolDO(self, id, status, smooth=0, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         status = int(status)
         smooth = int(smooth)
         block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolDO(id, status, smooth, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetToolDO", id, status, smooth, block)
 
         return error
 
@@ -2100,18 +4830,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAO(self, id, value, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         value = float(value)
         block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAO(id, value * 40.95, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAO", id, value * 40.95, block)
 
         return error
 
@@ -2126,18 +4849,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolAO(self, id, value, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         value = float(value)
         block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolAO(id, value * 40.95, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetToolAO", id, value * 40.95, block)
 
         return error
 
@@ -2145,29 +4861,31 @@ class RPC():
     @brief  获取控制箱数字量输入
     @param  [in] 必选参数 id:io 编号，范围 [0-15]
     @param  [in] 默认参数 block:0-阻塞，1-非阻塞 默认0
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0  失败-错误码
     @return 返回值（调用成功返回）di: 0-低电平，1-高电平
     """
 
     @log_call
-    # @xmlrpc_timeout
-    def GetDI(self, id, block=0):
+    @xmlrpc_timeout
+    def GetDI(self, id, block=0, max_age=None):
+        pkg = self.read_state_packet("GetDI", max_age)
         id = int(id)
         block = int(block)
-        # _error = self.robot.GetDI(id, block)
-        # error = _error[0]
-        # print(_error)
-        # if _error[0] == 0:
-        #     di = _error[1]
-        #     return error, di
-        # else:
-        #     return error
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetDI", id, block)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
         if 0 <= id < 8:
-            level = (self.robot_state_pkg.cl_dgt_input_l & (0x01 << id)) >> id
+            level = (pkg.cl_dgt_input_l & (0x01 << id)) >> id
             return 0, level
         elif 8 <= id < 16:
             id -= 8
-            level = (self.robot_state_pkg.cl_dgt_input_h & (0x01 << id)) >> id
+            level = (pkg.cl_dgt_input_h & (0x01 << id)) >> id
             return 0, level
         else:
             return -1,None
@@ -2177,25 +4895,28 @@ class RPC():
     @brief  获取工具数字量输入
     @param  [in] 必选参数 id:io 编号，范围 [0~1]
     @param  [in] 默认参数 block:0-阻塞，1-非阻塞 默认0
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）di: 0-低电平，1-高电平
     """
 
     @log_call
-    # @xmlrpc_timeout
-    def GetToolDI(self, id, block=0):
+    @xmlrpc_timeout
+    def GetToolDI(self, id, block=0, max_age=None):
+        pkg = self.read_state_packet("GetToolDI", max_age)
         id = int(id)
         block = int(block)
-        # _error = self.robot.GetToolDI(id, block)
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     di = _error[1]
-        #     return error, di
-        # else:
-        #     return error
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetToolDI", id, block)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
         if 0 <= id < 2:
             id+=1
-            level = (self.robot_state_pkg.tl_dgt_input_l & (0x01 << id)) >> id
+            level = (pkg.tl_dgt_input_l & (0x01 << id)) >> id
             return 0,level
         else:
             return -1,None
@@ -2212,19 +4933,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitDI(self, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         status = int(status)
         maxtime = int(maxtime)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitDI(id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitDI", id, status, maxtime, opt)
 
         return error
 
@@ -2241,20 +4955,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitMultiDI(self, mode, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mode = int(mode)
         id = int(id)
         status = int(status)
         maxtime = int(maxtime)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitMultiDI(mode, id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitMultiDI", mode, id, status, maxtime, opt)
 
         return error
 
@@ -2270,20 +4977,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitToolDI(self, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         id = id+1 #控制器内部1对应di0,2对应di1
         status = int(status)
         maxtime = int(maxtime)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitToolDI(id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitToolDI", id, status, maxtime, opt)
 
         return error
 
@@ -2291,24 +4991,27 @@ class RPC():
     @brief  获取控制箱模拟量输入
     @param  [in] 必选参数 id:io 编号，范围 [0~1]
     @param  [in] 默认参数 block:0-阻塞，1-非阻塞 默认0
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）value: 输入电流或电压值百分比，范围 [0~100] 对应电流值 [0~20mA] 或电压 [0~10V]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetAI(self, id, block=0):
+    def GetAI(self, id, block=0, max_age=None):
+        pkg = self.read_state_packet("GetAI", max_age)
         id = int(id)
         block = int(block)
-        # _error = self.robot.GetAI(id, block)
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     value = _error[1]
-        #     return error, value
-        # else:
-        #     return error
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetAI", id, block)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
         if 0 <= id < 2:
-            return 0,self.robot_state_pkg.cl_analog_input[id] / 40.95
+            return 0,pkg.cl_analog_input[id] / 40.95
         else:
             return -1
 
@@ -2317,91 +5020,90 @@ class RPC():
     @brief  获取工具模拟量输入
     @param  [in] 必选参数 id:io 编号，范围 [0]
     @param  [in] 默认参数 block:0-阻塞，1-非阻塞 默认0
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）value: 输入电流或电压值百分比，范围 [0~100] 对应电流值 [0~20mA] 或电压 [0~10V]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetToolAI(self, id, block=0):
+    def GetToolAI(self, id, block=0, max_age=None):
+        pkg = self.read_state_packet("GetToolAI", max_age)
         id = int(id)
         block = int(block)
-        # _error = self.robot.GetToolAI(id, block)
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     value = _error[1]
-        #     return error, value
-        # else:
-        #     return error
-        return 0, self.robot_state_pkg.tl_anglog_input / 40.95
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetToolAI", id, block)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0, pkg.tl_anglog_input / 40.95
 
     """   
     @brief  获取机器人末端点记录按钮状态
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）按钮状态，0-按下，1-松开
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetAxlePointRecordBtnState(self):
-        # while self.reconnect_flag:
-        #     time.sleep(0.1)
-        # flag = True
-        # while flag:
-        #     try:
-        #         _error = self.robot.GetAxlePointRecordBtnState()
-        #         flag = False
-        #     except socket.error as e:
-        #         flag = True
-        #
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     value = _error[1]
-        #     return error, value
-        # else:
-        #     return error,None
-        return 0,(self.robot_state_pkg.tl_dgt_input_l & 0x10) >> 4
+    def GetAxlePointRecordBtnState(self, max_age=None):
+        pkg = self.read_state_packet("GetAxlePointRecordBtnState", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetAxlePointRecordBtnState")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0,(pkg.tl_dgt_input_l & 0x10) >> 4
 
 
     """   
     @brief  获取机器人末端DO输出状态
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）do_state DO输出状态，do0~do1对应bit1~bit2,从bit0开始
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetToolDO(self):
-        # _error = self.robot.GetToolDO()
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     value = _error[1]
-        #     return error, value
-        # else:
-        #     return error
-        return 0,self.robot_state_pkg.tl_dgt_output_l
+    def GetToolDO(self, max_age=None):
+        pkg = self.read_state_packet("GetToolDO", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetToolDO")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0,pkg.tl_dgt_output_l
 
     """   
     @brief  获取机器人控制器DO输出状态
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功-0,  失败-错误码
     @return 返回值（调用成功返回）do_state_h DO输出状态，co0~co7对应bit0~bit7 do_state_l DO输出状态，do0~do7对应bit0~bit7
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetDO(self):
-        # _error = self.robot.GetDO()
-        # error = _error[0]
-        # if _error[0] == 0:
-        #     do_state_h = _error[1]
-        #     do_state_l = _error[2]
-        #     return error, [do_state_h, do_state_l]
-        # else:
-        #     return error
-        return 0, [self.robot_state_pkg.cl_dgt_output_h,self.robot_state_pkg.cl_dgt_output_l]
+    def GetDO(self, max_age=None):
+        pkg = self.read_state_packet("GetDO", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetDO")
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2]]
+            else:
+                return error,None
+        return 0, [pkg.cl_dgt_output_h,pkg.cl_dgt_output_l]
 
     """   
     @brief  等待控制箱模拟量输入
@@ -2416,20 +5118,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitAI(self, id, sign, value, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         sign = int(sign)
         value = float(value)
         maxtime = int(maxtime)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAI(id, sign, value*40.95, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitAI", id, sign, value*40.95, maxtime, opt)
 
         return error
 
@@ -2446,20 +5141,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitToolAI(self, id, sign, value, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         sign = int(sign)
         value = float(value)
         maxtime = int(maxtime)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitToolAI(id, sign, value*40.95, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitToolAI", id, sign, value*40.95, maxtime, opt)
 
         return error
 
@@ -2476,16 +5164,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSpeed(self, vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         vel = int(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSpeed(vel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetSpeed", vel)
 
         return error
 
@@ -2499,17 +5180,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSysVarValue(self, id, value):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         value = float(value)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSysVarValue(id, value)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetSysVarValue", id, value)
 
         return error
 
@@ -2522,16 +5196,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetToolPoint", point_num)
 
         return error
 
@@ -2545,15 +5212,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeTool(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeTool()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("ComputeTool")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2570,16 +5230,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTcp4RefPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTcp4RefPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTcp4RefPoint", point_num)
 
         return error
 
@@ -2593,15 +5246,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeTcp4(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeTcp4()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("ComputeTcp4")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2623,21 +5269,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolCoord(self, id, t_coord, type, install, toolID, loadNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         t_coord = list(map(float, t_coord))
         type = int(type)
         install = int(install)
         toolID = int(toolID)
         loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolCoord(id, t_coord, type, install, toolID, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetToolCoord", id, t_coord, type, install, toolID, loadNum)
 
         return error
 
@@ -2654,20 +5293,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolList(self, id, t_coord, type, install , loadNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         t_coord = list(map(float, t_coord))
         type = int(type)
         install = int(install)
         loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolList(id, t_coord, type, install, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetToolList", id, t_coord, type, install, loadNum)
 
         return error
 
@@ -2680,16 +5312,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExTCPPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExTCPPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExTCPPoint", point_num)
 
         return error
 
@@ -2703,15 +5328,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeExTCF(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeExTCF()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("ComputeExTCF")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2730,18 +5348,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExToolCoord(self, id, etcp, etool):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         etcp = list(map(float, etcp))
         etool = list(map(float, etool))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExToolCoord(id, etcp, etool)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExToolCoord", id, etcp, etool)
 
         return error
 
@@ -2756,18 +5367,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExToolList(self, id, etcp, etool):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         etcp = list(map(float, etcp))
         etool = list(map(float, etool))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExToolList(id, etcp, etool)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExToolList", id, etcp, etool)
 
         return error
 
@@ -2780,16 +5384,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjCoordPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjCoordPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWObjCoordPoint", point_num)
 
         return error
 
@@ -2804,17 +5401,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeWObjCoord(self, method, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         method = int(method)
         refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeWObjCoord(method, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputeWObjCoord", method, refFrame)
 
         error = _error[0]
         if _error[0] == 0:
@@ -2833,18 +5423,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjCoord(self, id, coord, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         coord = list(map(float, coord))
         refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjCoord(id, coord, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWObjCoord", id, coord, refFrame)
 
         return error
 
@@ -2859,18 +5442,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjList(self, id, coord, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         coord = list(map(float, coord))
         refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjList(id, coord, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWObjList", id, coord, refFrame)
 
         return error
 
@@ -2884,17 +5460,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLoadWeight(self, loadNum, weight):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         loadNum = int(loadNum)
         weight = float(weight)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLoadWeight(loadNum,weight)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetLoadWeight", loadNum,weight)
 
         return error
 
@@ -2907,16 +5476,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotInstallPos(self, method):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         method = int(method)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotInstallPos(method)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetRobotInstallPos", method)
 
         return error
 
@@ -2930,17 +5492,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotInstallAngle(self, yangle, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         yangle = float(yangle)
         zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotInstallAngle(yangle, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetRobotInstallAngle", yangle, zangle)
 
         return error
 
@@ -2956,19 +5511,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLoadCoord(self, x, y, z, loadNum = 0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         x = float(x)
         y = float(y)
         z = float(z)
         loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLoadCoord(x, y, z, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetLoadCoord", x, y, z, loadNum)
 
         return error
 
@@ -2981,16 +5529,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitMs(self, t_ms):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         t_ms = int(t_ms)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitMs(t_ms)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitMs", t_ms)
 
         return error
 
@@ -3009,18 +5550,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAnticollision(self, mode, level, config):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mode = int(mode)
         level = list(map(float, level))
         config = int(config)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAnticollision(mode, level, config)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAnticollision", mode, level, config)
 
         return error
 
@@ -3037,20 +5571,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetCollisionStrategy(self, strategy,safeTime=1000,safeDistance=100,safeVel=250,safetyMargin=[10,10,10,10,10,10]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         strategy = int(strategy)
         safeTime = int(safeTime)
         safeDistance = int(safeDistance)
         safeVel = int(safeVel)
         safetyMargin = list(map(int, safetyMargin))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCollisionStrategy(strategy,safeTime,safeDistance,safeVel,safetyMargin)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetCollisionStrategy", strategy,safeTime,safeDistance,safeVel,safetyMargin)
 
         return error
 
@@ -3063,16 +5590,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLimitPositive(self, p_limit):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         p_limit = list(map(float, p_limit))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLimitPositive(p_limit)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetLimitPositive", p_limit)
 
         return error
 
@@ -3085,16 +5605,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLimitNegative(self, n_limit):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         n_limit = list(map(float, n_limit))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLimitNegative(n_limit)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetLimitNegative", n_limit)
 
         return error
 
@@ -3107,15 +5620,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ResetAllError(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ResetAllError()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ResetAllError")
 
         return error
 
@@ -3128,16 +5634,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FrictionCompensationOnOff(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FrictionCompensationOnOff(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FrictionCompensationOnOff", state)
 
         return error
 
@@ -3150,16 +5649,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_level(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_level(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFrictionValue_level", coeff)
 
         return error
 
@@ -3172,16 +5664,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_wall(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_wall(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFrictionValue_wall", coeff)
 
         return error
 
@@ -3194,16 +5679,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_ceiling(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_ceiling(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFrictionValue_ceiling", coeff)
 
         return error
 
@@ -3216,16 +5694,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_freedom(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_freedom(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFrictionValue_freedom", coeff)
 
         return error
 
@@ -3243,15 +5714,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotInstallAngle(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotInstallAngle()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetRobotInstallAngle")
 
         error = _error[0]
         if error == 0:
@@ -3269,16 +5733,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSysVarValue(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSysVarValue(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetSysVarValue", id)
 
         error = _error[0]
         if error == 0:
@@ -3289,42 +5746,43 @@ class RPC():
     """   
     @brief  获取当前关节位置 (角度)
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） joint_pos=[j1,j2,j3,j4,j5,j6]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualJointPosDegree(self, flag=1):
+    def GetActualJointPosDegree(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualJointPosDegree", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualJointPosDegree(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.jt_cur_pos[0],self.robot_state_pkg.jt_cur_pos[1],self.robot_state_pkg.jt_cur_pos[2],
-                  self.robot_state_pkg.jt_cur_pos[3],self.robot_state_pkg.jt_cur_pos[4],self.robot_state_pkg.jt_cur_pos[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualJointPosDegree", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.jt_cur_pos[0],pkg.jt_cur_pos[1],pkg.jt_cur_pos[2],
+                  pkg.jt_cur_pos[3],pkg.jt_cur_pos[4],pkg.jt_cur_pos[5]]
     """   
     @brief  获取关节当前位置 (弧度)
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） joint_pos=[j1,j2,j3,j4,j5,j6]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualJointPosRadian(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+    def GetActualJointPosRadian(self, flag=1, max_age=None):
+        ret = self.read_state("GetActualJointPosRadian", max_age)
+        if ret is not None:
+            return ret
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetActualJointPosRadian(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetActualJointPosRadian", flag)
 
         error = _error[0]
         if error == 0:
@@ -3335,198 +5793,238 @@ class RPC():
     """   
     @brief  获取关节反馈速度-deg/s
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） speed=[j1,j2,j3,j4,j5,j6]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualJointSpeedsDegree(self, flag=1):
+    def GetActualJointSpeedsDegree(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualJointSpeedsDegree", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualJointSpeedsDegree(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.actual_qd[0],self.robot_state_pkg.actual_qd[1],self.robot_state_pkg.actual_qd[2],
-                  self.robot_state_pkg.actual_qd[3],self.robot_state_pkg.actual_qd[4],self.robot_state_pkg.actual_qd[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualJointSpeedsDegree", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.actual_qd[0],pkg.actual_qd[1],pkg.actual_qd[2],
+                  pkg.actual_qd[3],pkg.actual_qd[4],pkg.actual_qd[5]]
 
     """   
     @brief  获取关节反馈加速度-deg/s^2
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） acc=[j1,j2,j3,j4,j5,j6]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualJointAccDegree(self, flag=1):
+    def GetActualJointAccDegree(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualJointAccDegree", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualJointAccDegree(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.actual_qdd[0],self.robot_state_pkg.actual_qdd[1],self.robot_state_pkg.actual_qdd[2],
-                  self.robot_state_pkg.actual_qdd[3],self.robot_state_pkg.actual_qdd[4],self.robot_state_pkg.actual_qdd[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualJointAccDegree", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.actual_qdd[0],pkg.actual_qdd[1],pkg.actual_qdd[2],
+                  pkg.actual_qdd[3],pkg.actual_qdd[4],pkg.actual_qdd[5]]
 
     """   
     @brief  获取TCP指令合速度
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回）[tcp_speed,ori_speed] tcp_speed 线性合速度 ori_speed 姿态合速度 
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetTargetTCPCompositeSpeed(self, flag=1):
+    def GetTargetTCPCompositeSpeed(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetTargetTCPCompositeSpeed", max_age)
         flag = int(flag)
-        # _error = self.robot.GetTargetTCPCompositeSpeed(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.target_TCP_CmpSpeed[0],self.robot_state_pkg.target_TCP_CmpSpeed[1]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetTargetTCPCompositeSpeed", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2]]
+            else:
+                return error,None
+        return 0,[pkg.target_TCP_CmpSpeed[0],pkg.target_TCP_CmpSpeed[1]]
 
     """   
     @brief  获取TCP反馈合速度
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回）[tcp_speed,ori_speed] tcp_speed 线性合速度 ori_speed 姿态合速度 
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualTCPCompositeSpeed(self, flag=1):
+    def GetActualTCPCompositeSpeed(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualTCPCompositeSpeed", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualTCPCompositeSpeed(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2]]
-        # else:
-        #     return error
-        return 0, [self.robot_state_pkg.actual_TCP_CmpSpeed[0], self.robot_state_pkg.actual_TCP_CmpSpeed[1]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualTCPCompositeSpeed", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2]]
+            else:
+                return error,None
+        return 0, [pkg.actual_TCP_CmpSpeed[0], pkg.actual_TCP_CmpSpeed[1]]
 
     """   
     @brief  获取TCP指令速度
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞  默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） speed [x,y,z,rx,ry,rz]速度 mm/s
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetTargetTCPSpeed(self, flag=1):
+    def GetTargetTCPSpeed(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetTargetTCPSpeed", max_age)
         flag = int(flag)
-        # _error = self.robot.GetTargetTCPSpeed(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.target_TCP_Speed[0],self.robot_state_pkg.target_TCP_Speed[1],self.robot_state_pkg.target_TCP_Speed[2],
-                  self.robot_state_pkg.target_TCP_Speed[3],self.robot_state_pkg.target_TCP_Speed[4],self.robot_state_pkg.target_TCP_Speed[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetTargetTCPSpeed", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.target_TCP_Speed[0],pkg.target_TCP_Speed[1],pkg.target_TCP_Speed[2],
+                  pkg.target_TCP_Speed[3],pkg.target_TCP_Speed[4],pkg.target_TCP_Speed[5]]
 
     """   
     @brief  获取TCP反馈速度
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞  默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0,  失败-错误码
     @return 返回值（调用成功返回） speed [x,y,z,rx,ry,rz]速度
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualTCPSpeed(self, flag=1):
+    def GetActualTCPSpeed(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualTCPSpeed", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualTCPSpeed(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.actual_TCP_Speed[0],self.robot_state_pkg.actual_TCP_Speed[1],self.robot_state_pkg.actual_TCP_Speed[2],
-                  self.robot_state_pkg.actual_TCP_Speed[3],self.robot_state_pkg.actual_TCP_Speed[4],self.robot_state_pkg.actual_TCP_Speed[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualTCPSpeed", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.actual_TCP_Speed[0],pkg.actual_TCP_Speed[1],pkg.actual_TCP_Speed[2],
+                  pkg.actual_TCP_Speed[3],pkg.actual_TCP_Speed[4],pkg.actual_TCP_Speed[5]]
 
     """   
     @brief  获取当前工具位姿
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回） tcp_pose=[x,y,z,rx,ry,rz]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualTCPPose(self, flag=1):
+    def GetActualTCPPose(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualTCPPose", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualTCPPose(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.tl_cur_pos[0],self.robot_state_pkg.tl_cur_pos[1],self.robot_state_pkg.tl_cur_pos[2],
-                  self.robot_state_pkg.tl_cur_pos[3],self.robot_state_pkg.tl_cur_pos[4],self.robot_state_pkg.tl_cur_pos[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualTCPPose", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.tl_cur_pos[0],pkg.tl_cur_pos[1],pkg.tl_cur_pos[2],
+                  pkg.tl_cur_pos[3],pkg.tl_cur_pos[4],pkg.tl_cur_pos[5]]
 
     """   
     @brief  获取当前工具坐标系编号
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回） tool_id:工具坐标系编号
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualTCPNum(self, flag=1):
+    def GetActualTCPNum(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualTCPNum", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualTCPNum(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-        return 0,self.robot_state_pkg.tool
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualTCPNum", flag)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0,pkg.tool
 
     """   
     @brief  获取当前工件坐标系编号 
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回） wobj_id:工件坐标系编号
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualWObjNum(self, flag=1):
+    def GetActualWObjNum(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualWObjNum", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualWObjNum(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-        return 0, self.robot_state_pkg.user
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualWObjNum", flag)
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0, pkg.user
 
     """   
     @brief  获取当前末端法兰位姿
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回） flange_pose=[x,y,z,rx,ry,rz]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetActualToolFlangePose(self, flag=1):
+    def GetActualToolFlangePose(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetActualToolFlangePose", max_age)
         flag = int(flag)
-        # _error = self.robot.GetActualToolFlangePose(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.flange_cur_pos[0],self.robot_state_pkg.flange_cur_pos[1],self.robot_state_pkg.flange_cur_pos[2],
-                  self.robot_state_pkg.flange_cur_pos[3],self.robot_state_pkg.flange_cur_pos[4],self.robot_state_pkg.flange_cur_pos[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetActualToolFlangePose", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.flange_cur_pos[0],pkg.flange_cur_pos[1],pkg.flange_cur_pos[2],
+                  pkg.flange_cur_pos[3],pkg.flange_cur_pos[4],pkg.flange_cur_pos[5]]
     """   
     @brief  逆运动学，笛卡尔位姿求解关节位置
     @param  [in] 必选参数 type:0-绝对位姿 (基坐标系)，1-相对位姿（基坐标系），2-相对位姿（工具坐标系）
@@ -3539,18 +6037,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKin(self, type, desc_pos, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
         desc_pos = list(map(float, desc_pos))
         config = int(config)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKin(type, desc_pos, config)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetInverseKin", type, desc_pos, config)
 
         error = _error[0]
         if error == 0:
@@ -3570,18 +6061,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKinRef(self, type, desc_pos, joint_pos_ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
         desc_pos = list(map(float, desc_pos))
         joint_pos_ref = list(map(float, joint_pos_ref))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKinRef(type, desc_pos, joint_pos_ref)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetInverseKinRef", type, desc_pos, joint_pos_ref)
 
         error = _error[0]
         if error == 0:
@@ -3601,18 +6085,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKinHasSolution(self, type, desc_pos, joint_pos_ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
         desc_pos = list(map(float, desc_pos))
         joint_pos_ref = list(map(float, joint_pos_ref))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKinHasSolution(type, desc_pos, joint_pos_ref)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetInverseKinHasSolution", type, desc_pos, joint_pos_ref)
 
         error = _error[0]
         if error == 0:
@@ -3630,16 +6107,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetForwardKin(self, joint_pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         joint_pos = list(map(float, joint_pos))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForwardKin(joint_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetForwardKin", joint_pos)
 
         error = _error[0]
         if error == 0:
@@ -3650,43 +6120,44 @@ class RPC():
     """   
     @brief  获取当前关节转矩
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回） torques=[j1,j2,j3,j4,j5,j6]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetJointTorques(self, flag=1):
+    def GetJointTorques(self, flag=1, max_age=None):
+        pkg = self.read_state_packet("GetJointTorques", max_age)
         flag = int(flag)
-        # _error = self.robot.GetJointTorques(flag)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.jt_cur_tor[0],self.robot_state_pkg.jt_cur_tor[1],self.robot_state_pkg.jt_cur_tor[2],
-                  self.robot_state_pkg.jt_cur_tor[3],self.robot_state_pkg.jt_cur_tor[4],self.robot_state_pkg.jt_cur_tor[5]]
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetJointTorques", flag)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.jt_cur_tor[0],pkg.jt_cur_tor[1],pkg.jt_cur_tor[2],
+                  pkg.jt_cur_tor[3],pkg.jt_cur_tor[4],pkg.jt_cur_tor[5]]
 
     """   
     @brief  获取当前负载的质量
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）weight  单位 [kg]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetTargetPayload(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+    def GetTargetPayload(self, flag=1, max_age=None):
+        ret = self.read_state("GetTargetPayload", max_age)
+        if ret is not None:
+            return ret
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTargetPayload(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetTargetPayload", flag)
 
         error = _error[0]
         if error == 0:
@@ -3697,23 +6168,20 @@ class RPC():
     """   
     @brief  获取当前负载的质心
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）cog=[x,y,z]: 质心坐标，单位 [mm]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetTargetPayloadCog(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+    def GetTargetPayloadCog(self, flag=1, max_age=None):
+        ret = self.read_state("GetTargetPayloadCog", max_age)
+        if ret is not None:
+            return ret
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTargetPayloadCog(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetTargetPayloadCog", flag)
 
         error = _error[0]
         if error == 0:
@@ -3724,23 +6192,20 @@ class RPC():
     """   
     @brief  获取当前工具坐标系
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）tcp_offset=[x,y,z,rx,ry,rz]: 相对位姿，单位 [mm][°]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetTCPOffset(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+    def GetTCPOffset(self, flag=1, max_age=None):
+        ret = self.read_state("GetTCPOffset", max_age)
+        if ret is not None:
+            return ret
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTCPOffset(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetTCPOffset", flag)
 
         error = _error[0]
         if error == 0:
@@ -3751,23 +6216,20 @@ class RPC():
     """   
     @brief  获取当前工件坐标系
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）wobj_offset=[x,y,z,rx,ry,rz]: 相对位姿，单位 [mm][°]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetWObjOffset(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+    def GetWObjOffset(self, flag=1, max_age=None):
+        ret = self.read_state("GetWObjOffset", max_age)
+        if ret is not None:
+            return ret
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetWObjOffset(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetWObjOffset", flag)
 
         error = _error[0]
         if error == 0:
@@ -3785,16 +6247,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetJointSoftLimitDeg(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetJointSoftLimitDeg(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.call_robot("GetJointSoftLimitDeg", flag)
 
         error = _error[0]
         if error == 0:
@@ -3813,15 +6268,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSystemClock(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSystemClock()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSystemClock")
 
         error = _error[0]
         if error == 0:
@@ -3839,15 +6287,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotCurJointsConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotCurJointsConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetRobotCurJointsConfig")
 
         error = _error[0]
         if error == 0:
@@ -3865,15 +6306,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetDefaultTransVel(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetDefaultTransVel()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetDefaultTransVel")
 
         error = _error[0]
         if error == 0:
@@ -3883,38 +6317,44 @@ class RPC():
 
     """   
     @brief  查询机器人运动是否完成
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）state:0-未完成，1-完成
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetRobotMotionDone(self):
-        # _error = self.robot.GetRobotMotionDone()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-            return 0,self.robot_state_pkg.motion_done
+    def GetRobotMotionDone(self, max_age=None):
+        pkg = self.read_state_packet("GetRobotMotionDone", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetRobotMotionDone")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0,pkg.motion_done
     """   
     @brief  查询机器人错误码
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）[maincode subcode] maincode 主错误码 subcode 子错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetRobotErrorCode(self):
-        # _error = self.robot.GetRobotErrorCode()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2]]
-        # else:
-        #     return error
-        return 0, [self.robot_state_pkg.main_code,self.robot_state_pkg.sub_code]
+    def GetRobotErrorCode(self, max_age=None):
+        pkg = self.read_state_packet("GetRobotErrorCode", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetRobotErrorCode")
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2]]
+            else:
+                return error,None
+        return 0, [pkg.main_code,pkg.sub_code]
 
     """   
     @brief  查询机器人示教管理点位数据
@@ -3926,16 +6366,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotTeachingPoint(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotTeachingPoint(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetRobotTeachingPoint", name)
 
         error = _error[0]
         if error == 0:
@@ -3951,58 +6384,67 @@ class RPC():
 
     """   
     @brief  查询机器人运动队列缓存长度
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）len  缓存长度
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetMotionQueueLength(self):
-        # _error = self.robot.GetMotionQueueLength()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-        return 0, self.robot_state_pkg.mc_queue_len
+    def GetMotionQueueLength(self, max_age=None):
+        pkg = self.read_state_packet("GetMotionQueueLength", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetMotionQueueLength")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0, pkg.mc_queue_len
 
     """   
     @brief  获取机器人急停状态
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）state 急停状态，0-非急停，1-急停
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetRobotEmergencyStopState(self):
-        # _error = self.robot.GetRobotEmergencyStopState()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-        return 0, self.robot_state_pkg.EmergencyStop
+    def GetRobotEmergencyStopState(self, max_age=None):
+        pkg = self.read_state_packet("GetRobotEmergencyStopState", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetRobotEmergencyStopState")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0, pkg.EmergencyStop
 
     """   
     @brief  获取安全停止信号
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）[si0_state,si1_state] si0_state 安全停止信号SI0，0-无效，1-有效 si1_state 安全停止信号SI1，0-无效，1-有效
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetSafetyStopState(self):
-        # _error = self.robot.GetSafetyStopState()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2]]
-        # else:
-        #     return error
+    def GetSafetyStopState(self, max_age=None):
+        pkg = self.read_state_packet("GetSafetyStopState", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetSafetyStopState")
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2]]
+            else:
+                return error,None
 
-        return 0, [self.robot_state_pkg.safety_stop0_state,self.robot_state_pkg.safety_stop1_state]
+        return 0, [pkg.safety_stop0_state,pkg.safety_stop1_state]
 
     """   
     @brief  获取SDK与机器人的通讯状态
@@ -4046,15 +6488,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSSHKeygen(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSSHKeygen()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSSHKeygen")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4075,20 +6510,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSSHScpCmd(self, mode, sshname, sship, usr_file_url, robot_file_url):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mode = int(mode)
         sshname = str(sshname)
         sship = str(sship)
         usr_file_url = str(usr_file_url)
         robot_file_url = str(robot_file_url)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSSHScpCmd(mode, sshname, sship, usr_file_url, robot_file_url)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetSSHScpCmd", mode, sshname, sship, usr_file_url, robot_file_url)
 
         return error
 
@@ -4102,16 +6530,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeFileMD5(self, file_path):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         file_path = str(file_path)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeFileMD5(file_path)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputeFileMD5", file_path)
 
         error = _error[0]
         if _error[0] == 0:
@@ -4131,15 +6552,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSoftwareVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSoftwareVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSoftwareVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4164,15 +6578,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlaveHardVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveHardVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSlaveHardVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4183,15 +6590,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetHardwareversion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveHardVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSlaveHardVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4216,15 +6616,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlaveFirmVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveFirmVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSlaveFirmVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4235,15 +6628,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetFirmwareVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveFirmVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSlaveFirmVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4261,15 +6647,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetDHCompensation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetDHCompensation()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetDHCompensation")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4294,20 +6673,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDParam(self, name, period_ms, type=1, di_choose=0, do_choose=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
         period_ms = int(period_ms)
         type = int(type)
         di_choose = int(di_choose)
         do_choose = int(do_choose)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDParam(type, name, period_ms, di_choose, do_choose)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTPDParam", type, name, period_ms, di_choose, do_choose)
 
         return error
 
@@ -4324,20 +6696,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDStart(self, name, period_ms, type=1, di_choose=0, do_choose=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
         period_ms = int(period_ms)
         type = int(type)
         di_choose = int(di_choose)
         do_choose = int(do_choose)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDStart(type, name, period_ms, di_choose, do_choose)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTPDStart", type, name, period_ms, di_choose, do_choose)
 
         return error
 
@@ -4350,15 +6715,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWebTPDStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWebTPDStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SetWebTPDStop")
 
         return error
 
@@ -4371,16 +6729,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDDelete(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDDelete(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTPDDelete", name)
 
         return error
 
@@ -4393,16 +6744,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadTPD(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadTPD(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LoadTPD", name)
 
         return error
 
@@ -4416,16 +6760,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTPDStartPose(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTPDStartPose(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetTPDStartPose", name)
 
         error = _error[0]
         if error == 0:
@@ -4444,20 +6781,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveTPD(self, name, blend, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         name = str(name)
         blend = int(blend)
         ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTPD(name, blend, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveTPD", name, blend, ovl)
 
         return error
 
@@ -4472,18 +6802,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadTrajectoryJ(self, name, ovl, opt=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
         ovl = float(ovl)
         opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadTrajectoryJ(name, ovl, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LoadTrajectoryJ", name, ovl, opt)
 
         return error
 
@@ -4496,17 +6819,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveTrajectoryJ(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTrajectoryJ()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveTrajectoryJ")
 
         return error
 
@@ -4520,16 +6836,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTrajectoryStartPose(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTrajectoryStartPose(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetTrajectoryStartPose", name)
 
         error = _error[0]
         if error == 0:
@@ -4547,15 +6856,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTrajectoryPointNum(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTrajectoryPointNum()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetTrajectoryPointNum")
 
         error = _error[0]
         if error == 0:
@@ -4572,16 +6874,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJSpeed(self, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJSpeed(ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJSpeed", ovl)
 
         return error
 
@@ -4594,16 +6889,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceTorque(self, ft):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ft = list(map(float, ft))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceTorque(ft)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJForceTorque", ft)
 
         return error
 
@@ -4616,16 +6904,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFx(self, fx):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         fx = float(fx)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFx(fx)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJForceFx", fx)
 
         return error
 
@@ -4638,16 +6919,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFy(self, fy):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         fy = float(fy)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFy(fy)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJForceFy", fy)
 
         return error
 
@@ -4660,16 +6934,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFz(self, fz):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         fz = float(fz)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFy(fz)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJForceFy", fz)
 
         return error
 
@@ -4682,16 +6949,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTx(self, tx):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         tx = float(tx)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(tx)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJTorqueTx", tx)
 
         return error
 
@@ -4704,16 +6964,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTy(self, ty):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ty = float(ty)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(ty)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJTorqueTx", ty)
 
         return error
 
@@ -4726,16 +6979,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTz(self, tz):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         tz = float(tz)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(tz)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetTrajectoryJTorqueTx", tz)
 
         return error
 
@@ -4753,17 +6999,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadDefaultProgConfig(self, flag, program_name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
         program_name = str(program_name)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.LoadDefaultProgConfig(flag, program_name)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("LoadDefaultProgConfig", flag, program_name)
 
         return error
 
@@ -4776,16 +7015,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramLoad(self, program_name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         program_name = str(program_name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramLoad(program_name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ProgramLoad", program_name)
 
         return error
 
@@ -4799,15 +7031,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurrentLine(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetCurrentLine()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetCurrentLine")
 
         error = _error[0]
         if error == 0:
@@ -4824,17 +7049,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramRun(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramRun()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ProgramRun")
 
         return error
 
@@ -4847,15 +7065,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramPause(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramPause()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ProgramPause")
 
         return error
 
@@ -4868,17 +7079,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramResume(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramResume()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ProgramResume")
 
         return error
 
@@ -4891,35 +7095,31 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ProgramStop")
 
         return error
 
     """   
     @brief  获取机器人作业程序执行状态
-    @param  [in] NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）state:1-程序停止或无程序运行，2-程序运行中，3-程序暂停
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetProgramState(self):
-        # _error = self.robot.GetProgramState()
-        # error = _error[0]
-        # if error == 0:
-        #     return error, _error[1]
-        # else:
-        #     return error
-        return 0,self.robot_state_pkg.robot_state
+    def GetProgramState(self, max_age=None):
+        pkg = self.read_state_packet("GetProgramState", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("GetProgramState")
+            error = _error[0]
+            if error == 0:
+                return error, _error[1]
+            else:
+                return error,None
+        return 0,pkg.robot_state
 
     """   
     @brief  获取已加载的作业程序名
@@ -4931,15 +7131,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetLoadedProgram(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetLoadedProgram()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetLoadedProgram")
 
         error = _error[0]
         if error == 0:
@@ -4965,15 +7158,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetGripperConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetGripperConfig")
 
         error = _error[0]
         if error == 0:
@@ -4991,17 +7177,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ActGripper(self, index, action):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         index = int(index)
         action = int(action)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ActGripper(index, action)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ActGripper", index, action)
 
         return error
 
@@ -5023,8 +7202,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveGripper(self, index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         index = int(index)
@@ -5037,13 +7215,7 @@ class RPC():
         rotNum = float(rotNum)
         rotVel = int(rotVel)
         rotTorque = int(rotTorque)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveGripper(index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveGripper", index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque)
 
         return error
 
@@ -5057,15 +7229,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperMotionDone(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetGripperMotionDone()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetGripperMotionDone")
 
         error = _error[0]
         if error == 0:
@@ -5085,19 +7250,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetGripperConfig(self, company, device, softversion=0, bus=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         company = int(company)
         device = int(device)
         softversion = int(softversion)
         bus = int(bus)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetGripperConfig(company, device, softversion, bus)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetGripperConfig", company, device, softversion, bus)
 
         return error
 
@@ -5113,18 +7271,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputePrePick(self, desc_pos, zlength, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         desc_pos = list(map(float, desc_pos))
         zlength = float(zlength)
         zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputePrePick(desc_pos, zlength, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputePrePick", desc_pos, zlength, zangle)
 
         error = _error[0]
         if error == 0:
@@ -5144,18 +7295,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputePostPick(self, desc_pos, zlength, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         desc_pos = list(map(float, desc_pos))
         zlength = float(zlength)
         zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputePostPick(desc_pos, zlength, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputePostPick", desc_pos, zlength, zangle)
 
         error = _error[0]
         if error == 0:
@@ -5181,15 +7325,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_GetConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_GetConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("FT_GetConfig")
 
         error = _error[0]
         if error == 0:
@@ -5209,19 +7346,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_SetConfig(self, company, device, softversion=0, bus=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         company = int(company)
         device = int(device)
         softversion = int(softversion)
         bus = int(bus)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetConfig(company, device, softversion, bus)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_SetConfig", company, device, softversion, bus)
 
         return error
 
@@ -5234,16 +7364,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_Activate(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_Activate(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_Activate", state)
 
         return error
 
@@ -5256,16 +7379,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_SetZero(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetZero(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_SetZero", state)
 
         return error
 
@@ -5279,17 +7395,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_SetRCS(self, ref,coord=[0,0,0,0,0,0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ref = int(ref)
         coord = list(map(float, coord))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetRCS(ref,coord)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_SetRCS", ref,coord)
 
         return error
 
@@ -5303,15 +7412,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_PdIdenCompute(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_PdIdenCompute()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("FT_PdIdenCompute")
 
         error = _error[0]
         if error == 0:
@@ -5328,16 +7430,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_PdIdenRecord(self, tool_id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         tool_id = int(tool_id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_PdIdenRecord(tool_id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_PdIdenRecord", tool_id)
 
         return error
 
@@ -5351,15 +7446,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_PdCogIdenCompute(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_PdCogIdenCompute()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("FT_PdCogIdenCompute")
 
         error = _error[0]
         if error == 0:
@@ -5377,58 +7465,56 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_PdCogIdenRecord(self, tool_id, index):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         tool_id = int(tool_id)
         index = int(index)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_PdCogIdenRecord(tool_id, index)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_PdCogIdenRecord", tool_id, index)
 
         return error
 
     """   
     @brief  获取参考坐标系下力/扭矩数据
-    @param  [in] 必选参数 NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_GetForceTorqueRCS(self):
-        # _error = self.robot.FT_GetForceTorqueRCS(0)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.ft_sensor_data[0],self.robot_state_pkg.ft_sensor_data[1],self.robot_state_pkg.ft_sensor_data[2],
-                  self.robot_state_pkg.ft_sensor_data[3],self.robot_state_pkg.ft_sensor_data[4],self.robot_state_pkg.ft_sensor_data[5]]
+    def FT_GetForceTorqueRCS(self, max_age=None):
+        pkg = self.read_state_packet("FT_GetForceTorqueRCS", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("FT_GetForceTorqueRCS", 0)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.ft_sensor_data[0],pkg.ft_sensor_data[1],pkg.ft_sensor_data[2],
+                  pkg.ft_sensor_data[3],pkg.ft_sensor_data[4],pkg.ft_sensor_data[5]]
 
     """   
     @brief  获取力传感器原始力/扭矩数据
-    @param  [in] 必选参数 NULL
+    @param  [in] 默认参数 max_age：状态包最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；默认None-使用 SetStateReadMaxAge 的设置，均未设置时总是从状态包返回
     @return 错误码 成功- 0, 失败-错误码
     @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_GetForceTorqueOrigin(self):
-        # _error = self.robot.FT_GetForceTorqueOrigin(0)
-        # error = _error[0]
-        # return error
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.ft_sensor_raw_data[0],self.robot_state_pkg.ft_sensor_raw_data[1],self.robot_state_pkg.ft_sensor_raw_data[2],
-                  self.robot_state_pkg.ft_sensor_raw_data[3],self.robot_state_pkg.ft_sensor_raw_data[4],self.robot_state_pkg.ft_sensor_raw_data[5]]
+    def FT_GetForceTorqueOrigin(self, max_age=None):
+        pkg = self.read_state_packet("FT_GetForceTorqueOrigin", max_age)
+        if pkg is None:
+            self.wait_connected()
+            _error = self.call_robot("FT_GetForceTorqueOrigin", 0)
+            error = _error[0]
+            if error == 0:
+                return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+            else:
+                return error,None
+        return 0,[pkg.ft_sensor_raw_data[0],pkg.ft_sensor_raw_data[1],pkg.ft_sensor_raw_data[2],
+                  pkg.ft_sensor_raw_data[3],pkg.ft_sensor_raw_data[4],pkg.ft_sensor_raw_data[5]]
 
     """   
     @brief  碰撞守护
@@ -5445,21 +7531,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_Guard(self, flag, sensor_num, select, force_torque, max_threshold, min_threshold):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
         sensor_num = int(sensor_num)
         select = list(map(int, select))
         force_torque = list(map(float, force_torque))
         max_threshold = list(map(float, max_threshold))
         min_threshold = list(map(float, min_threshold))
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.FT_Guard(flag, sensor_num, select, force_torque, max_threshold, min_threshold)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("FT_Guard", flag, sensor_num, select, force_torque, max_threshold, min_threshold)
 
         return error
 
@@ -5492,8 +7571,7 @@ class RPC():
             M = [0, 0]
         if B is None:
             B = [0, 0]
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
         sensor_id = int(sensor_id)
         select = list(map(int, select))
@@ -5513,14 +7591,8 @@ class RPC():
         filter_Sign = int(filter_Sign)
         posAdapt_sign = int(posAdapt_sign)
         isNoBlock = int(isNoBlock)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.FT_Control(flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis,
-                                              max_ang,polishRadio, filter_Sign, posAdapt_sign,[M[0],M[1],B[0],B[0],threshold[0],threshold[1],adjustCoeff[0],adjustCoeff[1]],isNoBlock)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("FT_Control", flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis,
+                                      max_ang,polishRadio, filter_Sign, posAdapt_sign,[M[0],M[1],B[0],B[0],threshold[0],threshold[1],adjustCoeff[0],adjustCoeff[1]],isNoBlock)
 
         return error
 
@@ -5537,20 +7609,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_SpiralSearch(self, rcs, ft, dr=0.7, max_t_ms=60000, max_vel=5):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         rcs = int(rcs)
         ft = float(ft)
         dr = float(dr)
         max_t_ms = float(max_t_ms)
         max_vel = float(max_vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SpiralSearch(rcs, ft, dr, max_t_ms, max_vel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_SpiralSearch", rcs, ft, dr, max_t_ms, max_vel)
 
         return error
 
@@ -5569,8 +7634,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_RotInsertion(self, rcs, ft, orn, angVelRot=3, angleMax=45, angAccmax=0, rotorn=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         rcs = int(rcs)
         ft = float(ft)
         orn = int(orn)
@@ -5578,13 +7642,7 @@ class RPC():
         angleMax = float(angleMax)
         angAccmax = float(angAccmax)
         rotorn = int(rotorn)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_RotInsertion(rcs, angVelRot, ft, angleMax, orn, angAccmax, rotorn)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_RotInsertion", rcs, angVelRot, ft, angleMax, orn, angAccmax, rotorn)
 
         return error
 
@@ -5602,21 +7660,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_LinInsertion(self, rcs, ft, disMax, linorn, lin_v=1.0, lin_a=1.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         rcs = int(rcs)
         ft = float(ft)
         disMax = float(disMax)
         linorn = int(linorn)
         lin_v = float(lin_v)
         lin_a = float(lin_a)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_LinInsertion(rcs, ft, lin_v, lin_a, disMax, linorn)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_LinInsertion", rcs, ft, lin_v, lin_a, disMax, linorn)
 
         return error
 
@@ -5629,15 +7680,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_CalCenterStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_CalCenterStart()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("FT_CalCenterStart")
 
         return error
 
@@ -5651,15 +7695,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_CalCenterEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_CalCenterEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("FT_CalCenterEnd")
 
         error = _error[0]
         if error == 0:
@@ -5682,21 +7719,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_FindSurface(self, rcs, dir, axis, disMax, ft, lin_v=3.0, lin_a=0.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         rcs = int(rcs)
         dir = int(dir)
         axis = int(axis)
         ft = float(ft)
         lin_v = float(lin_v)
         lin_a = float(lin_a)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_FindSurface(rcs, dir, axis, lin_v, lin_a, disMax, ft)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_FindSurface", rcs, dir, axis, lin_v, lin_a, disMax, ft)
 
         return error
 
@@ -5709,15 +7739,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_ComplianceStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_ComplianceStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("FT_ComplianceStop")
 
         return error
 
@@ -5731,17 +7754,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FT_ComplianceStart(self, p, force):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         p = float(p)
         force = float(force)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_ComplianceStart(p, force)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FT_ComplianceStart", p, force)
 
         return error
 
@@ -5754,15 +7770,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadIdentifyDynFilterInit(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyDynFilterInit()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LoadIdentifyDynFilterInit")
 
         return error
 
@@ -5775,15 +7784,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadIdentifyDynVarInit(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyDynVarInit()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LoadIdentifyDynVarInit")
 
         return error
 
@@ -5798,18 +7800,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadIdentifyMain(self, joint_torque, joint_pos, t):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         joint_torque = list(map(float, joint_torque))
         joint_pos = list(map(float, joint_pos))
         t = float(t)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyMain(joint_torque, joint_pos, t)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LoadIdentifyMain", joint_torque, joint_pos, t)
 
         return error
 
@@ -5824,16 +7819,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadIdentifyGetResult(self, gain):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         gain = list(map(float, gain))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.LoadIdentifyGetResult(gain)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("LoadIdentifyGetResult", gain)
 
         error = _error[0]
         if error == 0:
@@ -5854,18 +7842,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorStartEnd(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorStartEnd(status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorStartEnd", status)
 
         return error
 
@@ -5878,15 +7859,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorPointIORecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointIORecord()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ConveyorPointIORecord")
 
         return error
 
@@ -5899,15 +7873,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorPointARecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointARecord()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ConveyorPointARecord")
 
         return error
 
@@ -5920,15 +7887,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorRefPointRecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorRefPointRecord()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ConveyorRefPointRecord")
 
         return error
 
@@ -5941,15 +7901,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorPointBRecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointBRecord()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ConveyorPointBRecord")
 
         return error
 
@@ -5962,16 +7915,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorIODetect(self, max_t):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         max_t = int(max_t)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorIODetect(max_t)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorIODetect", max_t)
 
         return error
 
@@ -5984,16 +7930,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorGetTrackData(self, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorGetTrackData(mode)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorGetTrackData", mode)
 
         return error
 
@@ -6006,16 +7945,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorTrackStart(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackStart(status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorTrackStart", status)
 
         return error
 
@@ -6028,15 +7960,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorTrackEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ConveyorTrackEnd")
 
         return error
 
@@ -6054,19 +7979,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorSetParam(self, param, followType, startDis=0, endDis=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         param = list(map(float, param))
         followType = int(followType)
         startDis = int(startDis)
         endDis = int(endDis)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorSetParam(param, followType, startDis, endDis)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorSetParam", param, followType, startDis, endDis)
 
         return error
 
@@ -6079,16 +7997,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorCatchPointComp(self, cmp):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         cmp = list(map(float, cmp))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorCatchPointComp(cmp)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorCatchPointComp", cmp)
 
         return error
 
@@ -6107,8 +8018,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorTrackMoveL(self, name, tool, wobj, vel=20, acc=100, ovl=100, blendR=-1.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         name = str(name)
@@ -6118,13 +8028,7 @@ class RPC():
         acc = float(acc)
         ovl = float(ovl)
         blendR = float(blendR)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackMoveL(name, tool, wobj, vel, acc, ovl, blendR, 0, 0)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ConveyorTrackMoveL", name, tool, wobj, vel, acc, ovl, blendR, 0, 0)
 
         return error
 
@@ -6144,18 +8048,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ARCStart(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         arcNum = int(arcNum)
         timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ARCStart(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ARCStart", ioType, arcNum, timeout)
 
         return error
 
@@ -6170,18 +8067,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ARCEnd(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         arcNum = int(arcNum)
         timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ARCEnd(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ARCEnd", ioType, arcNum, timeout)
 
         return error
 
@@ -6198,20 +8088,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetCurrentRelation(self, currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         currentMin = float(currentMin)
         currentMax = float(currentMax)
         outputVoltageMin = float(outputVoltageMin)
         outputVoltageMax = float(outputVoltageMax)
         AOIndex =int(AOIndex)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentRelation(currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetCurrentRelation", currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex)
 
         return error
 
@@ -6228,21 +8111,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetVoltageRelation(self, weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weldVoltageMin = float(weldVoltageMin)
         weldVoltageMax = float(weldVoltageMax)
         outputVoltageMin = float(outputVoltageMin)
         outputVoltageMax = float(outputVoltageMax)
         AOIndex =int(AOIndex)
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageRelation(weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetVoltageRelation", weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex)
 
         return error
 
@@ -6259,17 +8135,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingGetCurrentRelation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
 
         try:
-            flag = True
-            while flag:
-                try:
-                    _error = self.robot.WeldingGetCurrentRelation()
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            _error = self.call_robot("WeldingGetCurrentRelation")
 
             error = _error[0]
             if error == 0:
@@ -6291,17 +8160,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingGetVoltageRelation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
 
         try:
-            flag = True
-            while flag:
-                try:
-                    _error = self.robot.WeldingGetVoltageRelation()
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            _error = self.call_robot("WeldingGetVoltageRelation")
 
             error = _error[0]
             if error == 0:
@@ -6322,19 +8184,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetCurrent(self, ioType, current, AOIndex,blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         current = float(current)
         AOIndex = int(AOIndex)
         blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrent(ioType, current, AOIndex,blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetCurrent", ioType, current, AOIndex,blend)
 
         return error
 
@@ -6350,19 +8205,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetVoltage(self, ioType, voltage, AOIndex,blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         voltage = float(voltage)
         AOIndex = int(AOIndex)
         blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltage(ioType, voltage, AOIndex,blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetVoltage", ioType, voltage, AOIndex,blend)
 
         return error
 
@@ -6390,8 +8238,7 @@ class RPC():
     def WeaveSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
                      weaveLeftRange, weaveRightRange, additionalStayTime, weaveLeftStayTime,
                      weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle=0,weaveRotAngle=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
         weaveType = int(weaveType)
         weaveFrequency = float(weaveFrequency)
@@ -6406,15 +8253,9 @@ class RPC():
         weaveStationary = int(weaveStationary)
         weaveYawAngle = float(weaveYawAngle)
         weaveRotAngle = float(weaveRotAngle)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveSetPara(weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
-                                                weaveLeftRange, weaveRightRange, additionalStayTime,
-                                                weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle,weaveRotAngle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveSetPara", weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
+                                        weaveLeftRange, weaveRightRange, additionalStayTime,
+                                        weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle,weaveRotAngle)
 
         return error
 
@@ -6436,8 +8277,7 @@ class RPC():
     @xmlrpc_timeout
     def WeaveOnlineSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange, weaveLeftStayTime,
                            weaveRightStayTime, weaveCircleRadio, weaveStationary):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
         weaveType = int(weaveType)
         weaveFrequency = float(weaveFrequency)
@@ -6448,15 +8288,9 @@ class RPC():
         weaveCircleRadio = int(weaveCircleRadio)
         weaveStationary = int(weaveStationary)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveOnlineSetPara(weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
-                                                          weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio,
-                                                          weaveStationary)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("WeaveOnlineSetPara", weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
+                                                  weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio,
+                                                  weaveStationary)
 
             return error
         except Exception as e:
@@ -6471,17 +8305,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveStart(self, weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveStart(weaveNum)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("WeaveStart", weaveNum)
 
             return error
         except Exception as e:
@@ -6496,17 +8323,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveEnd(self, weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveEnd(weaveNum)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("WeaveEnd", weaveNum)
 
             return error
         except Exception as e:
@@ -6522,18 +8342,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetForwardWireFeed(self, ioType, wireFeed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         wireFeed = int(wireFeed)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetForwardWireFeed(ioType, wireFeed)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("SetForwardWireFeed", ioType, wireFeed)
 
             return error
         except Exception as e:
@@ -6549,18 +8362,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetReverseWireFeed(self, ioType, wireFeed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         wireFeed = int(wireFeed)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetReverseWireFeed(ioType, wireFeed)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("SetReverseWireFeed", ioType, wireFeed)
 
             return error
         except Exception as e:
@@ -6576,18 +8382,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAspirated(self, ioType, airControl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         airControl = int(airControl)
         try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetAspirated(ioType, airControl)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+            error = self.call_robot("SetAspirated", ioType, airControl)
 
             return error
         except Exception as e:
@@ -6609,18 +8408,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSegmentWeldPoint(self, startPos, endPos, startDistance):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         startPos = list(map(float, startPos))
         endPos = list(map(float, endPos))
         startDistance = float(startDistance)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSegmentWeldPoint(startPos, endPos, startDistance)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetSegmentWeldPoint", startPos, endPos, startDistance)
 
         error = _error[0]
         if error == 0:
@@ -6696,8 +8488,8 @@ class RPC():
         rtn = 0
         # 获取起点到终点之间的距离和各方向角度余弦值
         # print("1",startDesePos,endDesePos)
-        result = self.robot.GetSegWeldDisDir(startDesePos[0], startDesePos[1], startDesePos[2], endDesePos[0],
-                                             endDesePos[1], endDesePos[2])
+        result = self.call_robot("GetSegWeldDisDir", startDesePos[0], startDesePos[1], startDesePos[2], endDesePos[0],
+                                                     endDesePos[1], endDesePos[2])
         # print("result",result)
         if result[0] != 0:
             return int(result[0])
@@ -6705,8 +8497,8 @@ class RPC():
         distance = result[1]
         endOffPos = list(offset_pos)
 
-        rtn = self.robot.MoveJ(startJPos, startDesePos, tool, user, vel, acc, ovl, exaxis_pos, blendR, offset_flag,
-                               offset_pos)
+        rtn = self.call_robot("MoveJ", startJPos, startDesePos, tool, user, vel, acc, ovl, exaxis_pos, blendR, offset_flag,
+                                       offset_pos)
         # print("rtn1", rtn)
         if rtn != 0:
             return rtn
@@ -6719,12 +8511,12 @@ class RPC():
                 weldNum += 1
                 if weldNum * weldLength + noWeldNum * noWeldLength > distance:
 
-                    rtn = self.robot.ARCStart(weldIOType, arcNum, weldTimeout)
+                    rtn = self.call_robot("ARCStart", weldIOType, arcNum, weldTimeout)
                     # print("rtn2", rtn)
                     if rtn != 0:
                         return rtn
                     if isWeave:
-                        rtn = self.robot.WeaveStart(weaveNum)
+                        rtn = self.call_robot("WeaveStart", weaveNum)
                         if rtn != 0:
                             # print("rtn3", rtn)
                             return rtn
@@ -6745,40 +8537,40 @@ class RPC():
                     # tmpWeldDesc = [data[6],data[7],data[8],data[9],data[10],data[11]]
                     # tmpTool = int(data[12])
                     # tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
+                    rtn = self.call_robot("MoveL", endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
+                                                   search, 0, endOffPos)
                     # print("rtn3", rtn,endJPos,endDesePos)
                     if rtn != 0:
-                        self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
+                        self.call_robot("ARCEnd", weldIOType, arcNum, weldTimeout)
                         if isWeave:
-                            rtn = self.robot.WeaveEnd(weaveNum)
+                            rtn = self.call_robot("WeaveEnd", weaveNum)
                             # print("rtn4", rtn)
                             if rtn != 0:
                                 return rtn
                         return rtn
-                    rtn = self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
+                    rtn = self.call_robot("ARCEnd", weldIOType, arcNum, weldTimeout)
                     # print("rtn5", rtn)
                     if rtn != 0:
                         break
                     if isWeave:
-                        rtn = self.robot.WeaveEnd(weaveNum)
+                        rtn = self.call_robot("WeaveEnd", weaveNum)
                         # print("rtn6", rtn)
                         if rtn != 0:
                             break
 
                 else:
-                    rtn = self.robot.ARCStart(weldIOType, arcNum, weldTimeout)
+                    rtn = self.call_robot("ARCStart", weldIOType, arcNum, weldTimeout)
                     # print("rtn7", rtn)
                     if rtn != 0:
                         return rtn
                     if isWeave:
-                        rtn = self.robot.WeaveStart(weaveNum)
+                        rtn = self.call_robot("WeaveStart", weaveNum)
                         # print("rtn8", rtn)
                         if rtn != 0:
                             return rtn
 
-                    getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos,
-                                                                   weldNum * weldLength + noWeldNum * noWeldLength)
+                    getsegmentrtn = self.call_robot("GetSegmentWeldPoint", startDesePos, endDesePos,
+                                                                           weldNum * weldLength + noWeldNum * noWeldLength)
                     # print("rtn9", getsegmentrtn)
                     # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
                     # print("weldNum", weldNum, "weldLength", weldLength)
@@ -6796,23 +8588,23 @@ class RPC():
                     tmpUser = int(data[13])
                     # print("tmpJoint",tmpJoint,tmpWeldDesc,tmpTool,tmpUser)
                     time.sleep(1)
-                    nihao = self.robot.MoveL(tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
+                    nihao = self.call_robot("MoveL", tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
+                                                   search, 0, endOffPos)
                     # print("rtn10nihao", nihao)
                     if nihao != 0:
-                        self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
+                        self.call_robot("ARCEnd", weldIOType, arcNum, weldTimeout)
                         if isWeave:
-                            rtn = self.robot.WeaveEnd(weaveNum)
+                            rtn = self.call_robot("WeaveEnd", weaveNum)
                             # print("rtn11", rtn)
                             if rtn != 0:
                                 return rtn
                         return rtn
-                    rtn = self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
+                    rtn = self.call_robot("ARCEnd", weldIOType, arcNum, weldTimeout)
                     # print("rtn12", rtn)
                     if rtn != 0:
                         return rtn
                     if isWeave:
-                        rtn = self.robot.WeaveEnd(weaveNum)
+                        rtn = self.call_robot("WeaveEnd", weaveNum)
                         # print("rtn13", rtn)
                         if rtn != 0:
                             return rtn
@@ -6835,14 +8627,14 @@ class RPC():
                     # tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
                     # tmpTool = int(data[12])
                     # tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
+                    rtn = self.call_robot("MoveL", endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
+                                                   search, 0, endOffPos)
                     # print("rtn15", rtn,endJPos,endDesePos)
                     if rtn != 0:
                        return rtn
                     break
                 else:
-                    getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
+                    getsegmentrtn = self.call_robot("GetSegmentWeldPoint", startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
                     # print("rtn16", getsegmentrtn,startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
 
                     # print(startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
@@ -6859,8 +8651,8 @@ class RPC():
                     tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
                     tmpTool = int(data[12])
                     tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
+                    rtn = self.call_robot("MoveL", tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
+                                                   search, 0, endOffPos)
                     # print("rtn17", rtn)
                     if rtn != 0:
                         return rtn
@@ -6878,19 +8670,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SegmentWeldEnd(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ioType = int(ioType)
         arcNum = int(arcNum)
         timeout = int(timeout)
 
-        flag = True
-        while flag:
-            try:
-                rtn = self.robot.SegmentWeldEnd(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+        rtn = self.call_robot("SegmentWeldEnd", ioType, arcNum, timeout)
 
         return rtn
 
@@ -6900,13 +8685,30 @@ class RPC():
     @param  [in]默认参数 file_path： 文件保存路径+名称，名称必须是xxx.log的形式，比如/home/fr/linux/fairino.log。
                     默认执行程序所在路径，默认名称fairino_ year+month+data.log(如:fairino_2024_03_13.log);
     @param  [in]默认参数 file_num：滚动存储的文件数量，1~20个，默认值为5。单个文件上限50M;
+    @param  [in]默认参数 queue_size：异步输出模式的日志队列长度(条)，默认10000，队列满时按 drop_policy 丢弃，不阻塞调用线程;
+    @param  [in]默认参数 drop_policy：异步输出模式的丢弃策略，0-丢弃最早的日志，1-丢弃最新的日志，默认0;
+    @param  [in]默认参数 flush_interval：异步输出模式的最长写入间隔(s)，默认0.2，error 日志立即写入;
     @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoggerInit(self, output_model=1, file_path="", file_num=5):
-        return self.setup_logging(output_model, file_path, file_num)
+    def LoggerInit(self, output_model=1, file_path="", file_num=5, queue_size=10000, drop_policy=0, flush_interval=0.2):
+        return self.setup_logging(output_model, file_path, file_num, int(queue_size), int(drop_policy), float(flush_interval))
+
+    """   
+    @brief  获取异步日志输出统计
+    @return 错误码 成功-0  失败-错误码
+    @return 返回值（调用成功返回）stats 字典：emitted_num 提交的日志条数, written_num 已写入条数,
+            dropped_oldest_num/dropped_newest_num 队列满时丢弃的条数, queue_depth 当前队列深度,
+            max_queue_depth 最大队列深度, batch_num 批量写入次数
+    """
+
+    @log_call
+    def GetLogSinkStats(self):
+        if RPC.logging_thread is None:
+            return RobotError.ERR_OTHER,None
+        return 0,RPC.logging_thread.stats()
 
     """   
     @brief  设置日志过滤等级
@@ -6934,7 +8736,7 @@ class RPC():
         if not os.path.exists(save_file_path):
             return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
 
-        rtn = self.robot.PointTableDownload(point_table_name)
+        rtn = self.call_robot("PointTableDownload", point_table_name)
         if rtn == -1:
             return RobotError.ERR_POINTTABLE_NOTFOUND
         elif rtn != 0:
@@ -7007,7 +8809,7 @@ class RPC():
 
         point_table_name = os.path.basename(point_table_file_path)
 
-        rtn = self.robot.PointTableUpload(point_table_name)
+        rtn = self.call_robot("PointTableUpload", point_table_name)
         if rtn != 0:
             return rtn
 
@@ -7061,7 +8863,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PointTableSwitch(self, point_table_name):
-        rtn = self.robot.PointTableSwitch(point_table_name)  # 切换点位表
+        rtn = self.call_robot("PointTableSwitch", point_table_name)  # 切换点位表
         if rtn != 0:
             if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
                 error_str = "PointTable not Found!"
@@ -7083,7 +8885,7 @@ class RPC():
     def PointTableUpdateLua(self, point_table_name, lua_file_name):
         try:
 
-            rtn = self.robot.PointTableSwitch(point_table_name)  # 切换点位表
+            rtn = self.call_robot("PointTableSwitch", point_table_name)  # 切换点位表
             if rtn != 0:
                 if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
                     error_str = "PointTable not Found!"
@@ -7093,7 +8895,7 @@ class RPC():
 
             time.sleep(0.3)  # 增加延时确保切换后后端确实收到切换后的点位表名称
 
-            result = self.robot.PointTableUpdateLua(lua_file_name)
+            result = self.call_robot("PointTableUpdateLua", lua_file_name)
             error_str = result[1]
             if not error_str:
                 error_str = "fail to update lua, please inspect pointtable"
@@ -7115,7 +8917,7 @@ class RPC():
     def __FileDownLoad(self, fileType, fileName, saveFilePath):
         if not os.path.exists(saveFilePath):
             return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
-        rtn = self.robot.FileDownload(fileType, fileName)
+        rtn = self.call_robot("FileDownload", fileType, fileName)
         if rtn == -1:
             return RobotError.ERR_POINTTABLE_NOTFOUND
         elif rtn != 0:
@@ -7190,7 +8992,7 @@ class RPC():
             print("Files larger than 500 MB are not supported!")
             return -1
         file_name = os.path.basename(filePath)
-        rtn = self.robot.FileUpload(fileType, file_name)
+        rtn = self.call_robot("FileUpload", fileType, file_name)
         if rtn != 0:
             return rtn
 
@@ -7242,7 +9044,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def __FileDelete(self, fileType, fileName):
-        rtn = self.robot.FileDelete(fileType, fileName)
+        rtn = self.call_robot("FileDelete", fileType, fileName)
         return rtn
 
     """   
@@ -7264,11 +9066,13 @@ class RPC():
     @return 错误码 成功-0  失败-错误码
     """
 
+    @log_call
+    @xmlrpc_timeout
     def LuaUpload(self, filePath):
         error = self.__FileUpLoad(0, filePath)
         if error == 0:
             file_name = os.path.basename(filePath)
-            _error = self.robot.LuaUpLoadUpdate(file_name)
+            _error = self.call_robot("LuaUpLoadUpdate", file_name)
             tmp_error = _error[0]
             if tmp_error == 0:
                 return tmp_error
@@ -7299,7 +9103,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetLuaList(self):
-        _error = self.robot.GetLuaList()
+        _error = self.call_robot("GetLuaList")
         # size = len(_error)
         error = _error[0]
         if _error[0] == 0:
@@ -7324,22 +9128,15 @@ class RPC():
     @xmlrpc_timeout
     def AuxServoSetParam(self, servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
                          axisMechTransRatio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         servoCompany = int(servoCompany)
         servoModel = int(servoModel)
         servoSoftVersion = int(servoSoftVersion)
         servoResolution = int(servoResolution)
         axisMechTransRatio = float(axisMechTransRatio)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetParam(servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
-                                                    axisMechTransRatio)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetParam", servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
+                                            axisMechTransRatio)
 
         return error
 
@@ -7357,16 +9154,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoGetParam(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AuxServoGetParam(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("AuxServoGetParam", servoId)
 
         error = _error[0]
         if _error[0] == 0:
@@ -7384,17 +9174,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoEnable(self, servoId, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoEnable(servoId, status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoEnable", servoId, status)
 
         return error
 
@@ -7408,17 +9191,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetControlMode(self, servoId, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetControlMode(servoId, mode)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetControlMode", servoId, mode)
 
         return error
 
@@ -7434,19 +9210,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetTargetPos(self, servoId, pos, speed,acc=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         pos = float(pos)
         speed = float(speed)
         acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetPos(servoId, pos, speed,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetTargetPos", servoId, pos, speed,acc)
 
         return error
 
@@ -7461,18 +9230,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetTargetSpeed(self, servoId, speed,acc):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         speed = float(speed)
         acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetSpeed(servoId, speed,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetTargetSpeed", servoId, speed,acc)
 
         return error
 
@@ -7486,17 +9248,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetTargetTorque(self, servoId, torque):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         torque = float(torque)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetTorque(servoId, torque)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetTargetTorque", servoId, torque)
 
         return error
 
@@ -7513,20 +9268,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoHoming(self, servoId, mode, searchVel, latchVel,acc=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
         mode = int(mode)
         searchVel = float(searchVel)
         latchVel = float(latchVel)
         acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoHoming(servoId, mode, searchVel, latchVel,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoHoming", servoId, mode, searchVel, latchVel,acc)
 
         return error
 
@@ -7539,16 +9287,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoClearError(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoClearError(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoClearError", servoId)
 
         return error
 
@@ -7566,16 +9307,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoGetStatus(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AuxServoGetStatus(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("AuxServoGetStatus", servoId)
 
         error = _error[0]
         if _error[0] == 0:
@@ -7592,16 +9326,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServosetStatusID(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetStatusID(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetStatusID", servoId)
 
         return error
 
@@ -7614,16 +9341,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExDevProtocol(self, protocol):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         protocol = int(protocol)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExDevProtocol(protocol)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExDevProtocol", protocol)
 
         return error
 
@@ -7636,15 +9356,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExDevProtocol(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExDevProtocol()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetExDevProtocol")
 
         error = _error[0]
         if _error[0] == 0:
@@ -7661,16 +9374,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOaccScale(self, acc):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOaccScale(acc)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOaccScale", acc)
 
         return error
 
@@ -7686,19 +9392,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AONum = int(AONum)
         maxTCPSpeed = int(maxTCPSpeed)
         maxAOPercent = int(maxAOPercent)
         zeroZoneCmp = int(zeroZoneCmp)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveAOStart(AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveAOStart", AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
 
         return error
 
@@ -7710,15 +9409,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveAOStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveAOStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("MoveAOStop")
 
         return error
 
@@ -7734,19 +9426,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveToolAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AONum = int(AONum)
         maxTCPSpeed = int(maxTCPSpeed)
         maxAOPercent = int(maxAOPercent)
         zeroZoneCmp = int(zeroZoneCmp)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToolAOStart(AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveToolAOStart", AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
 
         return error
 
@@ -7758,15 +9443,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveToolAOStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToolAOStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("MoveToolAOStop")
 
         return error
 
@@ -7789,8 +9467,7 @@ class RPC():
     @xmlrpc_timeout
     def ExtDevSetUDPComParam(self, ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
                              reconnectEnable, reconnectPeriod, reconnectNum,selfConnect):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ip = str(ip)
         port = int(port)
         period = int(period)
@@ -7803,14 +9480,8 @@ class RPC():
         reconnectNum = int(reconnectNum)
         selfConnect = int(selfConnect)
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevSetUDPComParam(ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
-                                                        reconnectEnable, reconnectPeriod, reconnectNum,selfConnect)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtDevSetUDPComParam", ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
+                                                reconnectEnable, reconnectPeriod, reconnectNum,selfConnect)
 
         return error
 
@@ -7831,15 +9502,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtDevGetUDPComParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ExtDevGetUDPComParam()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("ExtDevGetUDPComParam")
 
         if _error[0] == 0:
             return _error[0], [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6], _error[7], _error[8],
@@ -7855,15 +9519,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtDevLoadUDPDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevLoadUDPDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ExtDevLoadUDPDriver")
 
         return error
 
@@ -7875,15 +9532,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtDevUnloadUDPDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUnloadUDPDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ExtDevUnloadUDPDriver")
 
         return error
 
@@ -7895,15 +9545,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtDevUDPClientComReset(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUDPClientComReset()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ExtDevUDPClientComReset")
 
         return error
 
@@ -7915,15 +9558,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtDevUDPClientComClose(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUDPClientComClose()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ExtDevUDPClientComClose")
 
         return error
 
@@ -7936,16 +9572,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotPosToAxis(self, installType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         installType = int(installType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotPosToAxis(installType)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetRobotPosToAxis", installType)
 
         return error
 
@@ -7967,8 +9596,7 @@ class RPC():
     @xmlrpc_timeout
     def SetAxisDHParaConfig(self, axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2, axisDHa3,
                             axisDHa4):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisConfig = int(axisConfig)
         axisDHd1 = float(axisDHd1)
         axisDHd2 = float(axisDHd2)
@@ -7978,14 +9606,8 @@ class RPC():
         axisDHa2 = float(axisDHa2)
         axisDHa3 = float(axisDHa3)
         axisDHa4 = float(axisDHa4)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxisDHParaConfig(axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2,
-                                                       axisDHa3, axisDHa4)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxisDHParaConfig", axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2,
+                                               axisDHa3, axisDHa4)
 
         return error
 
@@ -8011,8 +9633,7 @@ class RPC():
     @xmlrpc_timeout
     def ExtAxisParamConfig(self, axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc, axisLead,
                            encResolution, axisOffect, axisCompany, axisModel, axisEncType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisId = int(axisId)
         axisType = int(axisType)
         axisDirection = int(axisDirection)
@@ -8026,14 +9647,8 @@ class RPC():
         axisCompany = int(axisCompany)
         axisModel = int(axisModel)
         axisEncType = int(axisEncType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisParamConfig(axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc,
-                                                      axisLead, encResolution, axisOffect, axisCompany, axisModel, axisEncType)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisParamConfig", axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc,
+                                              axisLead, encResolution, axisOffect, axisCompany, axisModel, axisEncType)
 
         return error
 
@@ -8049,16 +9664,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExAxisDriverConfig(self, axisId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisId = int(axisId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetExAxisDriverConfig(axisId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("GetExAxisDriverConfig", axisId)
 
         if error[0] == 0:
             return error[0], [error[1], error[2], error[3]]
@@ -8074,16 +9682,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisSetRefPoint(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisSetRefPoint(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisSetRefPoint", pointNum)
 
         return error
 
@@ -8096,15 +9697,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisComputeECoordSys(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisComputeECoordSys()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ExtAxisComputeECoordSys")
 
         return error
 
@@ -8117,16 +9711,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRefPointInExAxisEnd(self, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pos = list(map(float, pos))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRefPointInExAxisEnd(pos[0], pos[1], pos[2], pos[3], pos[4], pos[5])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetRefPointInExAxisEnd", pos[0], pos[1], pos[2], pos[3], pos[4], pos[5])
 
         return error
 
@@ -8139,16 +9726,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PositionorSetRefPoint(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PositionorSetRefPoint(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("PositionorSetRefPoint", pointNum)
 
         return error
 
@@ -8161,15 +9741,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PositionorComputeECoordSys(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.PositionorComputeECoordSys()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("PositionorComputeECoordSys")
 
         error = _error[0]
         if error == 0:
@@ -8189,20 +9762,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisActiveECoordSys(self, axisCoordNum, toolNum, coord, calibFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisCoordNum = int(axisCoordNum)
         toolNum = int(toolNum)
         coord = list(map(float, coord))
         calibFlag = int(calibFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisActiveECoordSys(axisCoordNum, toolNum, coord[0], coord[1], coord[2], coord[3],
-                                                          coord[4], coord[5], calibFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisActiveECoordSys", axisCoordNum, toolNum, coord[0], coord[1], coord[2], coord[3],
+                                                  coord[4], coord[5], calibFlag)
 
         return error
 
@@ -8216,17 +9782,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisServoOn(self, axisID, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisID = int(axisID)
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisServoOn(axisID, status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisServoOn", axisID, status)
 
         return error
 
@@ -8242,19 +9801,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisSetHoming(self, axisID, mode, searchVel, latchVel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         axisID = int(axisID)
         mode = int(mode)
         searchVel = float(searchVel)
         latchVel = float(latchVel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisSetHoming(axisID, mode, searchVel, latchVel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisSetHoming", axisID, mode, searchVel, latchVel)
 
         return error
 
@@ -8271,8 +9823,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisStartJog(self, axisID, direction, vel, acc, maxDistance):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         axisID = int(axisID)
@@ -8280,13 +9831,7 @@ class RPC():
         vel = float(vel)
         acc = float(acc)
         maxDistance = float(maxDistance)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisStartJog(6, axisID, direction, vel, acc, maxDistance)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisStartJog", 6, axisID, direction, vel, acc, maxDistance)
 
         return error
 
@@ -8316,8 +9861,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAuxDO(self, DONum, bOpen, smooth, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
         bOpen = bool(bOpen)
         smooth = bool(smooth)
@@ -8328,13 +9872,7 @@ class RPC():
         print("open_flag",open_flag)
         print("smooth_flag", smooth_flag)
         print("no_block_flag", no_block_flag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxDO(DONum, open_flag, smooth_flag, no_block_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAuxDO", DONum, open_flag, smooth_flag, no_block_flag)
 
         return error
 
@@ -8349,20 +9887,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAuxAO(self, AONum, value, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AONum = int(AONum)
         value = float(value)
         block = bool(block)
         no_block_flag = 0 if block else 1
         value =value
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxAO(AONum, value, no_block_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAuxAO", AONum, value, no_block_flag)
 
         return error
 
@@ -8375,16 +9906,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAuxDIFilterTime(self, filterTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         filterTime = int(filterTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxDIFilterTime(filterTime)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAuxDIFilterTime", filterTime)
 
         return error
 
@@ -8398,17 +9922,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAuxAIFilterTime(self, AINum,filterTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AINum = int(AINum)
         filterTime = int(filterTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxAIFilterTime(AINum,filterTime)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAuxAIFilterTime", AINum,filterTime)
 
         return error
 
@@ -8424,21 +9941,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitAuxDI(self, DINum, bOpen, time, errorAlarm):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DINum = int(DINum)
         bOpen = bool(bOpen)
         open_flag = 0 if bOpen else 1
         time = int(time)
         errorAlarm = bool(errorAlarm)
         errorAlarm_flag = 0 if errorAlarm else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAuxDI(DINum, open_flag, time, errorAlarm_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitAuxDI", DINum, open_flag, time, errorAlarm_flag)
 
         return error
 
@@ -8455,21 +9965,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitAuxAI(self, AINum, sign, value, time, errorAlarm):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AINum = int(AINum)
         sign = int(sign)
         value = int(value)
         time = int(time)
         errorAlarm = bool(errorAlarm)
         errorAlarm_flag = 0 if errorAlarm else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAuxAI(AINum, sign, value, time, errorAlarm_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitAuxAI", AINum, sign, value, time, errorAlarm_flag)
 
         return error
 
@@ -8484,18 +9987,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAuxDI(self, DINum, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DINum = int(DINum)
         isNoBlock = bool(isNoBlock)
         isNoBlock_flag = 0 if isNoBlock else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAuxDI(DINum, isNoBlock_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("GetAuxDI", DINum, isNoBlock_flag)
 
         if error[0] == 0:
             return error[0], error[1]
@@ -8513,18 +10009,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAuxAI(self, AINum, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AINum = int(AINum)
         isNoBlock = bool(isNoBlock)
         isNoBlock_flag = 0 if isNoBlock else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAuxAI(AINum, isNoBlock_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("GetAuxAI", AINum, isNoBlock_flag)
 
         if error[0] == 0:
             return error[0], error[1]
@@ -8542,20 +10031,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisMove(self, pos, ovl, blend=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         pos = list(map(float, pos))
         ovl = float(ovl)
         blend = float(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisMoveJ(0, pos[0], pos[1], pos[2], pos[3], ovl, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ExtAxisMoveJ", 0, pos[0], pos[1], pos[2], pos[3], ovl, blend)
 
         return error
 
@@ -8579,8 +10061,7 @@ class RPC():
     @xmlrpc_timeout
     def ExtAxisSyncMoveJ(self, joint_pos, tool, user, exaxis_pos, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
                          blendT=-1.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         joint_pos = list(map(float, joint_pos))
@@ -8596,23 +10077,17 @@ class RPC():
         offset_pos = list(map(float, offset_pos))
         if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
                 desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
+            ret = self.call_robot("GetForwardKin", joint_pos)  # 正运动学求解
             if ret[0] == 0:
                 desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendT)
+        error = self.call_robot("ExtAxisMoveJ", 1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendT)
         if error != 0:
             return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveJ(joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
-                                         offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveJ", joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
+                                 offset_pos)
 
         return error
 
@@ -8638,8 +10113,7 @@ class RPC():
     @xmlrpc_timeout
     def ExtAxisSyncMoveL(self, desc_pos, tool, user, exaxis_pos, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
                          blendR=-1.0, search=0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos = list(map(float, desc_pos))
@@ -8658,23 +10132,17 @@ class RPC():
 
         if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
                 and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
+            ret = self.call_robot("GetInverseKin", 0, desc_pos, config)  # 逆运动学求解
             if ret[0] == 0:
                 joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
             else:
                 error = ret[0]
                 return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendR)
+        error = self.call_robot("ExtAxisMoveJ", 1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendR)
         if error != 0:
             return error
-        flag = True
-        while flag:
-            try:
-                error = self.MoveL(desc_pos=desc_pos,tool= tool,user= user,vel= vel, acc=acc,ovl= ovl,blendR= blendR,blendMode=0,exaxis_pos= exaxis_pos,search= search,
-                                         offset_flag=offset_flag,offset_pos= offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.MoveL(desc_pos=desc_pos,tool= tool,user= user,vel= vel, acc=acc,ovl= ovl,blendR= blendR,blendMode=0,exaxis_pos= exaxis_pos,search= search,
+                                 offset_flag=offset_flag,offset_pos= offset_pos)
 
         return error
 
@@ -8714,8 +10182,7 @@ class RPC():
                          vel_t=20.0, acc_t=100.0, offset_flag_t=0,
                          offset_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
                          ovl=100.0, blendR=-1.0,config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         desc_pos_p = list(map(float, desc_pos_p))
@@ -8744,7 +10211,7 @@ class RPC():
 
         if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
                 and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
+            retp = self.call_robot("GetInverseKin", 0, desc_pos_p, config)  # 逆运动学求解
             if retp[0] == 0:
                 joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
             else:
@@ -8753,24 +10220,18 @@ class RPC():
 
         if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
                 and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
+            rett = self.call_robot("GetInverseKin", 0, desc_pos_t, config)  # 逆运动学求解
             if rett[0] == 0:
                 joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
             else:
                 error = rett[0]
                 return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos_t[0], exaxis_pos_t[1], exaxis_pos_t[2], exaxis_pos_t[3], ovl, blendR)
+        error = self.call_robot("ExtAxisMoveJ", 1, exaxis_pos_t[0], exaxis_pos_t[1], exaxis_pos_t[2], exaxis_pos_t[3], ovl, blendR)
         if error != 0:
             return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveC(joint_pos_p, desc_pos_p, [tool_p, user_p, vel_p, acc_p], exaxis_pos_p, offset_flag_p,
-                                         offset_pos_p, joint_pos_t, desc_pos_t, [tool_t, user_t, vel_t, acc_t], exaxis_pos_t,
-                                         offset_flag_t, offset_pos_t, ovl, blendR)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveC", joint_pos_p, desc_pos_p, [tool_p, user_p, vel_p, acc_p], exaxis_pos_p, offset_flag_p,
+                                 offset_pos_p, joint_pos_t, desc_pos_t, [tool_t, user_t, vel_t, acc_t], exaxis_pos_t,
+                                 offset_flag_t, offset_pos_t, ovl, blendR)
 
         return error
 
@@ -8789,8 +10250,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WireSearchStart(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         refPos = int(refPos)
         searchVel = float(searchVel)
         searchDis = int(searchDis)
@@ -8798,13 +10258,7 @@ class RPC():
         autoBackVel = float(autoBackVel)
         autoBackDis = int(autoBackDis)
         offectFlag = int(offectFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchStart(refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WireSearchStart", refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
 
         return error
 
@@ -8822,8 +10276,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WireSearchEnd(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         refPos = int(refPos)
         searchVel = float(searchVel)
         searchDis = int(searchDis)
@@ -8831,13 +10284,7 @@ class RPC():
         autoBackVel = float(autoBackVel)
         autoBackDis = int(autoBackDis)
         offectFlag = int(offectFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchEnd(refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WireSearchEnd", refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
 
         return error
 
@@ -8854,8 +10301,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetWireSearchOffset(self, seamType, method,varNameRef,varNameRes):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         seamType = int(seamType)
         method = int(method)
         if(len(varNameRes)!=6):
@@ -8865,14 +10311,8 @@ class RPC():
         varNameRef = list(map(str, varNameRef))
         varNameRes = list(map(str, varNameRes))
 
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWireSearchOffset(seamType, method, varNameRef[0], varNameRef[1], varNameRef[2], varNameRef[3], varNameRef[4], varNameRef[5],
-                                                        varNameRes[0], varNameRes[1], varNameRes[2], varNameRes[3], varNameRes[4], varNameRes[5])
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetWireSearchOffset", seamType, method, varNameRef[0], varNameRef[1], varNameRef[2], varNameRef[3], varNameRef[4], varNameRef[5],
+                                                varNameRes[0], varNameRes[1], varNameRes[2], varNameRes[3], varNameRes[4], varNameRes[5])
 
         error = _error[0]
         if error == 0:
@@ -8888,16 +10328,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WireSearchWait(self,varname):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         varname=str(varname)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchWait(varname)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WireSearchWait", varname)
 
         return error
 
@@ -8910,18 +10343,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetPointToDatabase(self,varName,pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         varName = str(varName)
         pos = list(map(float,pos))
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetPointToDatabase(varName,pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetPointToDatabase", varName,pos)
 
         return error
 
@@ -8952,8 +10378,7 @@ class RPC():
     @xmlrpc_timeout
     def ArcWeldTraceControl(self,flag,delaytime, isLeftRight, klr, tStartLr, stepMaxLr, sumMaxLr, isUpLow, kud, tStartUd, stepMaxUd,
                             sumMaxUd, axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
         delaytime = float(delaytime)
         isLeftRight = int(isLeftRight)
@@ -8974,14 +10399,8 @@ class RPC():
         offsetType = int(offsetType)
         offsetParameter = int(offsetParameter)
 
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.ArcWeldTraceControl(flag,delaytime, isLeftRight, [klr, tStartLr, stepMaxLr, sumMaxLr], isUpLow, [kud, tStartUd, stepMaxUd,
-                                                       sumMaxUd], axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("ArcWeldTraceControl", flag,delaytime, isLeftRight, [klr, tStartLr, stepMaxLr, sumMaxLr], isUpLow, [kud, tStartUd, stepMaxUd,
+                                               sumMaxUd], axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter)
 
         return error
 
@@ -8993,16 +10412,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceExtAIChannelConfig(self,channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceExtAIChannelConfig(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ArcWeldTraceExtAIChannelConfig", channel)
 
         return error
 
@@ -9024,8 +10436,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def EndForceDragControl(self, status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag, forceCollisionFlag, M, B, K, F, Fmax, Vmax):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         asaptiveFlag = int(asaptiveFlag)
         interfereDragFlag = int(interfereDragFlag)
@@ -9037,13 +10448,7 @@ class RPC():
         Fmax = float(Fmax)
         Vmax = float(Vmax)
         forceCollisionFlag = int(forceCollisionFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.EndForceDragControl(status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag,forceCollisionFlag, M, B, K, F, Fmax, Vmax)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("EndForceDragControl", status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag,forceCollisionFlag, M, B, K, F, Fmax, Vmax)
 
         return error
 
@@ -9056,16 +10461,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetForceSensorDragAutoFlag(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorDragAutoFlag(status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetForceSensorDragAutoFlag", status)
 
         return error
 
@@ -9084,8 +10482,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ForceAndJointImpedanceStartStop(self,status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         impedanceFlag = int(impedanceFlag)
         if((len(lamdeDain)!=6)or(len(KGain)!=6)or(len(BGain)!=6)):
@@ -9095,13 +10492,7 @@ class RPC():
         BGain = list(map(float,BGain))
         dragMaxTcpVel = float(dragMaxTcpVel)
         dragMaxTcpOriVel = float(dragMaxTcpOriVel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ForceAndJointImpedanceStartStop(status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ForceAndJointImpedanceStartStop", status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel)
 
         return error
 
@@ -9116,15 +10507,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetForceAndTorqueDragState(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceAndTorqueDragState()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetForceAndTorqueDragState")
 
         error = _error[0]
         if error == 0:
@@ -9141,16 +10525,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetForceSensorPayload(self,weight):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weight = float(weight)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorPayload(weight)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetForceSensorPayload", weight)
 
         return error
 
@@ -9165,18 +10542,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetForceSensorPayloadCog(self,x,y,z):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         x = float(x)
         y = float(y)
         z = float(z)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorPayloadCog(x,y,z)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetForceSensorPayloadCog", x,y,z)
 
         return error
 
@@ -9189,15 +10559,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetForceSensorPayload(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceSensorPayload()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetForceSensorPayload")
 
         error = _error[0]
         if error == 0:
@@ -9217,15 +10580,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetForceSensorPayloadCog(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceSensorPayloadCog()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetForceSensorPayloadCog")
 
         error = _error[0]
         if error == 0:
@@ -9281,7 +10637,7 @@ class RPC():
         if rtn!=0:
             return rtn,None,None
 
-        _error = self.robot.ForceSensorComputeLoad()
+        _error = self.call_robot("ForceSensorComputeLoad")
         error = _error[0]
         self.MoveJ(start_joint,0,0,vel=10)
         if error == 0:
@@ -9297,15 +10653,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ForceSensorSetSaveDataFlag(self,recordCount):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ForceSensorSetSaveDataFlag(recordCount)
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ForceSensorSetSaveDataFlag", recordCount)
 
         return error
 
@@ -9319,15 +10668,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ForceSensorComputeLoad(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ForceSensorComputeLoad()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("ForceSensorComputeLoad")
 
         error = _error[0]
         if error == 0:
@@ -9347,20 +10689,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AxleSensorConfig(self,idCompany, idDevice, idSoftware, idBus):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         idCompany = int(idCompany)
         idDevice = int(idDevice)
         idSoftware = int(idSoftware)
         idBus = int(idBus)
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorConfig(idCompany, idDevice, idSoftware, idBus)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AxleSensorConfig", idCompany, idDevice, idSoftware, idBus)
 
         return error
 
@@ -9374,15 +10709,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AxleSensorConfigGet(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AxleSensorConfigGet()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("AxleSensorConfigGet")
 
         error = _error[0]
         if error == 0:
@@ -9399,16 +10727,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AxleSensorActivate(self,actFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         actFlag = int(actFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorActivate(actFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AxleSensorActivate", actFlag)
 
         return error
 
@@ -9427,8 +10748,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AxleSensorRegWrite(self,devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         devAddr = int(devAddr)
         regHAddr = int(regHAddr)
         regLAddr = int(regLAddr)
@@ -9436,13 +10756,7 @@ class RPC():
         data1 = int(data1)
         data2 = int(data2)
         isNoBlock = int(isNoBlock)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorRegWrite(devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AxleSensorRegWrite", devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock)
 
         return error
 
@@ -9455,16 +10769,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetCtlBoxDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetCtlBoxDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetCtlBoxDO", resetFlag)
 
         return error
 
@@ -9477,16 +10784,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetCtlBoxAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetCtlBoxAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetCtlBoxAO", resetFlag)
 
         return error
 
@@ -9499,16 +10799,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetAxleDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetAxleDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetAxleDO", resetFlag)
 
         return error
 
@@ -9521,16 +10814,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetAxleAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetAxleAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetAxleAO", resetFlag)
 
         return error
 
@@ -9543,16 +10829,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetExtDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetExtDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetExtDO", resetFlag)
 
         return error
 
@@ -9565,16 +10844,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetExtAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetExtAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetExtAO", resetFlag)
 
         return error
 
@@ -9587,16 +10859,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetOutputResetSmartToolDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetSmartToolDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetOutputResetSmartToolDO", resetFlag)
 
         return error
 
@@ -9610,16 +10875,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveStartSim(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveStartSim(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveStartSim", weaveNum)
 
         return error
 
@@ -9632,16 +10890,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveEndSim(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveEndSim(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveEndSim", weaveNum)
 
         return error
 
@@ -9654,16 +10905,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveInspectStart(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveInspectStart(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveInspectStart", weaveNum)
 
         return error
 
@@ -9676,16 +10920,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeaveInspectEnd(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveInspectEnd(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveInspectEnd", weaveNum)
 
         return error
 
@@ -9709,8 +10946,7 @@ class RPC():
     @xmlrpc_timeout
     def WeldingSetProcessParam(self, id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage, endCurrent,
                                endVoltage, endTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         startCurrent = float(startCurrent)
         startVoltage = float(startVoltage)
@@ -9720,14 +10956,8 @@ class RPC():
         endCurrent = float(endCurrent)
         endVoltage = float(endVoltage)
         endTime = float(endTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetProcessParam(id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage,
-                                                          endCurrent, endVoltage, endTime)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetProcessParam", id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage,
+                                                  endCurrent, endVoltage, endTime)
 
         return error
 
@@ -9748,16 +10978,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingGetProcessParam(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetProcessParam(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("WeldingGetProcessParam", id)
 
         error = _error[0]
         if error == 0:
@@ -9774,16 +10997,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAirControlExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAirControlExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAirControlExtDoNum", DONum)
 
         return error
 
@@ -9796,16 +11012,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetArcStartExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetArcStartExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetArcStartExtDoNum", DONum)
 
         return error
 
@@ -9818,16 +11027,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWireReverseFeedExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireReverseFeedExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWireReverseFeedExtDoNum", DONum)
 
         return error
 
@@ -9840,16 +11042,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWireForwardFeedExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireForwardFeedExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWireForwardFeedExtDoNum", DONum)
 
         return error
 
@@ -9862,16 +11057,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetArcDoneExtDiNum(self,DINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DINum = int(DINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetArcDoneExtDiNum(DINum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetArcDoneExtDiNum", DINum)
 
         return error
 
@@ -9884,16 +11072,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWeldReadyExtDiNum(self,DINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DINum = int(DINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldReadyExtDiNum(DINum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWeldReadyExtDiNum", DINum)
 
         return error
 
@@ -9907,17 +11088,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExtDIWeldBreakOffRecover(self,reWeldDINum, abortWeldDINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         reWeldDINum = int(reWeldDINum)
         abortWeldDINum = int(abortWeldDINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExtDIWeldBreakOffRecover(reWeldDINum, abortWeldDINum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExtDIWeldBreakOffRecover", reWeldDINum, abortWeldDINum)
 
         return error
 
@@ -9933,17 +11107,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetCollisionDetectionMethod(self,method,thresholdMode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         method = int(method)
         thresholdMode = int(thresholdMode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCollisionDetectionMethod(method,thresholdMode)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetCollisionDetectionMethod", method,thresholdMode)
 
         return error
 
@@ -9956,16 +11123,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetStaticCollisionOnOff(self,status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetStaticCollisionOnOff(status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetStaticCollisionOnOff", status)
 
         return error
 
@@ -9979,17 +11139,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetPowerLimit(self,status, power):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         power = float(power)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetPowerLimit(status, power)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetPowerLimit", status, power)
 
         return error
 
@@ -10002,16 +11155,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotRealtimeStateSamplePeriod(self,period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotRealtimeStateSamplePeriod(period)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetRobotRealtimeStateSamplePeriod", period)
 
         return error
 
@@ -10025,15 +11171,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotRealtimeStateSamplePeriod(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotRealtimeStateSamplePeriod()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetRobotRealtimeStateSamplePeriod")
 
         error = _error[0]
         if error == 0:
@@ -10051,8 +11190,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetJointDriverTorque(self):
-        return 0,[self.robot_state_pkg.jointDriverTorque[0],self.robot_state_pkg.jointDriverTorque[1],self.robot_state_pkg.jointDriverTorque[2],
-                  self.robot_state_pkg.jointDriverTorque[3],self.robot_state_pkg.jointDriverTorque[4],self.robot_state_pkg.jointDriverTorque[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0,[pkg.jointDriverTorque[0],pkg.jointDriverTorque[1],pkg.jointDriverTorque[2],
+                  pkg.jointDriverTorque[3],pkg.jointDriverTorque[4],pkg.jointDriverTorque[5]]
 
 
     """   
@@ -10064,8 +11204,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetJointDriverTemperature (self):
-        return 0,[self.robot_state_pkg.jointDriverTemperature [0],self.robot_state_pkg.jointDriverTemperature [1],self.robot_state_pkg.jointDriverTemperature[2],
-                  self.robot_state_pkg.jointDriverTemperature [3],self.robot_state_pkg.jointDriverTemperature[4],self.robot_state_pkg.jointDriverTemperature[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0,[pkg.jointDriverTemperature [0],pkg.jointDriverTemperature [1],pkg.jointDriverTemperature[2],
+                  pkg.jointDriverTemperature [3],pkg.jointDriverTemperature[4],pkg.jointDriverTemperature[5]]
 
 
 
@@ -10078,15 +11219,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceReplayStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceReplayStart()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ArcWeldTraceReplayStart")
 
         return error
 
@@ -10100,15 +11234,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceReplayEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceReplayEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ArcWeldTraceReplayEnd")
 
         return error
 
@@ -10127,22 +11254,15 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MultilayerOffsetTrsfToBase(self,pointo,pointX,pointZ,dx,dz,dry):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pointo =list(map(float,pointo))
         pointX = list(map(float, pointX))
         pointZ = list(map(float, pointZ))
         dx = float(dx)
         dz = float(dz)
         dry = float(dry)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.MultilayerOffsetTrsfToBase(pointo[0],pointo[1],pointo[2],
-                                                               pointX[0],pointX[1],pointX[2],pointZ[0],pointZ[1],pointZ[2],dx,dz,dry)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("MultilayerOffsetTrsfToBase", pointo[0],pointo[1],pointo[2],
+                                                       pointX[0],pointX[1],pointX[2],pointZ[0],pointZ[1],pointZ[2],dx,dz,dry)
 
         error = _error[0]
         if error == 0:
@@ -10159,16 +11279,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AngularSpeedStart(self, ratio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ratio = int(ratio)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AngularSpeedStart(ratio)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AngularSpeedStart", ratio)
 
         return error
 
@@ -10180,15 +11293,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AngularSpeedEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AngularSpeedEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("AngularSpeedEnd")
 
         return error
 
@@ -10207,7 +11313,7 @@ class RPC():
         print("__FileUpLoad", error)
         if 0==error:
             self.log_info("Software Upload success!")
-            error =self.robot.SoftwareUpgrade()
+            error =self.call_robot("SoftwareUpgrade")
             if 0!=error:
                 return error
             if block:
@@ -10239,7 +11345,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSoftwareUpgradeState(self):
-        error = self.robot_state_pkg.softwareUpgradeState
+        pkg = self.robot_state_snapshot.pkg
+        error = pkg.softwareUpgradeState
         return error
 
     """   
@@ -10251,17 +11358,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetAcc(self,acc,dec):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         acc = float(acc)
         dec = float(dec)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetAcc(acc,dec)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetAcc", acc,dec)
 
         return error
 
@@ -10274,17 +11374,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoSetEmergencyStopAcc(self,acc,dec):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         acc = float(acc)
         dec = float(dec)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetEmergencyStopAcc(acc,dec)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AuxServoSetEmergencyStopAcc", acc,dec)
 
         return error
 
@@ -10298,15 +11391,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoGetEmergencyStopAcc(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoGetEmergencyStopAcc()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("AuxServoGetEmergencyStopAcc")
 
         if error[0]==0:
             return error[0],error[1],error[2]
@@ -10323,15 +11409,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AuxServoGetAcc(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoGetAcc()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("AuxServoGetAcc")
 
         if error[0] == 0:
             return error[0], error[1], error[2]
@@ -10353,15 +11432,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAxleCommunicationParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleCommunicationParam()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("GetAxleCommunicationParam")
 
         if error[0] == 0:
             return error[0], error[1], error[2], error[3], error[4], error[5], error[6], error[7]
@@ -10382,8 +11454,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAxleCommunicationParam(self,baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         baudRate = int (baudRate)
         dataBit = int (dataBit)
         stopBit = int (stopBit)
@@ -10391,13 +11462,7 @@ class RPC():
         timeout = int (timeout)
         timeoutTimes = int (timeoutTimes)
         period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleCommunicationParam(baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxleCommunicationParam", baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period)
 
         return error
 
@@ -10409,16 +11474,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAxleFileType(self,type):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type=int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleFileType(type)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxleFileType", type)
 
         return error
 
@@ -10430,16 +11488,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAxleLuaEnable(self,enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         enable=int(enable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaEnable(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxleLuaEnable", enable)
 
         return error
 
@@ -10451,15 +11502,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRecoverAxleLuaErr(self,enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRecoverAxleLuaErr(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SetRecoverAxleLuaErr", enable)
 
         return error
 
@@ -10471,15 +11515,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAxleLuaEnableStatus(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableStatus()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("GetAxleLuaEnableStatus")
 
         if error[0] == 0:
             return error[0], error[1]
@@ -10496,18 +11533,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAxleLuaEnableDeviceType(self,forceSensorEnable,gripperEnable,IOEnable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         forceSensorEnable = int(forceSensorEnable)
         gripperEnable = int(gripperEnable)
         IOEnable = int(IOEnable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaEnableDeviceType(forceSensorEnable,gripperEnable,IOEnable)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxleLuaEnableDeviceType", forceSensorEnable,gripperEnable,IOEnable)
 
         return error
 
@@ -10521,15 +11551,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAxleLuaEnableDeviceType(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableDeviceType()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("GetAxleLuaEnableDeviceType")
 
         if error[0] == 0:
             return error[0], error[1], error[2], error[3]
@@ -10546,15 +11569,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAxleLuaEnableDevice(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableDevice()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("GetAxleLuaEnableDevice")
 
         if error[0] == 0:
             par= error[1].split(',')
@@ -10578,17 +11594,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAxleLuaGripperFunc(self,id,func):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         func = list(map(int, func))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaGripperFunc(id,func)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAxleLuaGripperFunc", id,func)
 
         # error = self.robot.SetAxleLuaGripperFunc(id,func)
         return error
@@ -10602,16 +11611,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetAxleLuaGripperFunc(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id=int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaGripperFunc(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("GetAxleLuaGripperFunc", id)
 
         if error[0] == 0:
             par = error[1].split(',')
@@ -10634,17 +11636,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetCtrlOpenLUAName(self,id,name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCtrlOpenLUAName(id,name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetCtrlOpenLUAName", id,name)
 
         return error
 
@@ -10656,15 +11651,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCtrlOpenLUAName(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetCtrlOpenLUAName()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("GetCtrlOpenLUAName")
 
         if error[0] == 0:
             par = error[2].split(',')
@@ -10685,16 +11673,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadCtrlOpenLUA(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadCtrlOpenLUA(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LoadCtrlOpenLUA", id)
 
         return error
 
@@ -10707,16 +11688,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def UnloadCtrlOpenLUA(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.UnloadCtrlOpenLUA(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("UnloadCtrlOpenLUA", id)
 
         return error
 
@@ -10729,16 +11703,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetCtrlOpenLuaErrCode(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCtrlOpenLuaErrCode(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetCtrlOpenLuaErrCode", id)
 
         return error
 
@@ -10753,18 +11720,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SlaveFileWrite(self,type,slaveID,fileName):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
         slaveID = int(slaveID)
         fileName =str(fileName)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SlaveFileWrite(type,slaveID,fileName)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SlaveFileWrite", type,slaveID,fileName)
 
         return error
 
@@ -10776,15 +11736,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSysServoBootMode(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSysServoBootMode()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SetSysServoBootMode")
 
         return error
 
@@ -10829,16 +11782,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def TractorEnable(self, enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         enable = int(enable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorEnable(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("TractorEnable", enable)
 
         return error
 
@@ -10850,15 +11796,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def TractorHoming(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorHoming()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("TractorHoming")
 
         return error
 
@@ -10872,19 +11811,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def TractorMoveL(self,distance,vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         distance = float(distance)
         vel = float(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorMoveL(distance,vel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("TractorMoveL", distance,vel)
 
         return error
 
@@ -10899,20 +11831,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def TractorMoveC(self,radio, angle, vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         radio = float(radio)
         angle = float(angle)
         vel = float(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorMoveC(radio, angle, vel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("TractorMoveC", radio, angle, vel)
 
         return error
 
@@ -10925,15 +11850,8 @@ class RPC():
     @xmlrpc_timeout
 
     def TractorStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ProgramStop")
 
         return error
 
@@ -10948,17 +11866,10 @@ class RPC():
     @xmlrpc_timeout
 
     def SetWireSearchExtDIONum(self,searchDoneDINum,searchStartDONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         searchDoneDINum = int(searchDoneDINum)
         searchStartDONum = int(searchStartDONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireSearchExtDIONum(searchDoneDINum,searchStartDONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWireSearchExtDIONum", searchDoneDINum,searchStartDONum)
 
         return error
 
@@ -10972,16 +11883,9 @@ class RPC():
     @xmlrpc_timeout
 
     def SetWeldMachineCtrlModeExtDoNum(self, DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldMachineCtrlModeExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWeldMachineCtrlModeExtDoNum", DONum)
 
         return error
 
@@ -10995,16 +11899,9 @@ class RPC():
     @xmlrpc_timeout
 
     def SetWeldMachineCtrlMode(self, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldMachineCtrlMode(mode)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWeldMachineCtrlMode", mode)
 
         return error
 
@@ -11019,6 +11916,7 @@ class RPC():
     def CloseRPC(self):
         # 设置停止事件以通知线程停止
         self.stop_event.set()
+        self.liveness_monitor.stop()
 
         # 如果线程仍在运行，则等待其结束
         # if self.thread.is_alive():
@@ -11026,6 +11924,7 @@ class RPC():
 
         # 清理 XML-RPC 代理
         if self.robot is not None:
+            self.robot.close()
             self.robot = None  # 将代理设置为 None，释放资源
             self.sock_cli_state.close()
             self.sock_cli_state = None
@@ -11037,6 +11936,9 @@ class RPC():
         if self.thread.is_alive():
             self.thread.join()
 
+        self.robot_state_events.stop()
+        self.StopRobotStatePublisher()
+        self.StopRobotStateRecord()
 
         print("RPC connection closed.")
         return
@@ -11070,19 +11972,12 @@ class RPC():
     @xmlrpc_timeout
 
     def SingularAvoidStart(self, protectMode, minShoulderPos=100,minElbowPos=50,minWristPos=10):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         protectMode = int(protectMode)
         minShoulderPos = float(minShoulderPos)
         minElbowPos = float(minElbowPos)
         minWristPos = float(minWristPos)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SingularAvoidStart(protectMode, minShoulderPos,minElbowPos,minWristPos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SingularAvoidStart", protectMode, minShoulderPos,minElbowPos,minWristPos)
 
         return error
 
@@ -11095,15 +11990,8 @@ class RPC():
     @xmlrpc_timeout
 
     def SingularAvoidEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SingularAvoidEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("SingularAvoidEnd")
 
         return error
 
@@ -11118,7 +12006,8 @@ class RPC():
     @xmlrpc_timeout
 
     def GetGripperRotNum(self):
-        return 0,self.robot_state_pkg.gripper_fault,self.robot_state_pkg.gripperRotNum
+        pkg = self.robot_state_snapshot.pkg
+        return 0,pkg.gripper_fault,pkg.gripperRotNum
 
     """   
         @brief 获取旋转夹爪的旋转速度百分比
@@ -11131,7 +12020,8 @@ class RPC():
     @xmlrpc_timeout
 
     def GetGripperRotSpeed(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripperRotSpeed
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripperRotSpeed
 
     """   
         @brief 获取旋转夹爪的旋转力矩百分比
@@ -11144,7 +12034,8 @@ class RPC():
     @xmlrpc_timeout
 
     def GetGripperRotTorque(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripperRotTorque
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripperRotTorque
 
     """   
        @brief 开始Ptp运动FIR滤波
@@ -11157,17 +12048,10 @@ class RPC():
     @xmlrpc_timeout
 
     def PtpFIRPlanningStart(self, maxAcc,maxJek):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         maxAcc = float(maxAcc)
         maxJek = float(maxJek)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PtpFIRPlanningStart(maxAcc,maxJek)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("PtpFIRPlanningStart", maxAcc,maxJek)
 
         return error
 
@@ -11180,15 +12064,8 @@ class RPC():
     @xmlrpc_timeout
 
     def PtpFIRPlanningEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PtpFIRPlanningEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("PtpFIRPlanningEnd")
 
         return error
 
@@ -11233,19 +12110,12 @@ class RPC():
     @xmlrpc_timeout
 
     def LinArcFIRPlanningStart(self, maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         maxAccLin = float(maxAccLin)
         maxAccDeg = float(maxAccDeg)
         maxJerkLin = float(maxJerkLin)
         maxJerkDeg = float(maxJerkDeg)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LinArcFIRPlanningStart(maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LinArcFIRPlanningStart", maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg)
 
         return  error
 
@@ -11258,15 +12128,8 @@ class RPC():
     @xmlrpc_timeout
 
     def LinArcFIRPlanningEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LinArcFIRPlanningEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LinArcFIRPlanningEnd")
 
         return error
 
@@ -11281,16 +12144,9 @@ class RPC():
     @xmlrpc_timeout
 
     def ToolTrsfStart(self, toolNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         toolNum = int(toolNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ToolTrsfStart(toolNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ToolTrsfStart", toolNum)
 
         return error
 
@@ -11303,15 +12159,8 @@ class RPC():
     @xmlrpc_timeout
 
     def ToolTrsfEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ToolTrsfEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("ToolTrsfEnd")
 
         return error
 
@@ -11329,8 +12178,7 @@ class RPC():
     @xmlrpc_timeout
 
     def ComputeToolCoordWithPoints(self, method, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         method = int(method)
         param = {}
         param[0] = pos[0]
@@ -11344,13 +12192,7 @@ class RPC():
         else:  # 六点法
             param[4] = pos[4]
             param[5] = pos[5]
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeToolCoordWithPoints(method, param[0], param[1], param[2], param[3], param[4], param[5])
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputeToolCoordWithPoints", method, param[0], param[1], param[2], param[3], param[4], param[5])
 
         error = _error[0]
         if error == 0:
@@ -11370,21 +12212,14 @@ class RPC():
     @xmlrpc_timeout
 
     def ComputeWObjCoordWithPoints(self, method, pos, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         method = int(method)
         param = {}
         param[0] = pos[0]
         param[1] = pos[1]
         param[2] = pos[2]
         refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeWObjCoordWithPoints(method, param[0], param[1], param[2], refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputeWObjCoordWithPoints", method, param[0], param[1], param[2], refFrame)
 
         error = _error[0]
         if error == 0:
@@ -11402,17 +12237,10 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingSetCheckArcInterruptionParam(self, checkEnable, arcInterruptTimeLength):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         checkEnable = int(checkEnable)
         arcInterruptTimeLength = int(arcInterruptTimeLength)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCheckArcInterruptionParam(checkEnable, arcInterruptTimeLength)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetCheckArcInterruptionParam", checkEnable, arcInterruptTimeLength)
 
         return error
 
@@ -11427,15 +12255,8 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingGetCheckArcInterruptionParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetCheckArcInterruptionParam()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("WeldingGetCheckArcInterruptionParam")
 
         error = _error[0]
         if error == 0:
@@ -11455,19 +12276,12 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingSetReWeldAfterBreakOffParam(self, enable, length, velocity, moveType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         enable = int(enable)
         length = float(length)
         velocity = float(velocity)
         moveType = int(moveType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetReWeldAfterBreakOffParam(enable, length, velocity, moveType)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetReWeldAfterBreakOffParam", enable, length, velocity, moveType)
 
         return error
 
@@ -11484,15 +12298,8 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingGetReWeldAfterBreakOffParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetReWeldAfterBreakOffParam()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("WeldingGetReWeldAfterBreakOffParam")
 
         error = _error[0]
         if error == 0:
@@ -11508,15 +12315,8 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingStartReWeldAfterBreakOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingStartReWeldAfterBreakOff()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("WeldingStartReWeldAfterBreakOff")
 
         return error
 
@@ -11529,15 +12329,8 @@ class RPC():
     @xmlrpc_timeout
 
     def WeldingAbortWeldAfterBreakOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingAbortWeldAfterBreakOff()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("WeldingAbortWeldAfterBreakOff")
 
         return error
 
@@ -11558,8 +12351,7 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserSensorRecord(self, status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         delayMode = int(delayMode)
         delayTime = int(delayTime)
@@ -11567,13 +12359,7 @@ class RPC():
         delayDis = float(delayDis)
         sensitivePara = float(sensitivePara)
         speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecord(status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserSensorRecord", status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
 
         return error
 
@@ -11587,16 +12373,9 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingLaserOn(self, weldId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weldId = int(weldId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOn(weldId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingLaserOn", weldId)
 
         return error
 
@@ -11609,15 +12388,8 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingLaserOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOff()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LaserTrackingLaserOff")
 
         return error
 
@@ -11631,16 +12403,9 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingTrackOn(self, coordId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coordId = int(coordId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOn(coordId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingTrackOn", coordId)
 
         return error
 
@@ -11653,15 +12418,8 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingTrackOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOff()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LaserTrackingTrackOff")
 
         return error
 
@@ -11680,21 +12438,14 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingSearchStart(self, direction, directionPoint, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         direction = int(direction)
         directionPoint = list(map(float, directionPoint))
         vel = int(vel)
         distance = int(distance)
         timeout = int(timeout)
         posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart(direction, directionPoint[0], directionPoint[1], directionPoint[2], vel, distance, timeout, posSensorNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingSearchStart", direction, directionPoint[0], directionPoint[1], directionPoint[2], vel, distance, timeout, posSensorNum)
 
         return error
 
@@ -11707,15 +12458,8 @@ class RPC():
     @xmlrpc_timeout
 
     def LaserTrackingSearchStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStop()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("LaserTrackingSearchStop")
 
         return error
 
@@ -11734,19 +12478,12 @@ class RPC():
     @xmlrpc_timeout
 
     def WeaveChangeStart(self, weaveChangeFlag, weaveNum, velStart, velEnd):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         weaveChangeFlag = int(weaveChangeFlag)
         weaveNum = int(weaveNum)
         velStart = float(velStart)
         velEnd = float(velEnd)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveChangeStart(weaveChangeFlag, weaveNum, velStart, velEnd)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeaveChangeStart", weaveChangeFlag, weaveNum, velStart, velEnd)
 
         return error
 
@@ -11759,15 +12496,8 @@ class RPC():
     @xmlrpc_timeout
 
     def WeaveChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("WeaveChangeEnd")
 
         return error
 
@@ -11788,122 +12518,655 @@ class RPC():
     """
 
     @log_call
-    @xmlrpc_timeout
-
-    def LoadTrajectoryLA(self, name, mode, errorLim, type, precision, vamx, amax, jmax, flag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        name =str(name)
-        mode = int(mode)
-        errorLim = float(errorLim)
-        type = int(type)
-        precision = float(precision)
-        vamx = float(vamx)
-        amax = float(amax)
-        jmax = float(jmax)
-        flag = int(flag)
+    @xmlrpc_timeout
+
+    def LoadTrajectoryLA(self, name, mode, errorLim, type, precision, vamx, amax, jmax, flag):
+        self.wait_connected()
+        if self.GetSafetyCode() != 0:
+            return self.GetSafetyCode()
+        name =str(name)
+        mode = int(mode)
+        errorLim = float(errorLim)
+        type = int(type)
+        precision = float(precision)
+        vamx = float(vamx)
+        amax = float(amax)
+        jmax = float(jmax)
+        flag = int(flag)
+
+        error = self.call_robot("LoadTrajectoryLA", name, mode, errorLim, type, precision, vamx, amax, jmax, flag)
+
+        return error
+
+    """
+       @brief 轨迹复现(轨迹前瞻)
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def MoveTrajectoryLA(self):
+        self.wait_connected()
+        if self.GetSafetyCode() != 0:
+            return self.GetSafetyCode()
+        error = self.call_robot("MoveTrajectoryLA")
+
+        return error
+
+    """2025.02.25"""
+    """
+      @brief  自定义碰撞检测阈值功能开始，设置关节端和TCP端的碰撞检测阈值
+      @param  [in] flag 1-仅关节检测开启；2-仅TCP检测开启；3-关节和TCP检测同时开启
+      @param  [in] jointDetectionThreshould 关节碰撞检测阈值 j1-j6
+      @param  [in] tcpDetectionThreshould TCP碰撞检测阈值，xyzabc
+      @param  [in] block 0-非阻塞；1-阻塞
+      @return  错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def CustomCollisionDetectionStart(self, flag, jointDetectionThreshould, tcpDetectionThreshould, block):
+        self.wait_connected()
+        if self.GetSafetyCode() != 0:
+            return self.GetSafetyCode()
+        flag = int(flag)
+        jointDetectionThreshould = list(map(float, jointDetectionThreshould))
+        tcpDetectionThreshould = list(map(float, tcpDetectionThreshould))
+        block = int(block)
+        error = self.call_robot("CustomCollisionDetectionStart", flag, jointDetectionThreshould, tcpDetectionThreshould, block)
+
+        return error
+
+    """
+       @brief 自定义碰撞检测阈值功能关闭
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def CustomCollisionDetectionEnd(self):
+        self.wait_connected()
+        if self.GetSafetyCode() != 0:
+            return self.GetSafetyCode()
+        error = self.call_robot("CustomCollisionDetectionEnd")
+        
+        return error
+
+    """2025.03.19"""
+    """3.8.1"""
+    """
+       @brief 获取机器人状态
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）robot_state_pkg 机器人状态结构体
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetRobotRealTimeState(self):
+        return 0,self.robot_state_snapshot.pkg
+
+    """
+       @brief 获取机器人状态快照，读取过程无锁且不会读到混合两帧的数据
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）snapshot RobotStateSnapshot(pkg, frame_cnt, recv_time, seq)，pkg 只读
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetRobotStateSnapshot(self):
+        return 0,self.robot_state_snapshot
+
+    """
+       @brief 开启或关闭机器人状态历史环形缓存(需要 numpy)
+       @param [in] capacity 缓存帧数，0-关闭
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def SetRobotStateHistory(self, capacity):
+        capacity = int(capacity)
+        if capacity == 0:
+            self.robot_state_history = None
+            return 0
+        if np is None:
+            print("状态历史缓存需要安装 numpy")
+            return RobotError.ERR_OTHER
+        if capacity < 2:
+            return RobotError.ERR_OTHER
+        self.robot_state_history = RobotStateHistory(capacity)
+        return 0
+
+    """
+       @brief 获取机器人状态历史环形缓存
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）history RobotStateHistory，可用 latest/since/window 查询
+       @note  查询结果默认为环形缓存的零拷贝视图，m 条记录的结果在其后再收到 capacity-m 帧之内有效，之后会被新数据原地覆盖；
+              需要保存数据时传入 copy=True，例如 history.window(2.0, copy=True)
+    """
+
+    @log_call
+    def GetRobotStateHistory(self):
+        if self.robot_state_history is None:
+            return RobotError.ERR_OTHER,None
+        return 0,self.robot_state_history
+
+    """
+       @brief 订阅机器人状态事件，回调在独立的分发线程中执行
+       @param [in] condition 条件 condition(prev_pkg, pkg) -> bool，可使用 RobotStateEvent 中的常用条件
+       @param [in] callback 回调 callback(snapshot)，snapshot 为触发条件的 RobotStateSnapshot
+       @param [in] once 0-持续订阅 1-触发一次后自动注销
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）subscription 订阅句柄
+    """
+
+    @log_call
+    def SubscribeRobotState(self, condition, callback, once=0):
+        return 0,self.robot_state_events.subscribe(condition, callback, once=bool(once))
+
+    """
+       @brief 注销机器人状态事件订阅
+       @param [in] subscription SubscribeRobotState 返回的订阅句柄
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def UnsubscribeRobotState(self, subscription):
+        self.robot_state_events.unsubscribe(subscription)
+        return 0
+
+    """
+       @brief 阻塞等待机器人状态条件成立，条件在每帧状态到达时计算，无需轮询
+       @param [in] condition 条件 condition(prev_pkg, pkg) -> bool
+       @param [in] timeout 超时时间(s)，None-一直等待
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）snapshot 触发条件的 RobotStateSnapshot
+    """
+
+    @log_call
+    def WaitRobotState(self, condition, timeout=None):
+        snapshot = self.robot_state_events.wait(condition, timeout, self.robot_state_snapshot)
+        if snapshot is None:
+            return RobotError.ERR_WAIT_TIMEOUT,None
+        return 0,snapshot
+
+    """
+       @brief asyncio 版本的 WaitRobotState，用法 error, snapshot = await robot.WaitRobotStateAsync(condition, timeout)
+    """
+
+    async def WaitRobotStateAsync(self, condition, timeout=None):
+        snapshot = await self.robot_state_events.wait_async(condition, timeout, self.robot_state_snapshot)
+        if snapshot is None:
+            return RobotError.ERR_WAIT_TIMEOUT,None
+        return 0,snapshot
+
+    """
+       @brief 开启机器人状态共享内存发布，同机其他进程通过 RobotStateSubscriber(name) 读取，无需各自连接解析 20004 端口
+       @param [in] name 共享内存名称
+       @param [in] slot_num 环形槽数量
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StartRobotStatePublisher(self, name="fairino_state", slot_num=64):
+        if self.robot_state_publisher is not None:
+            return 0
+        try:
+            self.robot_state_publisher = RobotStateShmPublisher(name, slot_num)
+        except Exception as ex:
+            print("创建状态共享内存失败", ex)
+            return RobotError.ERR_OTHER
+        return 0
+
+    """
+       @brief 停止机器人状态共享内存发布并删除共享内存
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StopRobotStatePublisher(self):
+        publisher = self.robot_state_publisher
+        self.robot_state_publisher = None
+        if publisher is not None:
+            publisher.close()
+        return 0
+
+    """
+       @brief 开始录制机器人实时状态，校验通过的原始数据帧与主机接收时间按块压缩写入文件
+       @param [in] path 录制文件路径
+       @param [in] chunk_frames 每个压缩块的帧数
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StartRobotStateRecord(self, path, chunk_frames=500):
+        if self.robot_state_recorder is not None:
+            return RobotError.ERR_OTHER
+        try:
+            self.robot_state_recorder = RobotStateRecorder(path, chunk_frames)
+        except OSError as ex:
+            print("创建录制文件失败", ex)
+            return RobotError.ERR_FILE_OPEN_FAILED
+        return 0
+
+    """
+       @brief 停止录制机器人实时状态并写入索引
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StopRobotStateRecord(self):
+        recorder = self.robot_state_recorder
+        self.robot_state_recorder = None
+        if recorder is not None:
+            recorder.close()
+        return 0
+
+    """
+       @brief 回放录制的机器人实时状态，数据帧经过与实时线程相同的解析与发布流程(阻塞)
+       @param [in] path 录制文件路径
+       @param [in] speed 回放倍速，0-尽快回放
+       @param [in] start_time 从主机接收时间 >= start_time 的帧开始，None-从头开始
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）num 回放帧数
+    """
+
+    @log_call
+    def ReplayRobotState(self, path, speed=1.0, start_time=None):
+        try:
+            recording = RobotStateRecording(path)
+        except (OSError, ValueError) as ex:
+            print("打开录制文件失败", ex)
+            return RobotError.ERR_FILE_OPEN_FAILED,0
+        try:
+            start = 0 if start_time is None else recording.seek_time(start_time)
+            num = RobotStateReplay(recording, speed).run(self, start)
+        finally:
+            recording.close()
+        return 0,num
+
+    """
+       @brief 设置机器人状态字段投影，解析线程在每帧发布后额外按投影解码所需字段，供 GetRobotStateProjected 读取
+       @param [in] fields 字段名列表，例如 ["jt_cur_pos", "motion_done"]，None-关闭投影
+       @return 错误码 成功- 0, 失败-错误码
+       @note  robot_state_pkg、状态快照及依赖它们的接口始终使用完整状态包，不受投影影响；frame_cnt 总是包含在投影内
+    """
+
+    @log_call
+    def SetRobotStateProjection(self, fields=None):
+        if fields is None:
+            self.robot_state_projection = None
+            self.robot_state_projected = None
+            return 0
+        try:
+            projection = RobotStateProjection(fields)
+        except ValueError as ex:
+            print(ex)
+            return RobotError.ERR_OTHER
+        self.robot_state_projected = None
+        self.robot_state_projection = projection
+        return 0
+
+    """
+       @brief 获取按投影解码的最新机器人状态
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）state 只含投影字段的对象，尚未收到数据帧时为 None
+    """
+
+    @log_call
+    def GetRobotStateProjected(self):
+        if self.robot_state_projection is None:
+            return RobotError.ERR_OTHER,None
+        return 0,self.robot_state_projected
+
+
+    """
+       @brief 获取 20004 状态通道统计
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）stats 字典：frame_num 接收帧数, lost_frame_num 按帧计数推算的丢帧数, gap_num 丢帧次数,
+               checksum_error_num 校验失败数, resync_num 重新同步次数, skipped_bytes 丢弃字节数, reconnect_num 重连次数,
+               clock_ahead_num 控制器时间超前主机的帧数, interval_us 到达间隔直方图摘要, latency_us 控制器到主机延迟直方图摘要
+    """
+
+    @log_call
+    def GetRobotStateStats(self):
+        return 0,self.robot_state_stats.summary()
+
+    """
+       @brief 清零 20004 状态通道统计
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def ResetRobotStateStats(self):
+        self.robot_state_stats.reset()
+        return 0
+
+    """
+       @brief 获取 20003 指令通道往返时间统计
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）stats 字典：last_us 指令连接最近一次调用往返时间, reconnect_num 长连接重建次数,
+               connection_num 连接池已建立的连接数, rtt_us 全部连接的往返时间直方图摘要
+    """
+
+    @log_call
+    def GetRpcRoundTripStats(self):
+        transports = list(self.robot.transports)
+        rtt_hist = RobotHistogram()
+        for transport in transports:
+            rtt_hist.merge(transport.rtt_hist)
+        return 0,{"last_us": int(self.transport.last_rtt * 1e6),
+                  "reconnect_num": sum(transport.reconnect_num for transport in transports),
+                  "connection_num": len(transports),
+                  "rtt_us": rtt_hist.summary()}
+
+    """
+       @brief 设置 20003 指令网络异常重试策略
+       @param [in] base_delay 首次重试等待时间(s)，之后每次翻倍
+       @param [in] max_delay 单次等待时间上限(s)
+       @param [in] deadline 单次调用从首次失败起的重试总时长(s)，超时后接口返回错误码 ERR_SOCKET_COM_FAILED
+       @param [in] jitter 随机抖动比例[0~1]，等待时间在 [delay*(1-jitter), delay] 内随机
+       @return 错误码 成功- 0, 失败-错误码
+       @note  只重试查询类指令与 RobotRetryPolicy.IDEMPOTENT_CALLS 中的指令，其余指令始终不自动重试
+    """
+
+    @log_call
+    def SetRpcRetryPolicy(self, base_delay=0.05, max_delay=2.0, deadline=30.0, jitter=0.5):
+        policy = self.retry_policy
+        policy.base_delay = float(base_delay)
+        policy.max_delay = float(max_delay)
+        policy.deadline = float(deadline)
+        policy.jitter = min(max(float(jitter), 0.0), 1.0)
+        return 0
+
+    """
+       @brief 设置 20003 指令默认超时时间，单次调用可通过 SDK 接口的 rpc_timeout 参数单独指定，例如 robot.GetInverseKin(0, desc_pos, rpc_timeout=0.5)
+       @param [in] timeout 一般指令的超时时间(s)
+       @param [in] long_timeout 阻塞运动、等待、文件传输与升级类指令的超时时间(s)
+       @return 错误码 成功- 0, 失败-错误码
+       @note  rpc_timeout 参数由 xmlrpc_timeout 装饰器处理，本 SDK 本地的设置、统计、录制与追踪类接口未加该装饰器，不接受 rpc_timeout
+    """
+
+    @log_call
+    def SetRpcTimeout(self, timeout=5.0, long_timeout=300.0):
+        self.robot.timeout = float(timeout)
+        self.robot.long_timeout = float(long_timeout)
+        return 0
+
+    """
+       @brief 设置断线重连期间 SDK 调用的最长等待时间，超时后调用抛出 RobotConnectionError
+       @param [in] timeout 等待时间(s)
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def SetReconnectWaitTime(self, timeout=10.0):
+        self.connection_gate.timeout = float(timeout)
+        return 0
+
+    """
+       @brief 开启连接存活监测：状态流连续 stale_periods 个周期无新帧时并行探测 20003，
+              探测失败或停顿超过 reconnect_timeout 时立即并行重建 20004 与 20003 两条通道
+       @param [in] period 状态数据周期(s)，默认0.008
+       @param [in] stale_periods 判定状态流停顿的周期数，默认5
+       @param [in] reconnect_timeout 状态流停顿多久后主动重连(s)，默认0.3
+       @param [in] probe_interval 连接正常时探测 20003 的间隔(s)，默认1.0
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StartLivenessMonitor(self, period=0.008, stale_periods=5, reconnect_timeout=0.3, probe_interval=1.0):
+        monitor = self.liveness_monitor
+        monitor.period = float(period)
+        monitor.stale_periods = int(stale_periods)
+        monitor.reconnect_timeout = float(reconnect_timeout)
+        monitor.probe_interval = float(probe_interval)
+        monitor.start()
+        return 0
+
+    """
+       @brief 关闭连接存活监测，断线后仍由状态接收线程自动重连
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StopLivenessMonitor(self):
+        self.liveness_monitor.stop()
+        return 0
+
+    """
+       @brief 获取连接状态切换记录，可用于统计控制器重启后的恢复时间
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）transitions [RobotConnectionTransition(time, state, prev_state, reason), ...]，
+               state 为 CONNECTED/STALE/RECONNECTING/DISCONNECTED，time 为主机时间 time.time()
+    """
+
+    @log_call
+    def GetConnectionStateHistory(self):
+        return 0,self.liveness_monitor.history()
+
+    """
+       @brief 订阅连接状态切换
+       @param [in] callback 回调函数 callback(transition)，在发生切换的线程中调用，应尽快返回
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def SubscribeConnectionState(self, callback):
+        self.liveness_monitor.subscribe(callback)
+        return 0
+
+    """
+       @brief 取消订阅连接状态切换
+       @param [in] callback SubscribeConnectionState 注册的回调函数
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def UnsubscribeConnectionState(self, callback):
+        self.liveness_monitor.unsubscribe(callback)
+        return 0
+
+    """
+       @brief 开启二进制调用轨迹环形缓存，每次 SDK 调用记录接口、数值参数、错误码、开始时间与耗时，开销远低于文本日志
+       @param [in] capacity 缓存的调用条数，默认4096
+       @param [in] dump_dir 自动转储文件目录，默认当前工作目录
+       @param [in] auto_dump 1-调用返回非 0 错误码或抛出异常时自动转储为可读日志 fairino_trace_*.log，0-仅手动转储
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def EnableCallTrace(self, capacity=4096, dump_dir="", auto_dump=1):
+        capacity = int(capacity)
+        if capacity <= 0 or (dump_dir and not os.path.isdir(dump_dir)):
+            return RobotError.ERR_OTHER
+        self.call_trace = RobotCallTrace(capacity, dump_dir, bool(auto_dump))
+        self.refresh_log_call_level()
+        return 0
+
+    """
+       @brief 关闭调用轨迹缓存
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def DisableCallTrace(self):
+        self.call_trace = None
+        self.refresh_log_call_level()
+        return 0
+
+    """
+       @brief 把调用轨迹缓存转换为可读日志
+       @param [in] file_path 输出文件路径，默认None-不写文件
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）text 可读日志文本，每行为 时间 接口(参数) -> 错误码 耗时；指定 file_path 时返回文件路径
+    """
+
+    @log_call
+    def DumpCallTrace(self, file_path=None):
+        trace = self.call_trace
+        if trace is None:
+            return RobotError.ERR_OTHER,None
+        if file_path is None:
+            return 0,trace.dump("on demand")
+        try:
+            return 0,trace.dump_to_file(file_path, "on demand")
+        except OSError as ex:
+            print("调用轨迹转储失败", ex)
+            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND,None
+
+    """
+       @brief 开启或关闭 SDK 接口调用统计，记录每个接口的调用次数、错误次数与耗时直方图，通过 stats() 查看
+       @param [in] enable 1-开启，0-关闭并丢弃已有统计
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def EnableMethodStats(self, enable=1):
+        if not enable:
+            self.method_stats = None
+        elif self.method_stats is None:
+            self.method_stats = RobotMethodStats()
+        self.refresh_log_call_level()
+        return 0
+
+    """
+       @brief 获取 SDK 接口调用统计(需先调用 EnableMethodStats 开启)
+       @param [in] names 接口名列表，例如 ["MoveL", "GetInverseKin", "ServoJ"]，默认None-全部接口
+       @return stats 字典 {接口名: {"call_num": 调用次数, "error_num": 错误次数,
+               "latency_us": {"count", "min", "mean", "p50", "p90", "p99", "p999", "max"}}}，耗时单位微秒；未开启时为空字典
+    """
+
+    def stats(self, names=None):
+        if self.method_stats is None:
+            return {}
+        return self.method_stats.summary(names)
+
+    """
+       @brief 清零 SDK 接口调用统计
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    def reset_stats(self):
+        if self.method_stats is not None:
+            self.method_stats.reset()
+        return 0
+
+    """
+       @brief 开启区间追踪，记录每次 SDK 接口调用(sdk)与其中的 20003 往返(rpc)，上层应用可用 span_tracer.span() 记录自己的操作
+       @param [in] capacity 保存的区间数，超出时丢弃最早的区间，默认100000
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    def StartSpanTrace(self, capacity=100000):
+        self.span_tracer = RobotSpanTracer(int(capacity))
+        self.robot.span_tracer = self.span_tracer
+        self.refresh_log_call_level()
+        return 0
 
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.LoadTrajectoryLA(name, mode, errorLim, type, precision, vamx, amax, jmax, flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+    """
+       @brief 关闭区间追踪，已记录的区间仍可通过 ExportSpanTrace 导出
+       @return 错误码 成功- 0, 失败-错误码
+    """
 
-        return error
+    @log_call
+    def StopSpanTrace(self):
+        self.stopped_span_tracer = self.span_tracer or self.stopped_span_tracer
+        self.span_tracer = None
+        self.robot.span_tracer = None
+        self.refresh_log_call_level()
+        return 0
 
     """
-       @brief 轨迹复现(轨迹前瞻)
+       @brief 导出区间追踪为 Chrome trace JSON 文件，可在 chrome://tracing 或 ui.perfetto.dev 中打开
+       @param [in] file_path 输出文件路径
        @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
-    @xmlrpc_timeout
+    def ExportSpanTrace(self, file_path):
+        tracer = self.span_tracer or self.stopped_span_tracer
+        if tracer is None:
+            return RobotError.ERR_OTHER
+        try:
+            tracer.export(file_path)
+        except OSError as ex:
+            print("区间追踪导出失败", ex)
+            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
+        return 0
 
-    def MoveTrajectoryLA(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTrajectoryLA()
-                flag = False
-            except socket.error as e:
-                flag = True
+    """
+       @brief 获取 20003 指令重试统计
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）stats 字典：failed_call_num 首次发送失败的调用数, retry_num 重试总次数,
+               recovered_num 重试后成功的调用数, exhausted_num 超过重试时长仍失败的调用数,
+               not_retried_num 不在重试白名单内、失败未重试的调用数, method_retry_num 各指令的重试次数
+    """
 
-        return error
+    @log_call
+    def GetRpcRetryStats(self):
+        return 0,self.retry_policy.summary()
 
-    """2025.02.25"""
     """
-      @brief  自定义碰撞检测阈值功能开始，设置关节端和TCP端的碰撞检测阈值
-      @param  [in] flag 1-仅关节检测开启；2-仅TCP检测开启；3-关节和TCP检测同时开启
-      @param  [in] jointDetectionThreshould 关节碰撞检测阈值 j1-j6
-      @param  [in] tcpDetectionThreshould TCP碰撞检测阈值，xyzabc
-      @param  [in] block 0-非阻塞；1-阻塞
-      @return  错误码 成功- 0, 失败-错误码
+       @brief 清零 20003 指令重试统计
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
-    @xmlrpc_timeout
-    def CustomCollisionDetectionStart(self, flag, jointDetectionThreshould, tcpDetectionThreshould, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = int(flag)
-        jointDetectionThreshould = list(map(float, jointDetectionThreshould))
-        tcpDetectionThreshould = list(map(float, tcpDetectionThreshould))
-        block = int(block)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.CustomCollisionDetectionStart(flag, jointDetectionThreshould, tcpDetectionThreshould, block)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
+    def ResetRpcRetryStats(self):
+        self.retry_policy.reset()
+        return 0
 
     """
-       @brief 自定义碰撞检测阈值功能关闭
+       @brief 设置可由状态包推出的查询接口的默认状态包最大帧龄，单次调用可通过接口的 max_age 参数单独指定；
+              包括 GetActualJointPosRadian、GetTargetPayload、GetTargetPayloadCog、GetTCPOffset、GetWObjOffset，
+              以及直接读取状态包的 GetDI、GetAI、GetDO、GetActualJointPosDegree、GetActualTCPPose、GetRobotMotionDone 等接口
+       @param [in] max_age 最大帧龄(s)，最新状态帧不超过该时长时直接从状态包返回，否则走 20003 查询；
+              None-前五个接口始终走 20003 查询，直接读取状态包的接口总是从状态包返回
        @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
-    @xmlrpc_timeout
+    def SetStateReadMaxAge(self, max_age=None):
+        self.state_read_cache.max_age = None if max_age is None else float(max_age)
+        return 0
 
-    def CustomCollisionDetectionEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.CustomCollisionDetectionEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        
-        return error
+    """
+       @brief 获取状态包读缓存统计
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）stats 字典：hit_num 从状态包返回的次数, miss_num 回退到 20003 查询的次数,
+               method_hit_num/method_miss_num 各接口的次数
+    """
+
+    @log_call
+    def GetStateReadStats(self):
+        return 0,self.state_read_cache.summary()
 
-    """2025.03.19"""
-    """3.8.1"""
     """
-       @brief 获取机器人状态
+       @brief 清零状态包读缓存统计
        @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回）robot_state_pkg 机器人状态结构体
     """
 
     @log_call
-    @xmlrpc_timeout
-    def GetRobotRealTimeState(self):
-        return 0,self.robot_state_pkg
+    def ResetStateReadStats(self):
+        self.state_read_cache.reset()
+        return 0
+
+    """
+       @brief 创建 20003 指令批处理，批处理对象上调用的 SDK 接口先录制，执行时合并为一次 system.multicall 发送，
+              控制器不支持 multicall 时在长连接上流水线发送
+       @param [in] multicall 是否使用 system.multicall，None-自动检测，False-直接流水线发送
+       @return batch 批处理对象，batch.SetDO(...) 等调用返回该调用的序号，退出 with 块或调用 batch.execute() 后
+               batch.results 按调用顺序保存各接口的返回值，控制器返回 Fault 的调用返回值为 -4，Fault 保存在 batch.faults 中；
+               请求已发出但未收到响应的调用返回值为 -18(ERR_RPC_OUTCOME_UNKNOWN)，序号保存在 batch.unknown 中，
+               这些设置可能已部分或全部生效，需要重新查询确认后再决定是否重发；连接未建立、确定未发出的调用返回值为 -2
+       @note  示例：with robot.batch() as b: b.SetToolCoord(...); b.SetLoadWeight(...); b.SetDO(...)
+    """
+
+    def batch(self, multicall=None):
+        return RobotBatch(self, multicall)
 
     """   
     @brief  停止运动
@@ -11927,20 +13190,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AccSmoothStart(self, saveFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         saveFlag = bool(saveFlag)
         saveFlag_flag = 1 if saveFlag else 0
         saveFlag_flag = int(saveFlag_flag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AccSmoothStart(saveFlag_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AccSmoothStart", saveFlag_flag)
 
         return error
 
@@ -11953,21 +13209,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def AccSmoothEnd(self, saveFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         saveFlag = bool(saveFlag)
         saveFlag_flag = 1 if saveFlag else 0
         saveFlag_flag = int(saveFlag_flag)
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AccSmoothEnd(saveFlag_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("AccSmoothEnd", saveFlag_flag)
 
         return error
 
@@ -11982,7 +13231,7 @@ class RPC():
     @xmlrpc_timeout
     def RbLogDownload(self, savePath):
         try:
-            error = self.robot.RbLogDownloadPrepare()
+            error = self.call_robot("RbLogDownloadPrepare")
             if error == 0:
                 savePath = str(savePath)
                 fileName = "rblog.tar.gz"
@@ -12006,7 +13255,7 @@ class RPC():
     @xmlrpc_timeout
     def AllDataSourceDownload(self, savePath):
         try:
-            error = self.robot.AllDataSourceDownloadPrepare()
+            error = self.call_robot("AllDataSourceDownloadPrepare")
             if error == 0:
                 savePath = str(savePath)
                 fileName = "alldatasource.tar.gz"
@@ -12030,7 +13279,7 @@ class RPC():
     @xmlrpc_timeout
     def DataPackageDownload(self, savePath):
         try:
-            error = self.robot.DataPackageDownloadPrepare()
+            error = self.call_robot("DataPackageDownloadPrepare")
             if error == 0:
                 savePath = str(savePath)
                 fileName = "fr_user_data.tar.gz"
@@ -12053,17 +13302,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotSN(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotSN()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetRobotSN")
 
         error = _error[0]
         if error == 0:
@@ -12078,17 +13320,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ShutDownRobotOS(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ShutDownRobotOS()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ShutDownRobotOS")
 
         return error
 
@@ -12101,19 +13336,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ConveyorComDetect(self, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                # error = self.robot.ConveryComDetect(timeout)
-                error = self.robot.ConveyorComDetect(timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+        # error = self.robot.ConveryComDetect(timeout)
+        error = self.call_robot("ConveyorComDetect", timeout)
 
         return error
 
@@ -12154,18 +13382,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceAIChannelCurrent(self, channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceAIChannelCurrent(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ArcWeldTraceAIChannelCurrent", channel)
         return error
 
     """
@@ -12177,18 +13398,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceAIChannelVoltage(self, channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceAIChannelVoltage(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ArcWeldTraceAIChannelVoltage", channel)
         return error
 
     """
@@ -12203,21 +13417,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceCurrentPara(self, AILow=0, AIHigh=10, currentLow=0, currentHigh=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         AILow = float(AILow)
         AIHigh = float(AIHigh)
         currentLow = float(currentLow)
         currentHigh = float(currentHigh)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceCurrentPara(AILow, AIHigh, currentLow, currentHigh)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ArcWeldTraceCurrentPara", AILow, AIHigh, currentLow, currentHigh)
         return error
 
     """
@@ -12232,21 +13439,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ArcWeldTraceVoltagePara(self, AILow=0, AIHigh=10, voltageLow=0, voltageHigh=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         AILow = float(AILow)
         AIHigh = float(AIHigh)
         voltageLow = float(voltageLow)
         voltageHigh = float(voltageHigh)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceVoltagePara(AILow, AIHigh, voltageLow, voltageHigh)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ArcWeldTraceVoltagePara", AILow, AIHigh, voltageLow, voltageHigh)
         return error
 
     """2025.04.16"""
@@ -12263,8 +13463,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetVoltageGradualChangeStart(self, IOType, voltageStart, voltageEnd, AOIndex, blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         IOType = int(IOType)
@@ -12272,13 +13471,7 @@ class RPC():
         voltageEnd = float(voltageEnd)
         AOIndex = int(AOIndex)
         blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageGradualChangeStart(IOType, voltageStart, voltageEnd, AOIndex, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetVoltageGradualChangeStart", IOType, voltageStart, voltageEnd, AOIndex, blend)
         return error
 
     """
@@ -12289,17 +13482,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetVoltageGradualChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageGradualChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetVoltageGradualChangeEnd")
         return error
 
     """
@@ -12315,8 +13501,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetCurrentGradualChangeStart(self, IOType, currentStart, currentEnd, AOIndex, blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         IOType = int(IOType)
@@ -12324,13 +13509,7 @@ class RPC():
         currentEnd = float(currentEnd)
         AOIndex = int(AOIndex)
         blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentGradualChangeStart(IOType, currentStart, currentEnd, AOIndex, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetCurrentGradualChangeStart", IOType, currentStart, currentEnd, AOIndex, blend)
         return error
 
     """
@@ -12341,17 +13520,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WeldingSetCurrentGradualChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentGradualChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WeldingSetCurrentGradualChangeEnd")
         return error
 
     """2025.04.27"""
@@ -12364,7 +13536,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSmarttoolBtnState(self):
-        return 0,self.robot_state_pkg.smartToolState
+        pkg = self.robot_state_snapshot.pkg
+        return 0,pkg.smartToolState
 
     """2025.05.08"""
     """
@@ -12376,17 +13549,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ExtAxisGetCoord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ExtAxisGetCoord()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ExtAxisGetCoord")
 
         error = _error[0]
         if error == 0:
@@ -12405,7 +13571,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperActivateStatus(self):
-        return 0, self.robot_state_pkg.gripper_fault,self.robot_state_pkg.gripper_active
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault,pkg.gripper_active
 
     """   
     @brief  获取夹爪位置
@@ -12418,7 +13585,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperCurPosition(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_position
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripper_position
 
     """   
     @brief  获取夹爪电流
@@ -12431,7 +13599,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperCurCurrent(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_current
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripper_current
 
     """   
     @brief  获取夹爪电压
@@ -12444,7 +13613,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperVoltage(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_voltage
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripper_voltage
 
     """   
     @brief  获取夹爪温度
@@ -12457,7 +13627,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperTemp(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_tmp
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripper_tmp
 
     """   
     @brief  获取夹爪速度
@@ -12470,7 +13641,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperCurSpeed(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_speed
+        pkg = self.robot_state_snapshot.pkg
+        return 0, pkg.gripper_fault, pkg.gripper_speed
 
     """2025.06.24"""
     """3.8.3"""
@@ -12484,19 +13656,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWideBoxTempFanMonitorParam(self, enable, period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         if self.GetSafetyCode() != 0:
             return self.GetSafetyCode()
         enable = int(enable)
         period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWideBoxTempFanMonitorParam(enable, period)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetWideBoxTempFanMonitorParam", enable, period)
         return error
 
     """
@@ -12509,15 +13674,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetWideBoxTempFanMonitorParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWideBoxTempFanMonitorParam()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetWideBoxTempFanMonitorParam")
 
         error = _error[0]
         if error == 0:
@@ -12537,17 +13695,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFocusCalibPoint(self, pointNum, point):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pointNum = int(pointNum)
         point = list(map(float, point))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFocusCalibPoint(pointNum,point[0],point[1],point[2],point[3],point[4],point[5])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFocusCalibPoint", pointNum,point[0],point[1],point[2],point[3],point[4],point[5])
         return error
 
     """
@@ -12561,16 +13712,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeFocusCalib(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeFocusCalib(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("ComputeFocusCalib", pointNum)
 
         error = _error[0]
         if error == 0:
@@ -12590,20 +13734,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FocusStart(self, kp=50.0, kpredic=19.0, aMax=1440, vMax=180, type=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         kp = float(kp)
         kpredic = float(kpredic)
         aMax = float(aMax)
         vMax = float(vMax)
         type = int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FocusStart(kp, kpredic, aMax, vMax, type)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FocusStart", kp, kpredic, aMax, vMax, type)
         return error
 
     """
@@ -12614,15 +13751,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FocusEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FocusEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("FocusEnd")
         return error
 
     """
@@ -12634,16 +13764,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFocusPosition(self, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         pos = list(map(float, pos))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFocusPosition(pos[0],pos[1],pos[2])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetFocusPosition", pos[0],pos[1],pos[2])
         return error
 
     """2025.07.08"""
@@ -12656,16 +13779,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetEncoderUpgrade(self, path):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         path = str(path)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetEncoderUpgrade(path)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetEncoderUpgrade", path)
         return error
 
     """
@@ -12739,7 +13855,7 @@ class RPC():
         path = str(path)
         errcode = self.__FileUpLoad(5, path)
         if errcode == 0:
-            error = self.robot.JointAllParamUpgrade()
+            error = self.call_robot("JointAllParamUpgrade")
             return error
         return errcode
 
@@ -12757,16 +13873,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserRecordPoint(self, coordID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         coordID = int(coordID)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.LaserRecordPoint(coordID,0,100)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("LaserRecordPoint", coordID,0,100)
         error = _error[0]
         if error == 0:
             param_str = str(_error[1])
@@ -12788,16 +13897,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExAxisRobotPlan(self, strategy):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         strategy = int(strategy)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExAxisRobotPlan(strategy)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetExAxisRobotPlan", strategy)
         return error
 
     """2025.08.12"""
@@ -12812,15 +13914,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetFieldBusConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetFieldBusConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetFieldBusConfig")
 
         error = _error[0]
         if error == 0:
@@ -12838,18 +13933,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveWriteDO(self, DOIndex, wirteNum, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DOIndex = int(DOIndex)
         wirteNum = int(wirteNum)
         status = list(map(int, status))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWriteDO(DOIndex, wirteNum, status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FieldBusSlaveWriteDO", DOIndex, wirteNum, status)
         return error
 
     """
@@ -12863,18 +13951,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveWriteAO(self, AOIndex, wirteNum, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AOIndex = int(AOIndex)
         wirteNum = int(wirteNum)
         status = list(map(int, status))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWriteAO(AOIndex, wirteNum, status)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FieldBusSlaveWriteAO", AOIndex, wirteNum, status)
         return error
 
     """
@@ -12888,17 +13969,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveReadDI(self, DOIndex, readeNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DOIndex = int(DOIndex)
         readeNum = int(readeNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FieldBusSlaveReadDI(DOIndex, readeNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("FieldBusSlaveReadDI", DOIndex, readeNum)
 
         error = _error[0]
         if error == 0:
@@ -12916,17 +13990,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveReadAI(self, AOIndex, readeNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AOIndex = int(AOIndex)
         readeNum = int(readeNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FieldBusSlaveReadAI(AOIndex, readeNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("FieldBusSlaveReadAI", AOIndex, readeNum)
 
         error = _error[0]
         if error == 0:
@@ -12944,18 +14011,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveWaitDI(self, DIIndex, status, waitMs):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         DIIndex = int(DIIndex)
         status = int(status)
         waitMs = int(waitMs)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWaitDI(DIIndex, status, waitMs)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FieldBusSlaveWaitDI", DIIndex, status, waitMs)
         return error
 
     """
@@ -12970,19 +14030,12 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FieldBusSlaveWaitAI(self, AIIndex, waitType, value, waitMs):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         AIIndex = int(AIIndex)
         waitType = int(waitType)
         value = float(value)
         waitMs = int(waitMs)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWaitAI(AIIndex, waitType, value, waitMs)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("FieldBusSlaveWaitAI", AIIndex, waitType, value, waitMs)
         return error
 
     """
@@ -12996,18 +14049,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSuckerCtrl(self, slaveID, len, ctrlValue):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         slaveID = int(slaveID)
         len = int(len)
         ctrlValue = list(map(int, ctrlValue))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSuckerCtrl(slaveID, len, ctrlValue)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetSuckerCtrl", slaveID, len, ctrlValue)
         return error
 
     """
@@ -13022,16 +14068,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSuckerState(self, slaveID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         slaveID = int(slaveID)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSuckerState(slaveID)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetSuckerState", slaveID)
 
         error = _error[0]
         if error == 0:
@@ -13049,18 +14088,11 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitSuckerState(self, slaveID, state, ms):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         slaveID = int(slaveID)
         state = int(state)
         ms = int(ms)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitSuckerState(slaveID, state, ms)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("WaitSuckerState", slaveID, state, ms)
         return error
 
 
@@ -13080,7 +14112,7 @@ class RPC():
             if pos == -1:
                 return RobotError.ERR_FILE_NAME
             filename = filePath[pos + 1:]  # 获取文件名部分
-            error = self.robot.CtrlOpenLuaUpLoadCheck(filename)
+            error = self.call_robot("CtrlOpenLuaUpLoadCheck", filename)
             return error
         return errcode
 
@@ -13095,16 +14127,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTorqueDetectionSwitch(self, flag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.SetTorqueDetectionSwitch(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        error = self.call_robot("SetTorqueDetectionSwitch", flag)
         return error
 
     # """2025.09.03"""
@@ -13140,17 +14165,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingLaserOnOff(self, OnOff, weldId=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         OnOff = int(OnOff)
         weldId = int(weldId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOnOff(OnOff, weldId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingLaserOnOff", OnOff, weldId)
         return error
 
     """
@@ -13163,17 +14181,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingTrackOnOff(self, OnOff, coordId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         OnOff = int(OnOff)
         coordId = int(coordId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOnOff(OnOff, coordId)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingTrackOnOff", OnOff, coordId)
         return error
 
     """
@@ -13189,20 +14200,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingSearchStart_xyz(self, direction, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         direction = int(direction)
         vel = int(vel)
         distance = int(distance)
         timeout = int(timeout)
         posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart_xyz(direction, vel, distance, timeout, posSensorNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingSearchStart_xyz", direction, vel, distance, timeout, posSensorNum)
         return error
 
     """
@@ -13218,20 +14222,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingSearchStart_point(self, directionPoint, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         directionPoint = list(map(float, directionPoint))
         vel = int(vel)
         distance = int(distance)
         timeout = int(timeout)
         posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart_point(6, vel, distance, timeout, posSensorNum, directionPoint[0], directionPoint[1], directionPoint[2])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingSearchStart_point", 6, vel, distance, timeout, posSensorNum, directionPoint[0], directionPoint[1], directionPoint[2])
         return error
 
     """
@@ -13244,17 +14241,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingSensorConfig(self, ip, port):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         ip =str (ip)
         port = int(port)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSensorConfig(ip, port)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingSensorConfig", ip, port)
         return error
 
     """
@@ -13266,16 +14256,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserTrackingSensorSamplePeriod(self, period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSensorSamplePeriod(period)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserTrackingSensorSamplePeriod", period)
         return error
 
     """
@@ -13287,16 +14270,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadPosSensorDriver(self, type):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         type = int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadPosSensorDriver(type)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LoadPosSensorDriver", type)
         return error
 
     """
@@ -13307,15 +14283,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def UnLoadPosSensorDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.UnLoadPosSensorDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("UnLoadPosSensorDriver")
         return error
 
     """
@@ -13328,17 +14297,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserSensorRecord1(self, status, delayTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         delayTime = int(delayTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecord1(status, delayTime)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserSensorRecord1", status, delayTime)
         return error
 
     """
@@ -13351,17 +14313,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserSensorReplay(self, delayTime, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         delayTime = int(delayTime)
         speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorReplay(3, delayTime, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserSensorReplay", 3, delayTime, speed)
         return error
 
     """
@@ -13372,15 +14327,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveLTR(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveLTR(0)
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("MoveLTR", 0)
         return error
 
     """
@@ -13397,21 +14345,14 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LaserSensorRecordandReplay(self, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         delayMode = int(delayMode)
         delayTime = int(delayTime)
         delayDisExAxisNum = int(delayDisExAxisNum)
         delayDis = float(delayDis)
         sensitivePara = float(sensitivePara)
         speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecordandReplay(4, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("LaserSensorRecordandReplay", 4, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
         return error
 
     """
@@ -13424,17 +14365,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveToLaserRecordStart(self, moveType, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         moveType = int(moveType)
         ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserRecordStart(moveType, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveToLaserRecordStart", moveType, ovl)
         return error
 
     """
@@ -13447,17 +14381,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveToLaserRecordEnd(self, moveType, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         moveType = int(moveType)
         ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserRecordEnd(moveType, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveToLaserRecordEnd", moveType, ovl)
         return error
 
     """
@@ -13474,20 +14401,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveToLaserSeamPos(self, moveFlag, ovl, dataFlag, plateType, trackOffectType, offset):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         moveFlag = int(moveFlag)
         ovl = float(ovl)
         plateType = int(plateType)
         trackOffectType = int(trackOffectType)
         offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserSeamPos([moveFlag, ovl, dataFlag, plateType, trackOffectType, offset[0], offset[1],offset[2], offset[3], offset[4],offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveToLaserSeamPos", [moveFlag, ovl, dataFlag, plateType, trackOffectType, offset[0], offset[1],offset[2], offset[3], offset[4],offset[5]])
         return error
 
     """
@@ -13505,17 +14425,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetLaserSeamPos(self, trackOffectType, offset):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         trackOffectType = int(trackOffectType)
         offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetLaserSeamPos([trackOffectType, offset[0], offset[1], offset[2], offset[3],offset[4], offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetLaserSeamPos", [trackOffectType, offset[0], offset[1], offset[2], offset[3],offset[4], offset[5]])
         error = _error[0]
         if error == 0:
             paramStr = str(_error[1])
@@ -13549,8 +14462,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ImpedanceControlStartStop(self, status, workSpace, forceThreshold, m, b, k, maxV, maxVA, maxW, maxWA):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         workSpace = int(workSpace)
         forceThreshold = list(map(float, forceThreshold))
@@ -13561,18 +14473,12 @@ class RPC():
         maxVA = float(maxVA)
         maxW = float(maxW)
         maxWA = float(maxWA)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ImpedanceControlStartStop([status, workSpace,
-                                                     forceThreshold[0], forceThreshold[1], forceThreshold[2], forceThreshold[3], forceThreshold[4], forceThreshold[5]
-                                                     ,m[0], m[1], m[2], m[3], m[4], m[5]
-                                                     ,b[0], b[1], b[2], b[3], b[4], b[5]
-                                                     ,k[0], k[1], k[2], k[3], k[4], k[5]
-                                                     ,maxV, maxVA, maxW, maxWA])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("ImpedanceControlStartStop", [status, workSpace,
+                                             forceThreshold[0], forceThreshold[1], forceThreshold[2], forceThreshold[3], forceThreshold[4], forceThreshold[5]
+                                             ,m[0], m[1], m[2], m[3], m[4], m[5]
+                                             ,b[0], b[1], b[2], b[3], b[4], b[5]
+                                             ,k[0], k[1], k[2], k[3], k[4], k[5]
+                                             ,maxV, maxVA, maxW, maxWA])
         return error
 
     """2025.09.17"""
@@ -13586,16 +14492,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetToolCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetToolCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetToolCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13611,16 +14510,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetWObjCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWObjCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetWObjCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13636,16 +14528,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExToolCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExToolCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetExToolCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13661,16 +14546,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExAxisCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExAxisCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetExAxisCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13687,16 +14565,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTargetPayloadWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTargetPayloadWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("GetTargetPayloadWithID", id)
         error = _error[0]
         if error == 0:
             return error, _error[1], [_error[2], _error[3], _error[4]]
@@ -13711,12 +14582,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurToolCoord(self):
-        return 0, [self.robot_state_pkg.toolCoord[0],
-                   self.robot_state_pkg.toolCoord[1],
-                   self.robot_state_pkg.toolCoord[2],
-                   self.robot_state_pkg.toolCoord[3],
-                   self.robot_state_pkg.toolCoord[4],
-                   self.robot_state_pkg.toolCoord[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0, [pkg.toolCoord[0],
+                   pkg.toolCoord[1],
+                   pkg.toolCoord[2],
+                   pkg.toolCoord[3],
+                   pkg.toolCoord[4],
+                   pkg.toolCoord[5]]
 
     """
     @brief 获取当前工件坐标系
@@ -13727,12 +14599,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurWObjCoord(self):
-        return 0, [self.robot_state_pkg.wobjCoord[0],
-                   self.robot_state_pkg.wobjCoord[1],
-                   self.robot_state_pkg.wobjCoord[2],
-                   self.robot_state_pkg.wobjCoord[3],
-                   self.robot_state_pkg.wobjCoord[4],
-                   self.robot_state_pkg.wobjCoord[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0, [pkg.wobjCoord[0],
+                   pkg.wobjCoord[1],
+                   pkg.wobjCoord[2],
+                   pkg.wobjCoord[3],
+                   pkg.wobjCoord[4],
+                   pkg.wobjCoord[5]]
 
     """
     @brief 获取当前外部工具坐标系
@@ -13743,12 +14616,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurExToolCoord(self):
-        return 0, [self.robot_state_pkg.extoolCoord[0],
-                   self.robot_state_pkg.extoolCoord[1],
-                   self.robot_state_pkg.extoolCoord[2],
-                   self.robot_state_pkg.extoolCoord[3],
-                   self.robot_state_pkg.extoolCoord[4],
-                   self.robot_state_pkg.extoolCoord[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0, [pkg.extoolCoord[0],
+                   pkg.extoolCoord[1],
+                   pkg.extoolCoord[2],
+                   pkg.extoolCoord[3],
+                   pkg.extoolCoord[4],
+                   pkg.extoolCoord[5]]
 
     """
     @brief 获取当前扩展轴坐标系
@@ -13759,12 +14633,13 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurExAxisCoord(self):
-        return 0, [self.robot_state_pkg.exAxisCoord[0],
-                   self.robot_state_pkg.exAxisCoord[1],
-                   self.robot_state_pkg.exAxisCoord[2],
-                   self.robot_state_pkg.exAxisCoord[3],
-                   self.robot_state_pkg.exAxisCoord[4],
-                   self.robot_state_pkg.exAxisCoord[5]]
+        pkg = self.robot_state_snapshot.pkg
+        return 0, [pkg.exAxisCoord[0],
+                   pkg.exAxisCoord[1],
+                   pkg.exAxisCoord[2],
+                   pkg.exAxisCoord[3],
+                   pkg.exAxisCoord[4],
+                   pkg.exAxisCoord[5]]
 
     """2025.09.18"""
     """
@@ -13782,8 +14657,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def CustomWeaveSetPara(self, id, pointNum, point, stayTime, frequency, incStayType, stationary):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
         pointNum = int(pointNum)
         point = list(map(float, point))
@@ -13791,18 +14665,12 @@ class RPC():
         frequency = float(frequency)
         incStayType = int(incStayType)
         stationary = int(stationary)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.CustomWeaveSetPara([id, pointNum,
-                                                       point[0],point[1],point[2],point[3],point[4],point[5],point[6],point[7],point[8],point[9],
-                                                       point[10],point[11],point[12],point[13],point[14],point[15],point[16],point[17],point[18],point[19],
-                                                       point[20],point[21],point[22],point[23],point[24],point[25],point[26],point[27],point[28],point[29],
-                                                       stayTime[0],stayTime[1],stayTime[2],stayTime[3],stayTime[4],stayTime[5],stayTime[6],stayTime[7],stayTime[8],stayTime[9],
-                                                       frequency,incStayType,stationary])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("CustomWeaveSetPara", [id, pointNum,
+                                               point[0],point[1],point[2],point[3],point[4],point[5],point[6],point[7],point[8],point[9],
+                                               point[10],point[11],point[12],point[13],point[14],point[15],point[16],point[17],point[18],point[19],
+                                               point[20],point[21],point[22],point[23],point[24],point[25],point[26],point[27],point[28],point[29],
+                                               stayTime[0],stayTime[1],stayTime[2],stayTime[3],stayTime[4],stayTime[5],stayTime[6],stayTime[7],stayTime[8],stayTime[9],
+                                               frequency,incStayType,stationary])
         return error
 
     """
@@ -13820,16 +14688,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def CustomWeaveGetPara(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.CustomWeaveGetPara(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.call_robot("CustomWeaveGetPara", id)
         error = _error[0]
         if error == 0:
             paramStr = str(_error[1])
@@ -13869,7 +14730,7 @@ class RPC():
         errcode = self.__FileUpLoad(6, filePath)
         if errcode == 0:
             try:
-                result = self.robot.KernelUpgrade()
+                result = self.call_robot("KernelUpgrade")
                 if result is not None and hasattr(result, '__len__') and len(result) == 0:
                     # print("警告: 内核升级调用成功，但返回空数据")
                     return 0
@@ -13892,15 +14753,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetKernelUpgradeResult(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetKernelUpgradeResult()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetKernelUpgradeResult")
         error = _error[0]
         if error == 0:
             return error, _error[1]
@@ -13917,16 +14771,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityEnable(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.JointSensitivityEnable([status])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("JointSensitivityEnable", [status])
         return error
 
     """
@@ -13939,15 +14786,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityCalibration(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.JointSensitivityCalibration()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("JointSensitivityCalibration")
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]], [_error[7], _error[8], _error[9], _error[10], _error[11], _error[12]]
@@ -13961,15 +14801,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityCollect(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.JointSensitivityCollect()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("JointSensitivityCollect")
         return error
 
     """2025.10.15"""
@@ -13981,15 +14814,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MotionQueueClear(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MotionQueueClear()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("MotionQueueClear")
         return error
 
     """
@@ -14008,15 +14834,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlavePortErrCounter(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlavePortErrCounter()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetSlavePortErrCounter")
         error = _error[0]
         if error == 0:
             paramStr = str(_error[1])
@@ -14045,16 +14864,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SlavePortErrCounterClear(self, slaveID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         slaveID = int(slaveID)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SlavePortErrCounterClear(slaveID)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SlavePortErrCounterClear", slaveID)
         return error
 
     """
@@ -14066,16 +14878,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetVelFeedForwardRatio(self, radio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         radio = list(map(float,radio))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetVelFeedForwardRatio([radio[0],radio[1],radio[2],radio[3],radio[4],radio[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetVelFeedForwardRatio", [radio[0],radio[1],radio[2],radio[3],radio[4],radio[5]])
         return error
 
     """
@@ -14087,15 +14892,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetVelFeedForwardRatio(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetVelFeedForwardRatio()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("GetVelFeedForwardRatio")
         error = _error[0]
         if error == 0:
             return error, [float(_error[1]), float(_error[2]), float(_error[3]), float(_error[4]), float(_error[5]), float(_error[6])]
@@ -14109,15 +14907,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def RobotMCULogCollect(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.RobotMCULogCollect()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        error = self.call_robot("RobotMCULogCollect")
         return error
 
     """3.9.0"""
@@ -14147,8 +14938,7 @@ class RPC():
     def MoveToIntersectLineStart(self, mainPoint, piecePoint, tool, wobj, vel, acc, ovl, oacc, moveType,mainExaxisPos=[[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0]],
                                  pieceExaxisPos=[[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0]],extAxisFlag=0,
                                  exaxisPos=[0.0,0.0,0.0,0.0],moveDirection=0,offset=[0.0,0.0,0.0,0.0,0.0,0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mainPoint0 = list(map(float, mainPoint[0]))
         mainPoint1 = list(map(float, mainPoint[1]))
         mainPoint2 = list(map(float, mainPoint[2]))
@@ -14185,40 +14975,34 @@ class RPC():
         moveType = int(moveType)
         moveDirection = int(moveDirection)
         offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToIntersectLineStart([mainPoint0[0], mainPoint0[1], mainPoint0[2], mainPoint0[3], mainPoint0[4], mainPoint0[5],
-                                                             mainPoint1[0], mainPoint1[1], mainPoint1[2], mainPoint1[3], mainPoint1[4], mainPoint1[5],
-                                                             mainPoint2[0], mainPoint2[1], mainPoint2[2], mainPoint2[3], mainPoint2[4], mainPoint2[5],
-                                                             mainPoint3[0], mainPoint3[1], mainPoint3[2], mainPoint3[3], mainPoint3[4], mainPoint3[5],
-                                                             mainPoint4[0], mainPoint4[1], mainPoint4[2], mainPoint4[3], mainPoint4[4], mainPoint4[5],
-                                                             mainPoint5[0], mainPoint5[1], mainPoint5[2], mainPoint5[3], mainPoint5[4], mainPoint5[5],
-                                                             mainExaxisPos0[0], mainExaxisPos0[1], mainExaxisPos0[2], mainExaxisPos0[3],
-                                                             mainExaxisPos1[0], mainExaxisPos1[1], mainExaxisPos1[2], mainExaxisPos1[3],
-                                                             mainExaxisPos2[0], mainExaxisPos2[1], mainExaxisPos2[2], mainExaxisPos2[3],
-                                                             mainExaxisPos3[0], mainExaxisPos3[1], mainExaxisPos3[2], mainExaxisPos3[3],
-                                                             mainExaxisPos4[0], mainExaxisPos4[1], mainExaxisPos4[2], mainExaxisPos4[3],
-                                                             mainExaxisPos5[0], mainExaxisPos5[1], mainExaxisPos5[2], mainExaxisPos5[3],
-                                                             piecePoint0[0],piecePoint0[1],piecePoint0[2],piecePoint0[3],piecePoint0[4],piecePoint0[5],
-                                                             piecePoint1[0],piecePoint1[1],piecePoint1[2],piecePoint1[3],piecePoint1[4],piecePoint1[5],
-                                                             piecePoint2[0],piecePoint2[1],piecePoint2[2],piecePoint2[3],piecePoint2[4],piecePoint2[5],
-                                                             piecePoint3[0],piecePoint3[1],piecePoint3[2],piecePoint3[3],piecePoint3[4],piecePoint3[5],
-                                                             piecePoint4[0],piecePoint4[1],piecePoint4[2],piecePoint4[3],piecePoint4[4],piecePoint4[5],
-                                                             piecePoint5[0],piecePoint5[1],piecePoint5[2],piecePoint5[3],piecePoint5[4],piecePoint5[5],
-                                                             pieceExaxisPos0[0], pieceExaxisPos0[1], pieceExaxisPos0[2], pieceExaxisPos0[3],
-                                                             pieceExaxisPos1[0], pieceExaxisPos1[1], pieceExaxisPos1[2], pieceExaxisPos1[3],
-                                                             pieceExaxisPos2[0], pieceExaxisPos2[1], pieceExaxisPos2[2], pieceExaxisPos2[3],
-                                                             pieceExaxisPos3[0], pieceExaxisPos3[1], pieceExaxisPos3[2], pieceExaxisPos3[3],
-                                                             pieceExaxisPos4[0], pieceExaxisPos4[1], pieceExaxisPos4[2], pieceExaxisPos4[3],
-                                                             pieceExaxisPos5[0], pieceExaxisPos5[1], pieceExaxisPos5[2], pieceExaxisPos5[3],
-                                                             extAxisFlag,
-                                                             exaxisPos[0], exaxisPos[1], exaxisPos[2], exaxisPos[3],
-                                                             tool, wobj, vel, acc, ovl, oacc, moveType,moveDirection,
-                                                             offset[0],offset[1],offset[2],offset[3],offset[4],offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveToIntersectLineStart", [mainPoint0[0], mainPoint0[1], mainPoint0[2], mainPoint0[3], mainPoint0[4], mainPoint0[5],
+                                                     mainPoint1[0], mainPoint1[1], mainPoint1[2], mainPoint1[3], mainPoint1[4], mainPoint1[5],
+                                                     mainPoint2[0], mainPoint2[1], mainPoint2[2], mainPoint2[3], mainPoint2[4], mainPoint2[5],
+                                                     mainPoint3[0], mainPoint3[1], mainPoint3[2], mainPoint3[3], mainPoint3[4], mainPoint3[5],
+                                                     mainPoint4[0], mainPoint4[1], mainPoint4[2], mainPoint4[3], mainPoint4[4], mainPoint4[5],
+                                                     mainPoint5[0], mainPoint5[1], mainPoint5[2], mainPoint5[3], mainPoint5[4], mainPoint5[5],
+                                                     mainExaxisPos0[0], mainExaxisPos0[1], mainExaxisPos0[2], mainExaxisPos0[3],
+                                                     mainExaxisPos1[0], mainExaxisPos1[1], mainExaxisPos1[2], mainExaxisPos1[3],
+                                                     mainExaxisPos2[0], mainExaxisPos2[1], mainExaxisPos2[2], mainExaxisPos2[3],
+                                                     mainExaxisPos3[0], mainExaxisPos3[1], mainExaxisPos3[2], mainExaxisPos3[3],
+                                                     mainExaxisPos4[0], mainExaxisPos4[1], mainExaxisPos4[2], mainExaxisPos4[3],
+                                                     mainExaxisPos5[0], mainExaxisPos5[1], mainExaxisPos5[2], mainExaxisPos5[3],
+                                                     piecePoint0[0],piecePoint0[1],piecePoint0[2],piecePoint0[3],piecePoint0[4],piecePoint0[5],
+                                                     piecePoint1[0],piecePoint1[1],piecePoint1[2],piecePoint1[3],piecePoint1[4],piecePoint1[5],
+                                                     piecePoint2[0],piecePoint2[1],piecePoint2[2],piecePoint2[3],piecePoint2[4],piecePoint2[5],
+                                                     piecePoint3[0],piecePoint3[1],piecePoint3[2],piecePoint3[3],piecePoint3[4],piecePoint3[5],
+                                                     piecePoint4[0],piecePoint4[1],piecePoint4[2],piecePoint4[3],piecePoint4[4],piecePoint4[5],
+                                                     piecePoint5[0],piecePoint5[1],piecePoint5[2],piecePoint5[3],piecePoint5[4],piecePoint5[5],
+                                                     pieceExaxisPos0[0], pieceExaxisPos0[1], pieceExaxisPos0[2], pieceExaxisPos0[3],
+                                                     pieceExaxisPos1[0], pieceExaxisPos1[1], pieceExaxisPos1[2], pieceExaxisPos1[3],
+                                                     pieceExaxisPos2[0], pieceExaxisPos2[1], pieceExaxisPos2[2], pieceExaxisPos2[3],
+                                                     pieceExaxisPos3[0], pieceExaxisPos3[1], pieceExaxisPos3[2], pieceExaxisPos3[3],
+                                                     pieceExaxisPos4[0], pieceExaxisPos4[1], pieceExaxisPos4[2], pieceExaxisPos4[3],
+                                                     pieceExaxisPos5[0], pieceExaxisPos5[1], pieceExaxisPos5[2], pieceExaxisPos5[3],
+                                                     extAxisFlag,
+                                                     exaxisPos[0], exaxisPos[1], exaxisPos[2], exaxisPos[3],
+                                                     tool, wobj, vel, acc, ovl, oacc, moveType,moveDirection,
+                                                     offset[0],offset[1],offset[2],offset[3],offset[4],offset[5]])
         return error
 
     """
@@ -14246,8 +15030,7 @@ class RPC():
     def MoveIntersectLine(self, mainPoint, piecePoint, tool, wobj, vel, acc, ovl, oacc, moveDirection,mainExaxisPos=[[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0]],
                                  pieceExaxisPos=[[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0]],extAxisFlag=0,
                                  exaxisPos=[[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.0,0.0]],offset=[0.0,0.0,0.0,0.0,0.0,0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         mainPoint0 = list(map(float, mainPoint[0]))
         mainPoint1 = list(map(float, mainPoint[1]))
         mainPoint2 = list(map(float, mainPoint[2]))
@@ -14285,44 +15068,38 @@ class RPC():
         oacc = float(oacc)
         moveDirection = int(moveDirection)
         offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveIntersectLine(
-                    [mainPoint0[0], mainPoint0[1], mainPoint0[2], mainPoint0[3], mainPoint0[4], mainPoint0[5],
-                                                             mainPoint1[0], mainPoint1[1], mainPoint1[2], mainPoint1[3], mainPoint1[4], mainPoint1[5],
-                                                             mainPoint2[0], mainPoint2[1], mainPoint2[2], mainPoint2[3], mainPoint2[4], mainPoint2[5],
-                                                             mainPoint3[0], mainPoint3[1], mainPoint3[2], mainPoint3[3], mainPoint3[4], mainPoint3[5],
-                                                             mainPoint4[0], mainPoint4[1], mainPoint4[2], mainPoint4[3], mainPoint4[4], mainPoint4[5],
-                                                             mainPoint5[0], mainPoint5[1], mainPoint5[2], mainPoint5[3], mainPoint5[4], mainPoint5[5],
-                                                             mainExaxisPos0[0], mainExaxisPos0[1], mainExaxisPos0[2], mainExaxisPos0[3],
-                                                             mainExaxisPos1[0], mainExaxisPos1[1], mainExaxisPos1[2], mainExaxisPos1[3],
-                                                             mainExaxisPos2[0], mainExaxisPos2[1], mainExaxisPos2[2], mainExaxisPos2[3],
-                                                             mainExaxisPos3[0], mainExaxisPos3[1], mainExaxisPos3[2], mainExaxisPos3[3],
-                                                             mainExaxisPos4[0], mainExaxisPos4[1], mainExaxisPos4[2], mainExaxisPos4[3],
-                                                             mainExaxisPos5[0], mainExaxisPos5[1], mainExaxisPos5[2], mainExaxisPos5[3],
-                                                             piecePoint0[0],piecePoint0[1],piecePoint0[2],piecePoint0[3],piecePoint0[4],piecePoint0[5],
-                                                             piecePoint1[0],piecePoint1[1],piecePoint1[2],piecePoint1[3],piecePoint1[4],piecePoint1[5],
-                                                             piecePoint2[0],piecePoint2[1],piecePoint2[2],piecePoint2[3],piecePoint2[4],piecePoint2[5],
-                                                             piecePoint3[0],piecePoint3[1],piecePoint3[2],piecePoint3[3],piecePoint3[4],piecePoint3[5],
-                                                             piecePoint4[0],piecePoint4[1],piecePoint4[2],piecePoint4[3],piecePoint4[4],piecePoint4[5],
-                                                             piecePoint5[0],piecePoint5[1],piecePoint5[2],piecePoint5[3],piecePoint5[4],piecePoint5[5],
-                                                             pieceExaxisPos0[0], pieceExaxisPos0[1], pieceExaxisPos0[2], pieceExaxisPos0[3],
-                                                             pieceExaxisPos1[0], pieceExaxisPos1[1], pieceExaxisPos1[2], pieceExaxisPos1[3],
-                                                             pieceExaxisPos2[0], pieceExaxisPos2[1], pieceExaxisPos2[2], pieceExaxisPos2[3],
-                                                             pieceExaxisPos3[0], pieceExaxisPos3[1], pieceExaxisPos3[2], pieceExaxisPos3[3],
-                                                             pieceExaxisPos4[0], pieceExaxisPos4[1], pieceExaxisPos4[2], pieceExaxisPos4[3],
-                                                             pieceExaxisPos5[0], pieceExaxisPos5[1], pieceExaxisPos5[2], pieceExaxisPos5[3],
-                                                             extAxisFlag,
-                                                             exaxisPos0[0], exaxisPos0[1], exaxisPos0[2], exaxisPos0[3],
-                                                             exaxisPos1[0], exaxisPos1[1], exaxisPos1[2], exaxisPos1[3],
-                                                             exaxisPos2[0], exaxisPos2[1], exaxisPos2[2], exaxisPos2[3],
-                                                             exaxisPos3[0], exaxisPos3[1], exaxisPos3[2], exaxisPos3[3],
-                     tool, wobj, vel, acc, ovl, oacc, moveDirection,
-                                                             offset[0],offset[1],offset[2],offset[3],offset[4],offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("MoveIntersectLine", 
+            [mainPoint0[0], mainPoint0[1], mainPoint0[2], mainPoint0[3], mainPoint0[4], mainPoint0[5],
+                                                     mainPoint1[0], mainPoint1[1], mainPoint1[2], mainPoint1[3], mainPoint1[4], mainPoint1[5],
+                                                     mainPoint2[0], mainPoint2[1], mainPoint2[2], mainPoint2[3], mainPoint2[4], mainPoint2[5],
+                                                     mainPoint3[0], mainPoint3[1], mainPoint3[2], mainPoint3[3], mainPoint3[4], mainPoint3[5],
+                                                     mainPoint4[0], mainPoint4[1], mainPoint4[2], mainPoint4[3], mainPoint4[4], mainPoint4[5],
+                                                     mainPoint5[0], mainPoint5[1], mainPoint5[2], mainPoint5[3], mainPoint5[4], mainPoint5[5],
+                                                     mainExaxisPos0[0], mainExaxisPos0[1], mainExaxisPos0[2], mainExaxisPos0[3],
+                                                     mainExaxisPos1[0], mainExaxisPos1[1], mainExaxisPos1[2], mainExaxisPos1[3],
+                                                     mainExaxisPos2[0], mainExaxisPos2[1], mainExaxisPos2[2], mainExaxisPos2[3],
+                                                     mainExaxisPos3[0], mainExaxisPos3[1], mainExaxisPos3[2], mainExaxisPos3[3],
+                                                     mainExaxisPos4[0], mainExaxisPos4[1], mainExaxisPos4[2], mainExaxisPos4[3],
+                                                     mainExaxisPos5[0], mainExaxisPos5[1], mainExaxisPos5[2], mainExaxisPos5[3],
+                                                     piecePoint0[0],piecePoint0[1],piecePoint0[2],piecePoint0[3],piecePoint0[4],piecePoint0[5],
+                                                     piecePoint1[0],piecePoint1[1],piecePoint1[2],piecePoint1[3],piecePoint1[4],piecePoint1[5],
+                                                     piecePoint2[0],piecePoint2[1],piecePoint2[2],piecePoint2[3],piecePoint2[4],piecePoint2[5],
+                                                     piecePoint3[0],piecePoint3[1],piecePoint3[2],piecePoint3[3],piecePoint3[4],piecePoint3[5],
+                                                     piecePoint4[0],piecePoint4[1],piecePoint4[2],piecePoint4[3],piecePoint4[4],piecePoint4[5],
+                                                     piecePoint5[0],piecePoint5[1],piecePoint5[2],piecePoint5[3],piecePoint5[4],piecePoint5[5],
+                                                     pieceExaxisPos0[0], pieceExaxisPos0[1], pieceExaxisPos0[2], pieceExaxisPos0[3],
+                                                     pieceExaxisPos1[0], pieceExaxisPos1[1], pieceExaxisPos1[2], pieceExaxisPos1[3],
+                                                     pieceExaxisPos2[0], pieceExaxisPos2[1], pieceExaxisPos2[2], pieceExaxisPos2[3],
+                                                     pieceExaxisPos3[0], pieceExaxisPos3[1], pieceExaxisPos3[2], pieceExaxisPos3[3],
+                                                     pieceExaxisPos4[0], pieceExaxisPos4[1], pieceExaxisPos4[2], pieceExaxisPos4[3],
+                                                     pieceExaxisPos5[0], pieceExaxisPos5[1], pieceExaxisPos5[2], pieceExaxisPos5[3],
+                                                     extAxisFlag,
+                                                     exaxisPos0[0], exaxisPos0[1], exaxisPos0[2], exaxisPos0[3],
+                                                     exaxisPos1[0], exaxisPos1[1], exaxisPos1[2], exaxisPos1[3],
+                                                     exaxisPos2[0], exaxisPos2[1], exaxisPos2[2], exaxisPos2[3],
+                                                     exaxisPos3[0], exaxisPos3[1], exaxisPos3[2], exaxisPos3[3],
+             tool, wobj, vel, acc, ovl, oacc, moveDirection,
+                                                     offset[0],offset[1],offset[2],offset[3],offset[4],offset[5]])
         return error
 
     """3.9.0"""
@@ -14336,15 +15113,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointHysteresisError(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.JointHysteresisError()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("JointHysteresisError")
         error = _error[0]
         if error == 0:
             return error, [float(_error[1]), float(_error[2]), float(_error[3]), float(_error[4]), float(_error[5]), float(_error[6])]
@@ -14360,15 +15130,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointRepeatability(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.JointRepeatability()
-                flag = False
-            except socket.error as e:
-                flag = True
+        self.wait_connected()
+        _error = self.call_robot("JointRepeatability")
         error = _error[0]
         if error == 0:
             return error, [float(_error[1]), float(_error[2]), float(_error[3]), float(_error[4]), float(_error[5]), float(_error[6])]
@@ -14388,27 +15151,20 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAdmittanceParams(self, M, B, K, threshold, sensitivity, setZeroFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         M = list(map(float, M))
         B = list(map(float, B))
         K = list(map(float, K))
         threshold = list(map(float, threshold))
         sensitivity = list(map(float, sensitivity))
         setZeroFlag = int(setZeroFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAdmittanceParams(
-                    [M[0], M[1], M[2], M[3], M[4], M[5],
-                     B[0], B[1], B[2], B[3], B[4], B[5],
-                     K[0], K[1], K[2], K[3], K[4], K[5],
-                     threshold[0], threshold[1], threshold[2], threshold[3], threshold[4], threshold[5],
-                     sensitivity[0], sensitivity[1], sensitivity[2], sensitivity[3], sensitivity[4], sensitivity[5],
-                     setZeroFlag])
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.call_robot("SetAdmittanceParams", 
+            [M[0], M[1], M[2], M[3], M[4], M[5],
+             B[0], B[1], B[2], B[3], B[4], B[5],
+             K[0], K[1], K[2], K[3], K[4], K[5],
+             threshold[0], threshold[1], threshold[2], threshold[3], threshold[4], threshold[5],
+             sensitivity[0], sensitivity[1], sensitivity[2], sensitivity[3], sensitivity[4], sensitivity[5],
+             setZeroFlag])
         return error
 
     """3.9.1"""
@@ -14423,15 +15179,167 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SerCoderCompenParams(self, status, torqueCoeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
+        self.wait_connected()
         status = int(status)
         torqueCoeff = list(map(float, torqueCoeff))
-        flag = True
-        while flag:
+        error = self.call_robot("SerCoderCompenParams", [status,torqueCoeff[0],torqueCoeff[1],torqueCoeff[2],torqueCoeff[3],torqueCoeff[4],torqueCoeff[5]])
+        return error
+
+"""
+@brief  asyncio 版 SDK 接口，协程方法与 RPC 的 SDK 接口同名同参，由 RPC 的方法表自动生成
+@note   基于一个已连接的 RPC 实例，共用其 20004 状态数据、日志、调用轨迹、接口统计、区间追踪与重试策略；
+        指令经 RobotAsyncTransport 非阻塞发送，不占用线程，网络异常按 RPC 的 retry_policy 重试，不可重试或重试用尽时返回 ERR_SOCKET_COM_FAILED；
+        方法体按原样执行，遇到 XML-RPC 指令时挂起并异步发送，收到结果后经 RobotCallShadow 重放方法体，
+        重放时属性值与其他方法的调用结果沿用首次执行的记录，直至方法返回；
+        EXECUTOR_METHODS 中的接口，以及生成方法表时由 rpc_method_blocks 检出会休眠、读写文件、使用其他端口或阻塞等待的接口，
+        在线程池中调用 RPC 的同名接口
+        示例：robot = await AsyncRPC.create("192.168.58.2"); error = await robot.MoveJ(joint_pos, 1, 0)
+"""
+class AsyncRPC():
+    EXECUTOR_METHODS = frozenset([
+        "PauseMotion", "ResumeMotion", "StopMove", "ExtAxisStopJog", "ConveyorComDetectTrigger",
+        "PointTableDownLoad", "PointTableUpLoad", "PointTableUpdateLua", "LuaUpload", "AxleLuaUpload", "SoftwareUpgrade",
+        "SetJointFirmwareUpgrade", "SetCtrlFirmwareUpgrade", "SetEndFirmwareUpgrade", "SegmentWeldStart",
+        "ForceSensorAutoComputeLoad", "ExtAxisSyncMoveL", "RbLogDownload", "AllDataSourceDownload",
+        "DataPackageDownload", "ReplayRobotState", "StartRobotStateRecord", "StopRobotStateRecord", "StopLivenessMonitor",
+        "DumpCallTrace", "ExportSpanTrace", "CloseRPC"])
+    BLOCKING_NAMES = frozenset(["sleep", "socket", "create_connection", "recv", "sendall", "open", "wait", "join", "Popen"])
+
+    def __init__(self, rpc):
+        self.rpc = rpc
+        link = urllib.parse.urlsplit(rpc.robot.link)
+        self.transport = RobotAsyncTransport(link.hostname, link.port or 20003, rpc.robot.handler)
+
+    @classmethod
+    async def create(cls, ip="192.168.58.2"):
+        """在线程池中创建 RPC 实例(连接 20004 并探测 20003)，返回对应的 AsyncRPC"""
+        rpc = await asyncio.get_running_loop().run_in_executor(None, RPC, ip)
+        return cls(rpc)
+
+    async def call(self, name, raw, args, kwargs):
+        """执行 SDK 方法体，与 RPC.log_call 一样输出日志并写入调用轨迹、接口统计与区间追踪"""
+        rpc = self.rpc
+        if rpc.log_call_level is None:
+            return await self.run_body(raw, args, kwargs)
+        level = rpc.check_log_call_level()
+        if level is None:
+            return await self.run_body(raw, args, kwargs)
+        if level <= logging.INFO:
+            rpc.log_call_message(name, args, kwargs)
+        if not rpc.log_call_recording:
+            result = await self.run_body(raw, args, kwargs)
+            if level <= logging.ERROR:
+                rpc.log_call_result(name, level, result)
+            return result
+        start = time.time()
+        perf_start = time.perf_counter()
+        try:
+            result = await self.run_body(raw, args, kwargs)
+        except Exception:
+            rpc.record_call(name, args, kwargs, None, start, perf_start, exception=True)
+            raise
+        rpc.record_call(name, args, kwargs, result, start, perf_start, level)
+        return result
+
+    async def run_body(self, raw, args, kwargs):
+        """执行方法体，每截获一条指令异步发送一次，收到结果后重放方法体"""
+        if RPC.is_conect == False:
+            return RobotError.ERR_RPC_ERROR
+        timeout = None
+        if "rpc_timeout" in kwargs:
+            kwargs = dict(kwargs)
+            timeout = kwargs.pop("rpc_timeout")
+        if self.rpc.reconnect_flag and not await self.rpc.connection_gate.wait_async():
+            raise RobotConnectionError("robot %s reconnect not finished within %.1f s" % (self.rpc.ip_address, self.rpc.connection_gate.timeout))
+        replies = []
+        shadow = RobotCallShadow(self.rpc, RobotCallProxy(None, replies))
+        while True:
             try:
-                error = self.robot.SerCoderCompenParams([status,torqueCoeff[0],torqueCoeff[1],torqueCoeff[2],torqueCoeff[3],torqueCoeff[4],torqueCoeff[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
\ No newline at end of file
+                return raw(shadow, *args, **kwargs)
+            except RobotCallCaptured as captured:
+                try:
+                    replies.append(await self.request(captured.name, captured.params, timeout))
+                except RobotCallFailed:
+                    return RobotError.ERR_SOCKET_COM_FAILED
+            shadow.rewind(RobotCallProxy(None, replies))
+
+    async def request(self, name, params, timeout=None):
+        """异步发送一条指令，网络异常时按 RPC 的 retry_policy 退避重试，不可重试或重试用尽时记录日志并抛出 RobotCallFailed；
+        timeout 为 rpc_timeout，同时限制重试总时长"""
+        start = time.monotonic()
+        call_timeout = timeout or self.rpc.robot.call_timeout(name, params)
+        try:
+            return await self.transport.request(name, params, call_timeout)
+        except OSError as ex:
+            error = ex
+        try:
+            return await self.rpc.retry_policy.run_async(name, lambda: self.transport.request(name, params, call_timeout),
+                                                         error, timeout, start)
+        except OSError as ex:
+            self.rpc.log_error(f"{name} communication failed: {ex!r}")
+            raise RobotCallFailed(name, ex) from ex
+
+    async def call_executor(self, name, args, kwargs):
+        func = getattr(self.rpc, name)
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: func(*args, **kwargs))
+
+    async def WaitRobotState(self, condition, timeout=None):
+        return await self.rpc.WaitRobotStateAsync(condition, timeout)
+
+    async def CloseRPC(self):
+        self.transport.close()
+        return await self.call_executor("CloseRPC", (), {})
+
+
+def code_names(code):
+    """字节码引用的全部名称，包括其中的嵌套函数与 lambda"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= code_names(const)
+    return names
+
+
+def rpc_method_blocks(name, checked=None):
+    """
+    @brief  判断 RPC 方法体是否会阻塞事件循环：引用 BLOCKING_NAMES 中的名称(休眠、套接字、文件、线程等待)，
+            或调用了会阻塞的其他 RPC 方法；RobotCallShadow 替换掉的方法(指令发送、重连等待)不计
+    """
+    if checked is None:
+        checked = set()
+    checked.add(name)
+    func = vars(RPC).get(name)
+    if not callable(func):
+        return False
+    names = code_names(inspect.unwrap(func).__code__)
+    if names & AsyncRPC.BLOCKING_NAMES:
+        return True
+    for callee in names - checked:
+        if callee in vars(RPC) and callee not in vars(RobotCallShadow) and rpc_method_blocks(callee, checked):
+            return True
+    return False
+
+
+def make_async_method(name, func):
+    """由 RPC 的 SDK 接口生成 AsyncRPC 的同名协程方法"""
+    if name in AsyncRPC.EXECUTOR_METHODS or rpc_method_blocks(name):
+        async def method(self, *args, **kwargs):
+            return await self.call_executor(name, args, kwargs)
+    elif inspect.iscoroutinefunction(inspect.unwrap(func)):
+        async def method(self, *args, **kwargs):
+            return await getattr(self.rpc, name)(*args, **kwargs)
+    else:
+        raw = inspect.unwrap(func)
+
+        async def method(self, *args, **kwargs):
+            return await self.call(name, raw, args, kwargs)
+    method.__name__ = name
+    method.__qualname__ = "AsyncRPC." + name
+    method.__doc__ = func.__doc__
+    return method
+
+
+for name, func in list(vars(RPC).items()):
+    if name[:1].isupper() and callable(func) and name not in vars(AsyncRPC):
+        setattr(AsyncRPC, name, make_async_method(name, func))
+del name, func
@@ -0,0 +1,120 @@
+from fairino import Robot
+import logging
+import time
+from functools import wraps
+
+# Offline microbenchmark of the RPC.log_call decorator overhead, no robot needed.
+# Compares the previous decorator, which always formats the call message, against
+# the current one for a ServoJ-like call with the logger off, filtered and enabled,
+# and the cost of recording the call into the binary call trace or the method stats.
+
+LOOP_NUM = 200000
+
+
+def log_call_legacy(func):
+    """之前的 log_call 实现，每次调用都格式化参数"""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        args_str = ', '.join(map(repr, args))
+        kwargs_str = ', '.join([f"{key}={value}" for key, value in kwargs.items()])
+        if (kwargs_str) == "":
+            call_message = f"Calling {func.__name__}" + f"({args_str}" + ")."
+        else:
+            call_message = f"Calling {func.__name__}" + f"({args_str}" + "," + f"{kwargs_str})."
+
+        self.log_info(call_message)
+        result = func(self, *args, **kwargs)
+        if isinstance(result, (list, tuple)) and len(result) > 0:
+            if result[0] == 0:
+                self.log_debug(f"{func.__name__} returned: {result}.")
+            else:
+                self.log_error(f"{func.__name__} Error occurred. returned: {result}")
+        else:
+            if result == 0:
+                self.log_debug(f"{func.__name__} returned: {result}.")
+            else:
+                self.log_error(f"{func.__name__} Error occurred. returned: {result}")
+
+        return result
+
+    return wrapper
+
+
+def ServoJ(self, joint_pos, axisPos, acc=0.0, vel=0.0, cmdT=0.008, filterT=0.0, gain=0.0, id=0):
+    return 0
+
+
+def bench(func, rpc):
+    joint_pos = [10.5, -20.25, 30.0, -40.125, 50.0, 60.75]
+    axisPos = [0.0, 0.0, 0.0, 0.0]
+    start = time.perf_counter()
+    for i in range(LOOP_NUM):
+        func(rpc, joint_pos, axisPos, cmdT=0.008)
+    return (time.perf_counter() - start) / LOOP_NUM * 1e9
+
+
+def main():
+    logger = logging.getLogger("TestLogCallBench")
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+
+    rpc = Robot.RPC.__new__(Robot.RPC)
+    baseline = bench(ServoJ, rpc)
+    print("%-28s %8.0f ns/call" % ("undecorated", baseline))
+
+    for label, level in (("logger None", None), ("level ERROR", logging.ERROR), ("level DEBUG", logging.DEBUG)):
+        if level is None:
+            rpc.logger = None
+        else:
+            rpc.logger = logger
+            logger.setLevel(level)
+        rpc.refresh_log_call_level()
+        legacy = bench(log_call_legacy(ServoJ), rpc) - baseline
+        current = bench(Robot.RPC.log_call(ServoJ), rpc) - baseline
+        print("%-28s legacy %8.0f ns/call  current %8.0f ns/call" % (label, legacy, current))
+
+    rpc.logger = None
+    rpc.refresh_log_call_level()
+    rpc.EnableCallTrace(auto_dump=0)
+    current = bench(Robot.RPC.log_call(ServoJ), rpc) - baseline
+    print("%-28s %8.0f ns/call" % ("call trace, logger None", current))
+
+    rpc.DisableCallTrace()
+    rpc.EnableMethodStats()
+    current = bench(Robot.RPC.log_call(ServoJ), rpc) - baseline
+    print("%-28s %8.0f ns/call  %s" % ("method stats, logger None", current, rpc.stats()["ServoJ"]["latency_us"]))
+    rpc.EnableMethodStats(0)
+    check_direct_set_level(rpc, logger)
+
+
+class CountHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def check_direct_set_level(rpc, logger):
+    """不经 SetLoggerLevel、直接调用 logger.setLevel 修改等级后，log_call 在下一次调用时按新等级输出"""
+    handler = CountHandler()
+    logger.addHandler(handler)
+    rpc.logger = logger
+    logger.setLevel(logging.CRITICAL)
+    rpc.refresh_log_call_level()
+    func = Robot.RPC.log_call(ServoJ)
+    func(rpc, [0.0] * 6, [0.0] * 4)
+    assert handler.count == 0
+    logger.setLevel(logging.DEBUG)
+    func(rpc, [0.0] * 6, [0.0] * 4)
+    assert handler.count == 2, handler.count
+    logger.setLevel(logging.ERROR)
+    func(rpc, [0.0] * 6, [0.0] * 4)
+    assert handler.count == 2, handler.count
+    logger.removeHandler(handler)
+    print("check_direct_set_level OK")
+
+
+if __name__ == "__main__":
+    main()
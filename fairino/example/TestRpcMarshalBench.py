@@ -0,0 +1,74 @@
+from fairino import Robot
+import time
+import xmlrpc.client
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Offline benchmark of the 20003 request template encoder, no robot needed.
+# Compares template encoding against list(map(float, ...)) + xmlrpc.client.dumps,
+# and the single error code response fast path against xmlrpc.client.loads.
+
+LOOP_NUM = 20000
+
+
+class FakeResponse():
+    """只提供 parse_response 用到的接口的伪 HTTP 响应"""
+    def __init__(self, data):
+        self.data = data
+
+    def getheader(self, name, default=None):
+        return default
+
+    def read(self, amt=None):
+        return self.data
+
+
+def bench(label, func):
+    start = time.perf_counter()
+    for i in range(LOOP_NUM):
+        func()
+    cost = time.perf_counter() - start
+    print("%-44s %8.2f us/call" % (label, cost / LOOP_NUM * 1e6))
+
+
+def stdlib_servoj(joint_pos, axisPos):
+    params = (list(map(float, joint_pos)), list(map(float, axisPos)), 0.0, 0.0, 0.008, 0.0, 0.0, 0)
+    return xmlrpc.client.dumps(params, "ServoJ", encoding="utf-8").encode("utf-8", "xmlcharrefreplace")
+
+
+def main():
+    template = Robot.ROBOT_REQUEST_TEMPLATES["ServoJ"]
+    joint_list = [10.5, -20.25, 30.0, -40.125, 50.0, 60.75]
+    axis_list = [0.0, 0.0, 0.0, 0.0]
+    inputs = [("list", joint_list, axis_list)]
+    if np is not None:
+        inputs.append(("numpy", np.array(joint_list), np.zeros(4)))
+
+    for name, joint_pos, axisPos in inputs:
+        params = (joint_pos, axisPos, 0.0, 0.0, 0.008, 0.0, 0.0, 0)
+        assert xmlrpc.client.loads(template.encode(params)) == xmlrpc.client.loads(stdlib_servoj(joint_pos, axisPos))
+        bench("ServoJ encode %-5s xmlrpc.client.dumps" % name, lambda: stdlib_servoj(joint_pos, axisPos))
+        bench("ServoJ encode %-5s RobotRequestTemplate" % name, lambda: template.encode(params))
+
+    movel = Robot.ROBOT_REQUEST_TEMPLATES["MoveL"]
+    movel_params = ([float(i) for i in range(12)] + [1, 0, 20.0, 0.0, 100.0, -1.0, 0, 0.0, 0.0, 0.0, 0.0, 0, 0] +
+                    [0.0] * 6 + [100.0, 0],)
+    bench("MoveL  encode list  xmlrpc.client.dumps", lambda: xmlrpc.client.dumps(movel_params, "MoveL"))
+    bench("MoveL  encode list  RobotRequestTemplate", lambda: movel.encode(movel_params))
+
+    transport = Robot.RobotTransport()
+    response = xmlrpc.client.dumps((0,), methodresponse=True).encode("utf-8")
+    assert transport.parse_response(FakeResponse(response)) == xmlrpc.client.loads(response)[0]
+    bench("error code decode   xmlrpc.client.loads", lambda: xmlrpc.client.loads(response))
+    bench("error code decode   RobotTransport", lambda: transport.parse_response(FakeResponse(response)))
+
+    response = xmlrpc.client.dumps(([0] + joint_list,), methodresponse=True).encode("utf-8")
+    bench("array decode        xmlrpc.client.loads", lambda: xmlrpc.client.loads(response))
+    bench("array decode        RobotTransport", lambda: transport.parse_response(FakeResponse(response)))
+
+
+if __name__ == "__main__":
+    main()
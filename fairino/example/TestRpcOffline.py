@@ -0,0 +1,298 @@
+from fairino import Robot
+import asyncio
+import logging
+import threading
+import time
+import types
+import xmlrpc.client
+from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+from socketserver import ThreadingMixIn
+
+# Offline checks of the 20003 connection pool against a local XML-RPC server, no robot needed.
+# Run from the repository root: PYTHONPATH=. python fairino/example/TestRpcOffline.py
+
+
+class FakeRequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        # drop 不为 0 时先正常响应 pass_num 个请求，之后读完请求直接断开连接，模拟网络异常
+        self.server.request_num += 1
+        if self.server.drop and self.server.pass_num:
+            self.server.pass_num -= 1
+        elif self.server.drop:
+            self.server.drop -= 1
+            body = self.rfile.read(int(self.headers["content-length"]))
+            self.server.dropped.append(xmlrpc.client.loads(body)[1])
+            self.close_connection = True
+            return
+        super().do_POST()
+
+
+class FakeController(ThreadingMixIn, SimpleXMLRPCServer):
+    """在本机端口上模拟控制器 20003 指令接口，MoveJ 阻塞 move_time 秒"""
+    daemon_threads = True
+
+    def __init__(self, move_time=1.0, multicall=False):
+        super().__init__(("127.0.0.1", 0), requestHandler=FakeRequestHandler, logRequests=False)
+        self.calls = []
+        self.dropped = []
+        self.drop = 0
+        self.pass_num = 0
+        self.request_num = 0
+        if multicall:
+            self.register_multicall_functions()
+        self.register_function(lambda *params: self.record("MoveJ", move_time), "MoveJ")
+        self.register_function(lambda *params: self.record("StopMotion", 0), "StopMotion")
+        self.register_function(lambda *params: self.record("SetDO", 0), "SetDO")
+        self.register_function(lambda *params: [self.record("GetTCPOffset", 0), 0.0, 0.0, 100.0, 0.0, 0.0, 0.0],
+                               "GetTCPOffset")
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def record(self, name, delay):
+        self.calls.append(name)
+        time.sleep(delay)
+        return 0
+
+    @property
+    def link(self):
+        return "http://127.0.0.1:%d" % self.server_address[1]
+
+
+def make_rpc(controller):
+    """构造指令连接指向 FakeController、不连接 20004 状态端口的 RPC"""
+    rpc = Robot.RPC.__new__(Robot.RPC)
+    rpc.ip_address = "127.0.0.1"
+    rpc.robot = Robot.RobotConnectionPool(controller.link)
+    rpc.transport = rpc.robot.command_transport
+    rpc.multicall_supported = None
+    rpc.retry_policy = Robot.RobotRetryPolicy()
+    rpc.connection_gate = Robot.RobotConnectionGate()
+    rpc.state_read_cache = Robot.RobotStateReadCache()
+    rpc.robot_state_snapshot = Robot.RobotStateSnapshot(Robot.RobotStatePkg(), 0, 0.0, 0)
+    return rpc
+
+
+def check_stop_not_blocked():
+    """阻塞运动占用指令连接时，停止指令经紧急连接立即完成"""
+    controller = FakeController(move_time=1.0)
+    pool = Robot.RobotConnectionPool(controller.link)
+    mover = threading.Thread(target=lambda: pool.MoveJ([0.0] * 6, 1, 0))
+    mover.start()
+    while "MoveJ" not in controller.calls:
+        time.sleep(0.001)
+    assert pool.command_lock.locked()
+    start = time.perf_counter()
+    assert pool.StopMotion() == 0
+    cost = time.perf_counter() - start
+    assert cost < 0.5, cost
+    mover.join()
+
+    # 指令连接的锁被其他线程持有时停止指令也不等待
+    with pool.command_lock:
+        assert pool.StopMotion() == 0
+    assert pool.SetDO(0, 1) == 0
+    pool.close()
+    controller.shutdown()
+    print("check_stop_not_blocked OK, StopMotion %.1f ms during MoveJ" % (cost * 1000))
+
+
+def check_retry_policy():
+    """查询与白名单中的设置指令网络异常后重试，运动指令不重试并返回错误码，重试总时长不超过 deadline"""
+    controller = FakeController(move_time=0)
+    rpc = make_rpc(controller)
+    assert rpc.SetRpcRetryPolicy(base_delay=0.01, max_delay=0.05, deadline=0.5) == 0
+
+    # 传输层对断开的长连接重发一次，drop=4 时 SDK 层需要重试两次
+    controller.drop = 4
+    assert rpc.GetTCPOffset() == (0, [0.0, 0.0, 100.0, 0.0, 0.0, 0.0])
+    assert controller.dropped.count("GetTCPOffset") == 4
+    controller.drop = 2
+    assert rpc.SetDO(0, 1) == 0
+    assert controller.calls.count("SetDO") == 1
+
+    controller.drop = 2
+    assert rpc.MoveJ([0.0] * 6, 1, 0, desc_pos=[1.0] * 6) == Robot.RobotError.ERR_SOCKET_COM_FAILED
+    assert controller.dropped.count("MoveJ") == 2 and "MoveJ" not in controller.calls
+
+    controller.drop = 10 ** 6
+    start = time.perf_counter()
+    assert rpc.GetTCPOffset() == Robot.RobotError.ERR_SOCKET_COM_FAILED
+    cost = time.perf_counter() - start
+    assert 0.4 < cost < 0.7, cost
+    controller.drop = 0
+
+    summary = rpc.retry_policy.summary()
+    assert summary["recovered_num"] == 2 and summary["not_retried_num"] == 1 and summary["exhausted_num"] == 1, summary
+    assert summary["method_retry_num"]["GetTCPOffset"] >= 3 and summary["method_retry_num"]["SetDO"] == 1, summary
+    rpc.robot.close()
+    controller.shutdown()
+    print("check_retry_policy OK, exhausted after %.2f s with deadline 0.5 s" % cost)
+
+
+def check_rpc_timeout():
+    """rpc_timeout 同时限制重试总时长；力控查询与设置使用默认超时，只有阻塞的力控搜索与插入使用长超时"""
+    controller = FakeController(move_time=0)
+    rpc = make_rpc(controller)
+    assert rpc.SetRpcRetryPolicy(base_delay=0.01, max_delay=0.05, deadline=3.0) == 0
+    controller.drop = 10 ** 6
+    start = time.perf_counter()
+    assert rpc.GetTCPOffset(rpc_timeout=0.2) == Robot.RobotError.ERR_SOCKET_COM_FAILED
+    cost = time.perf_counter() - start
+    assert cost < 0.5, cost
+    controller.drop = 0
+
+    pool = rpc.robot
+    assert pool.call_timeout("FT_GetForceTorqueRCS") == pool.timeout
+    assert pool.call_timeout("FT_GetConfig") == pool.timeout
+    assert pool.call_timeout("FT_SetRCS") == pool.timeout
+    assert pool.call_timeout("FT_SpiralSearch") == pool.long_timeout
+    assert pool.call_timeout("FT_FindSurface") == pool.long_timeout
+    pool.close()
+    controller.shutdown()
+    print("check_rpc_timeout OK, rpc_timeout=0.2 failed after %.2f s" % cost)
+
+
+def check_template_coercion():
+    """定长数值指令的参数在编码时转换为 float/int，非法参数在发送前抛出异常"""
+    controller = FakeController(move_time=0)
+    rpc = make_rpc(controller)
+    for joint_pos in ([None] * 6, ["1</double>"] * 6):
+        try:
+            rpc.MoveJ(joint_pos, 1, 0, desc_pos=[1.0] * 6)
+        except (TypeError, ValueError):
+            pass
+        else:
+            raise AssertionError("MoveJ accepted %r" % joint_pos)
+    assert controller.calls == [] and controller.dropped == []
+    body = Robot.encode_robot_request("MoveJ", ([True] * 6, [1] * 6, 1.0, 0, 20, 0, 100, [0] * 4, -1, 0, [0.0] * 6))
+    params = xmlrpc.client.loads(body)[0]
+    assert params[0] == [1.0] * 6 and params[2:4] == (1, 0) and params[4] == 20.0
+    assert rpc.MoveJ([0.0] * 6, 1, 0, desc_pos=[1.0] * 6) == 0
+    rpc.robot.close()
+    controller.shutdown()
+    print("check_template_coercion OK")
+
+
+def run_batch(rpc, multicall=None):
+    with rpc.batch(multicall) as batch:
+        batch.SetDO(0, 1)
+        batch.SetDO(1, 1)
+        batch.GetTCPOffset()
+    return batch
+
+
+def check_batch():
+    """批处理经 system.multicall 或流水线发送；已发出未收到响应的调用标记为结果未知，未发出的调用返回通信失败"""
+    offset = (0, [0.0, 0.0, 100.0, 0.0, 0.0, 0.0])
+    unknown = Robot.RobotError.ERR_RPC_OUTCOME_UNKNOWN
+
+    controller = FakeController(move_time=0, multicall=True)
+    rpc = make_rpc(controller)
+    batch = run_batch(rpc)
+    assert batch.results == [0, 0, offset] and batch.unknown == [], batch.results
+    assert rpc.multicall_supported is True and controller.request_num == 1
+    assert controller.calls == ["SetDO", "SetDO", "GetTCPOffset"]
+    # multicall 请求及传输层的重发都被断开，控制器可能已执行
+    controller.drop = 2
+    batch = run_batch(rpc)
+    assert batch.results == [unknown] * 3 and batch.unknown == [0, 1, 2], batch.results
+    rpc.robot.close()
+    controller.shutdown()
+
+    controller = FakeController(move_time=0, multicall=False)
+    rpc = make_rpc(controller)
+    batch = run_batch(rpc)
+    assert batch.results == [0, 0, offset] and batch.unknown == [], batch.results
+    # 一次探测 multicall 收到 Fault，之后三条指令流水线发送
+    assert rpc.multicall_supported is False and controller.request_num == 4
+    # 第一条响应后断开，后两条已写出但未收到响应
+    controller.pass_num = 1
+    controller.drop = 1
+    batch = run_batch(rpc)
+    assert batch.results == [0, unknown, unknown] and batch.unknown == [1, 2], batch.results
+    controller.drop = 0
+    rpc.robot.close()
+    controller.shutdown()
+    controller.server_close()
+
+    # 控制器端口已关闭，连接未建立，确定没有指令发出
+    batch = run_batch(rpc)
+    assert batch.results == [Robot.RobotError.ERR_SOCKET_COM_FAILED] * 3 and batch.unknown == [], batch.results
+    rpc.robot.close()
+    print("check_batch OK")
+
+
+class CountHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def check_async():
+    """AsyncRPC 调用与同步接口一样写日志、接口统计与调用轨迹，按重试策略重试，方法体的状态读取与 GetSafetyCode 只执行一次"""
+    controller = FakeController(move_time=0)
+    rpc = make_rpc(controller)
+    rpc.SetRpcRetryPolicy(base_delay=0.01, max_delay=0.05, deadline=0.5)
+    logger = logging.getLogger("TestRpcOfflineAsync")
+    logger.propagate = False
+    handler = CountHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    rpc.logger = logger
+    rpc.EnableMethodStats()
+    rpc.EnableCallTrace(auto_dump=0)
+    safety_calls = []
+
+    def GetSafetyCode(self):
+        safety_calls.append(1)
+        return 0
+    rpc.GetSafetyCode = types.MethodType(GetSafetyCode, rpc)
+
+    async def run():
+        robot = Robot.AsyncRPC(rpc)
+        assert await robot.SetDO(0, 1) == 0
+        assert await robot.SetDO(1, 1, rpc_timeout=1.0) == 0
+        controller.drop = 2
+        assert await robot.GetTCPOffset(max_age=0.5) == (0, [0.0, 0.0, 100.0, 0.0, 0.0, 0.0])
+        controller.drop = 2
+        assert await robot.MoveJ([0.0] * 6, 1, 0, desc_pos=[1.0] * 6) == Robot.RobotError.ERR_SOCKET_COM_FAILED
+        assert await robot.MoveJ([0.0] * 6, 1, 0, desc_pos=[1.0] * 6) == 0
+        robot.transport.close()
+
+    assert rpc.SetDO(0, 0) == 0
+    asyncio.run(run())
+
+    stats = rpc.stats()
+    assert stats["SetDO"]["call_num"] == 3 and stats["GetTCPOffset"]["call_num"] == 1, stats
+    assert stats["MoveJ"]["call_num"] == 2 and stats["MoveJ"]["error_num"] == 1, stats
+    names = [record[0] for record in rpc.call_trace.records()]
+    assert names.count("SetDO") == 3 and names.count("MoveJ") == 2, names
+    assert sum(message.startswith("Calling SetDO") for message in handler.messages) == 3
+    assert any(message.startswith("MoveJ Error occurred") for message in handler.messages)
+    # 重试恢复的查询与不可重试的运动指令
+    summary = rpc.retry_policy.summary()
+    assert summary["method_retry_num"].get("GetTCPOffset") == 1 and summary["not_retried_num"] == 1, summary
+    assert controller.dropped.count("MoveJ") == 2 and controller.calls.count("MoveJ") == 1
+    # 每个方法体收到结果后重放，状态读缓存的未命中与 GetSafetyCode 仍只计一次
+    assert rpc.state_read_cache.summary()["method_miss_num"] == {"GetTCPOffset": 1}
+    assert len(safety_calls) == 2, safety_calls
+    rpc.robot.close()
+    controller.shutdown()
+    print("check_async OK")
+
+
+def main():
+    check_stop_not_blocked()
+    check_retry_policy()
+    check_rpc_timeout()
+    check_template_coercion()
+    check_batch()
+    check_async()
+
+
+if __name__ == "__main__":
+    main()
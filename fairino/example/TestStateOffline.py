@@ -0,0 +1,124 @@
+from fairino import Robot
+import struct
+from ctypes import sizeof
+
+# Offline checks of the 20004 state pipeline, no robot needed.
+# Run from the repository root: PYTHONPATH=. python fairino/example/TestStateOffline.py
+
+
+def make_frame(frame_cnt, extra=b""):
+    """构造一帧带校验和的状态数据，extra 为追加在 RobotStatePkg 之后的字节(模拟更长的新版本帧)"""
+    pkg = Robot.RobotStatePkg()
+    pkg.frame_head = 0x5A5A
+    pkg.frame_cnt = frame_cnt & 0xFF
+    for i in range(6):
+        pkg.jt_cur_pos[i] = 10.0 * i + frame_cnt * 0.001
+    frame = bytearray(bytes(pkg)[:-2]) + extra
+    frame[3:5] = struct.pack("<H", len(frame) - 5)
+    return bytes(frame + struct.pack("<H", sum(frame) & 0xFFFF))
+
+
+def make_rpc():
+    """构造不连接控制器的 RPC，只初始化状态发布流程用到的成员"""
+    rpc = Robot.RPC.__new__(Robot.RPC)
+    rpc.robot_state_pkg = Robot.RobotStatePkg()
+    rpc.robot_state_snapshot = Robot.RobotStateSnapshot(Robot.RobotStatePkg(), 0, 0.0, 0)
+    rpc.robot_state_history = None
+    rpc.robot_state_events = Robot.RobotStateEventDispatcher()
+    rpc.robot_state_publisher = None
+    rpc.robot_state_recorder = None
+    rpc.robot_state_projection = None
+    rpc.robot_state_projected = None
+    rpc.robot_state_stats = Robot.RobotStateStats()
+    rpc.state_read_cache = Robot.RobotStateReadCache()
+    return rpc
+
+
+def check_projection():
+    """投影只影响 GetRobotStateProjected，快照与状态包接口仍读取完整状态包"""
+    rpc = make_rpc()
+    assert rpc.SetRobotStateProjection(["jt_cur_pos"]) == 0
+    parser = Robot.RobotStateParser(stats=rpc.robot_state_stats)
+    rpc.handle_robot_state_data(parser, make_frame(0) + make_frame(1), 1.0)
+    assert rpc.robot_state_snapshot.seq == 2 and rpc.robot_state_snapshot.frame_cnt == 1
+    assert isinstance(rpc.robot_state_pkg, Robot.RobotStatePkg)
+    assert rpc.GetSafetyCode() == 0
+    error, joint_pos = rpc.GetActualJointPosDegree()
+    assert error == 0 and abs(joint_pos[5] - 50.001) < 1e-9
+    error, projected = rpc.GetRobotStateProjected()
+    assert error == 0 and projected.frame_cnt == 1 and abs(projected.jt_cur_pos[5] - 50.001) < 1e-9
+    assert rpc.robot_state_stats.lost_frame_num == 0
+    print("check_projection OK")
+
+
+def check_checksum_error():
+    """校验失败只把 robot_state_pkg 换成关节位置清零的副本，快照、读缓存与事件仍基于最后一帧有效数据"""
+    rpc = make_rpc()
+    parser = Robot.RobotStateParser(stats=rpc.robot_state_stats)
+    rpc.handle_robot_state_data(parser, make_frame(0), 1.0)
+    bad = bytearray(make_frame(1))
+    bad[-1] ^= 0xFF
+    rpc.handle_robot_state_data(parser, bytes(bad), 2.0)
+    assert rpc.robot_state_snapshot.seq == 1 and rpc.robot_state_snapshot.recv_time == 1.0
+    assert rpc.robot_state_pkg.jt_cur_pos[0] == 0 and rpc.robot_state_pkg.jt_cur_pos[5] == 50.0
+    error, joint_pos = rpc.GetActualJointPosDegree()
+    assert error == 0 and joint_pos[1] == 10.0
+    # 最新有效帧的 recv_time 为 1.0，早已超过 max_age，状态包接口应回退到 20003 查询
+    assert rpc.state_read_cache.packet(rpc.robot_state_snapshot, "GetActualJointPosDegree", 0.5) is None
+    assert rpc.state_read_cache.summary()["method_miss_num"] == {"GetActualJointPosDegree": 1}
+    print("check_checksum_error OK")
+
+
+def check_decode_mixed_length():
+    """帧长不一致的拼接数据不能走整体解码，应经解析器逐帧解出全部帧"""
+    if Robot.np is None:
+        print("check_decode_mixed_length skipped, numpy not installed")
+        return
+    pkg_size = sizeof(Robot.RobotStatePkg)
+    uniform = b"".join(make_frame(i) for i in range(8))
+    columns = Robot.decode_robot_state(uniform, ["frame_cnt", "jt_cur_pos"])
+    assert list(columns["frame_cnt"]) == list(range(8))
+
+    # 一帧短 4 字节、一帧长 4 字节，总长仍是 pkg_size 的整数倍
+    short = bytearray(make_frame(1)[:-6])
+    short[3:5] = struct.pack("<H", len(short) - 5)
+    short = bytes(short + struct.pack("<H", sum(short) & 0xFFFF))
+    blob = make_frame(0) + short + make_frame(2, b"\x00" * 4) + make_frame(3)
+    assert len(blob) % pkg_size == 0
+    columns = Robot.decode_robot_state(blob, ["frame_cnt", "jt_cur_pos"])
+    assert list(columns["frame_cnt"]) == [0, 1, 2, 3], columns["frame_cnt"]
+    assert abs(columns["jt_cur_pos"][3][5] - 50.003) < 1e-9
+    print("check_decode_mixed_length OK")
+
+
+def check_history_copy():
+    """m 条记录的零拷贝切片在其后 capacity-m 帧内不变，之后被覆盖；copy=True 的结果不随新帧改变"""
+    if Robot.np is None:
+        print("check_history_copy skipped, numpy not installed")
+        return
+    history = Robot.RobotStateHistory(4)
+    for seq in range(1, 4):
+        history.append(Robot.RobotStatePkg(), float(seq), seq)
+    view = history.latest()
+    kept = history.latest(copy=True)
+    window = history.window(10.0, now=3.0, copy=True)
+    assert list(view["seq"]) == [1, 2, 3] and list(window["seq"]) == [1, 2, 3]
+    history.append(Robot.RobotStatePkg(), 4.0, 4)
+    assert list(view["seq"]) == [1, 2, 3]
+    for seq in range(5, 8):
+        history.append(Robot.RobotStatePkg(), float(seq), seq)
+    assert list(view["seq"]) == [5, 6, 7]
+    assert list(kept["seq"]) == [1, 2, 3] and list(window["seq"]) == [1, 2, 3]
+    assert list(history.since(6, copy=True)["seq"]) == [6, 7]
+    print("check_history_copy OK")
+
+
+def main():
+    check_decode_mixed_length()
+    check_projection()
+    check_checksum_error()
+    check_history_copy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from fairino import Robot
+import threading
+import time
+from ctypes import sizeof
+
+# Offline throughput benchmark of the 20004 realtime state parser, no robot needed.
+# Compares the byte-by-byte legacy loop against the memoryview/bytes.find parser.
+
+FRAME_NUM = 2000
+
+
+def make_frame(frame_cnt):
+    """构造一帧带校验和的状态数据"""
+    pkg = Robot.RobotStatePkg()
+    pkg.frame_head = 0x5A5A
+    pkg.frame_cnt = frame_cnt & 0xFF
+    pkg.data_len = sizeof(Robot.RobotStatePkg) - 7
+    for i in range(6):
+        pkg.jt_cur_pos[i] = 10.0 * i + frame_cnt * 0.001
+        pkg.jt_cur_tor[i] = 0.5 * i
+    raw = bytearray(bytes(pkg))
+    pkg.check_sum = sum(raw[:-2]) & 0xFFFF
+    return bytes(pkg)
+
+
+class FakeSocket():
+    """按预先切好的数据块回放的伪socket"""
+    def __init__(self, rpc, chunks):
+        self.rpc = rpc
+        self.chunks = chunks
+        self.index = 0
+
+    def recv_into(self, buf):
+        chunk = self.chunks[self.index]
+        self.index += 1
+        if self.index == len(self.chunks):
+            self.rpc.stop_event.set()
+            self.rpc.closeRPC_state = True
+        buf[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        pass
+
+
+def run(routine_name, chunks):
+    rpc = Robot.RPC.__new__(Robot.RPC)
+    rpc.stop_event = threading.Event()
+    rpc.closeRPC_state = False
+    rpc.robot_realstate_exit = False
+    rpc.robot_state_pkg = Robot.RobotStatePkg
+    rpc.robot_state_snapshot = Robot.RobotStateSnapshot(Robot.RobotStatePkg(), 0, 0.0, 0)
+    rpc.robot_state_history = None
+    rpc.robot_state_events = Robot.RobotStateEventDispatcher()
+    rpc.robot_state_publisher = None
+    rpc.robot_state_recorder = None
+    rpc.robot_state_projection = None
+    rpc.robot_state_stats = Robot.RobotStateStats()
+    rpc.sock_cli_state = FakeSocket(rpc, chunks)
+    start = time.perf_counter()
+    getattr(rpc, routine_name)()
+    cost = time.perf_counter() - start
+    return cost, rpc.robot_state_pkg
+
+
+def main():
+    frames = [make_frame(i) for i in range(FRAME_NUM)]
+    one_frame_chunks = frames
+    stream = b"".join(frames)
+    big_chunks = [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+
+    for name, chunks in (("1 frame/recv", one_frame_chunks), ("4096 B/recv", big_chunks)):
+        for routine in ("robot_state_routine_thread_legacy", "robot_state_routine_thread"):
+            cost, pkg = run(routine, chunks)
+            print("%-14s %-36s %8.1f frames/s  %8.1f us/frame  last frame_cnt=%d" %
+                  (name, routine, FRAME_NUM / cost, cost / FRAME_NUM * 1e6, pkg.frame_cnt))
+
+    parser = Robot.RobotStateParser()
+    start = time.perf_counter()
+    for chunk in big_chunks:
+        parser.feed(chunk)
+    cost = time.perf_counter() - start
+    print("RobotStateParser.feed only: %.1f us/frame, frames=%d, checksum errors=%d" %
+          (cost / FRAME_NUM * 1e6, parser.frame_num, parser.checksum_error_num))
+
+
+if __name__ == "__main__":
+    main()